@@ -0,0 +1,388 @@
+"""
+* Name:         api_server.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Embeddable local HTTP/JSON API over Scheduler, Users, & CategoryHealth, built on standard library
+*               ThreadingHTTPServer. Endpoints: GET /tasks/next, GET /tasks (due range & filters), GET /tasks/<id>,
+*               GET /health, GET /overdue, GET /users/<name>/tasks, POST /tasks (one or many tasks), &
+*               POST /tasks/complete (many tasks, by ID or description). HTTP/1.1 keep-alive lets clients reuse
+*               one connection, & every response carries ETag from scheduler's version counter & date, so GET w/
+*               matching If-None-Match answered 304 w/o building response.
+* Input:        HTTP requests w/ JSON bodies & query parameters.
+* Output:       JSON responses; scheduler, users, & category health updated by POST requests.
+* BigO:         O(1) for conditional hits, next task, & task by ID, O(k) to complete k tasks by ID, O(n) for range,
+*               health, & batch requests over n tasks.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import argparse
+import json
+import logging
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from frequency import to_date
+from reports import ScheduleReports
+from task_store import normalize_record
+
+logger = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    """
+    Request error reported to client w/ HTTP status.
+    """
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def task_due_date(task):
+    """
+    :return: date or None - Task's due date, or None if it isn't valid date.
+    """
+    try:
+        return to_date(task.due_date)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_bool(value):
+    return value.strip().lower() in ('1', 'true', 'yes')
+
+
+class SchedulerApi:
+    """
+    API operations independent of HTTP. Every operation runs under one lock, through dispatch if given, so
+    requests on server threads never interleave w/ each other.
+    """
+    def __init__(self, scheduler, users=None, category_health=None, categories=None, dispatch=None):
+        """
+        :param scheduler: Scheduler - Scheduler served.
+        :param users: dict - User name -> User, defaults none.
+        :param category_health: CategoryHealth - Updated w/ health statuses computed for /health, optional.
+        :param categories: iterable of str - Categories reported by /health, defaults every category seen.
+        :param dispatch: callable - Runs zero-argument function & returns its result, e.g. on thread owning tasks;
+                                    defaults calling it directly.
+        """
+        self.scheduler = scheduler
+        self.users = users if users is not None else {}
+        self.category_health = category_health
+        self.reports = ScheduleReports(scheduler, categories)  # Health & overdue memoized per category version
+        self.dispatch = dispatch or (lambda function: function())
+        self.lock = threading.RLock()
+
+    def etag(self):
+        """
+        :return: str - Entity tag for current scheduler version & date (overdue counts change daily).
+        """
+        return f'"{self.scheduler.version}-{date.today().isoformat()}"'
+
+    def call(self, operation, *args, if_none_match=None):
+        """
+        Runs operation, skipping it when client's ETag still current.
+
+        :param operation: callable - Operation returning (status, payload).
+        :param if_none_match: str - Client's If-None-Match header, for GET requests.
+        :return: tuple - (status, payload or None for 304, ETag after operation).
+        """
+        with self.lock:
+            def run():
+                etag = self.etag()
+                if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(',')):
+                    return 304, None, etag
+                status, payload = operation(*args)
+                return status, payload, self.etag()
+            return self.dispatch(run)
+
+    # Read operations
+
+    def next_task(self, query):
+        """
+        :param query: dict - 'ready' selects next task w/ all prerequisites completed.
+        :return: tuple - (200, {'task': record or None}).
+        """
+        ready = parse_bool(query.get('ready', ''))
+        task = self.scheduler.get_next_ready_task() if ready else self.scheduler.get_next_task()
+        return 200, {'task': task.to_dict() if task else None}
+
+    def tasks(self, query):
+        """
+        Lists tasks in scheduler order, optionally limited to due range, category, & completion.
+
+        :param query: dict - 'start' & 'end' dates (inclusive), 'category', 'completed', & 'limit'.
+        :return: tuple - (200, {'tasks': records}).
+        """
+        try:
+            start = to_date(query['start']) if 'start' in query else None
+            end = to_date(query['end']) if 'end' in query else None
+            limit = int(query['limit']) if 'limit' in query else None
+        except ValueError as error:
+            raise ApiError(400, str(error))
+        category = query.get('category')
+        completed = parse_bool(query['completed']) if 'completed' in query else None
+        records = []
+        for task in self.scheduler.get_all_tasks():
+            if limit is not None and len(records) >= limit:
+                break
+            if category is not None and task.category != category:
+                continue
+            if completed is not None and bool(task.is_completed) != completed:
+                continue
+            if start or end:
+                due_date = task_due_date(task)
+                if due_date is None or (start and due_date < start) or (end and due_date > end):
+                    continue
+            records.append(task.to_dict())
+        return 200, {'tasks': records}
+
+    def health(self, query):
+        """
+        :return: tuple - (200, {'health': category -> health status}).
+        """
+        statuses = self.reports.health_statuses()
+        if self.category_health is not None:
+            for category, status in statuses.items():
+                self.category_health.set_health_status(category, status)
+        return 200, {'health': {category: round(status, 1) for category, status in statuses.items()}}
+
+    def overdue(self, query):
+        """
+        :param query: dict - 'today' report date, defaults today.
+        :return: tuple - (200, {'today': date, 'overdue': category -> open tasks due before today}).
+        """
+        try:
+            today = to_date(query.get('today') or date.today())
+        except ValueError as error:
+            raise ApiError(400, str(error))
+        return 200, {'today': today.isoformat(), 'overdue': self.reports.overdue_counts(today)}
+
+    def user_tasks(self, name):
+        """
+        :return: tuple - (200, {'user': name, 'tasks': records}).
+        """
+        user = self.users.get(name)
+        if user is None:
+            raise ApiError(404, f"No user named {name}")
+        return 200, {'user': name, 'tasks': [task.to_dict() for task in user.get_task_list()]}
+
+    def task(self, task_id):
+        """
+        :return: tuple - (200, {'task': record}).
+        """
+        task = self.scheduler.get_task(task_id)
+        if task is None:
+            raise ApiError(404, f"No task w/ ID {task_id}")
+        return 200, {'task': task.to_dict()}
+
+    # Write operations
+
+    def add_tasks(self, body):
+        """
+        Adds one task record, list of records, or {'tasks': records}; record's optional 'user' assigns task.
+
+        :return: tuple - (201, {'tasks': added records}).
+        :raises ApiError: 409 if record's 'id' already used by scheduled task or earlier record in batch.
+        """
+        from task import Task  # Imported here so module importable w/o Qt until tasks created
+
+        records = body.get('tasks') if isinstance(body, dict) and 'tasks' in body else body
+        records = records if isinstance(records, list) else [records]
+        try:
+            records = [normalize_record(record) for record in records]
+            for record in records:
+                if 'user' in record and record['user'] not in self.users:
+                    raise ApiError(404, f"No user named {record['user']}")
+            tasks = [Task.from_dict({key: value for key, value in record.items() if key != 'user'})
+                     for record in records]
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            raise ApiError(400, f"Invalid task record: {error}")
+        try:
+            self.scheduler.schedule_tasks(tasks)  # Sorted once for whole batch, & nothing added if any ID taken
+        except ValueError as error:
+            raise ApiError(409, str(error))
+        for record, task in zip(records, tasks):
+            if 'user' in record:
+                self.users[record['user']].add_task(task)
+        return 201, {'tasks': [task.to_dict() for task in tasks]}
+
+    def complete_tasks(self, body):
+        """
+        Completes tasks named by ID or description in list or {'tasks': references}. IDs looked up directly;
+        scheduler scanned only if some references aren't IDs.
+
+        :return: tuple - (200, {'completed': records, 'missing': references not found}).
+        """
+        references = body.get('tasks') if isinstance(body, dict) else body
+        if not isinstance(references, list) or not all(isinstance(reference, str) for reference in references):
+            raise ApiError(400, "Expected list of task IDs or descriptions")
+        references = list(dict.fromkeys(references))  # Each reference once, in request order
+        found = {reference: self.scheduler.get_task(reference) for reference in references}
+        wanted = {reference for reference, task in found.items() if task is None}
+        if wanted:
+            for task in self.scheduler.get_all_tasks():
+                if task.description in wanted and found[task.description] is None:
+                    found[task.description] = task
+        completed = []
+        for reference in references:
+            task = found[reference]
+            if task is not None:
+                self.scheduler.task_completed(task)
+                task.task_updated.emit()
+                completed.append(task.to_dict())
+        return 200, {'completed': completed, 'missing': [reference for reference in references
+                                                          if found[reference] is None]}
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """
+    Routes requests to server's SchedulerApi. HTTP/1.1 w/ Content-Length on every response keeps connections open.
+    """
+    protocol_version = 'HTTP/1.1'
+    server_version = 'HomeMaintenanceScheduler/1.0'
+
+    GET_ROUTES = {'/tasks/next': SchedulerApi.next_task, '/tasks': SchedulerApi.tasks, '/health': SchedulerApi.health,
+                  '/overdue': SchedulerApi.overdue}
+    POST_ROUTES = {'/tasks': SchedulerApi.add_tasks, '/tasks/complete': SchedulerApi.complete_tasks}
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        api = self.server.api
+        path = url.path.rstrip('/') or '/'
+        parts = path.split('/')
+        if path in self.GET_ROUTES:
+            operation, args = self.GET_ROUTES[path], (api, query)
+        elif len(parts) == 4 and parts[1] == 'users' and parts[3] == 'tasks':
+            operation, args = SchedulerApi.user_tasks, (api, unquote(parts[2]))
+        elif len(parts) == 3 and parts[1] == 'tasks':
+            operation, args = SchedulerApi.task, (api, unquote(parts[2]))
+        else:
+            self.send_json(404, {'error': f"Unknown path {url.path}"})
+            return
+        self.respond(operation, args, self.headers.get('If-None-Match'))
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            self.close_connection = True  # Body can't be skipped w/o its length, so connection not reusable
+            self.send_json(400, {'error': f"Invalid Content-Length: {self.headers.get('Content-Length')}"})
+            return
+        body = self.rfile.read(length)  # Always read so connection reusable
+        operation = self.POST_ROUTES.get(url.path.rstrip('/'))
+        if operation is None:
+            self.send_json(404, {'error': f"Unknown path {url.path}"})
+            return
+        try:
+            body = json.loads(body or b'null')
+        except ValueError as error:
+            self.send_json(400, {'error': f"Invalid JSON: {error}"})
+            return
+        self.respond(operation, (self.server.api, body))
+
+    def respond(self, operation, args, if_none_match=None):
+        try:
+            status, payload, etag = self.server.api.call(operation, *args, if_none_match=if_none_match)
+        except ApiError as error:
+            self.send_json(error.status, {'error': str(error)})
+            return
+        self.send_json(status, payload, etag)
+
+    def send_json(self, status, payload, etag=None):
+        body = b'' if payload is None else json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')  # Clients revalidate w/ If-None-Match every time
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class ApiServer:
+    """
+    ThreadingHTTPServer serving SchedulerApi, started on background thread so it can be embedded in application.
+    """
+    def __init__(self, api, host='127.0.0.1', port=8765):
+        """
+        :param api: SchedulerApi - Operations served.
+        :param host: str - Interface to listen on, defaults local only.
+        :param port: int - Port, 0 picks free port.
+        """
+        self.httpd = ThreadingHTTPServer((host, port), ApiRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = api
+        self._thread = None
+
+    @property
+    def address(self):
+        """
+        :return: tuple - (host, port) server listening on.
+        """
+        return self.httpd.server_address[:2]
+
+    def start(self):
+        """
+        Serves requests on daemon thread.
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='api-server', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops serving & closes listening socket.
+        """
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+
+def main(argv=None):
+    from scheduler import Scheduler
+    from task import load_tasks, save_tasks
+
+    parser = argparse.ArgumentParser(description="Serve scheduler over local HTTP/JSON API.")
+    parser.add_argument('-f', '--file', default='tasks.json', help="Task file, defaults tasks.json.")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to listen on, defaults 127.0.0.1.")
+    parser.add_argument('--port', type=int, default=8765, help="Port, defaults 8765.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    scheduler = Scheduler()
+    scheduler.schedule_tasks(load_tasks(args.file))
+    loaded_version = scheduler.version
+    server = ApiServer(SchedulerApi(scheduler), args.host, args.port)
+    logger.info("Serving %d tasks on http://%s:%d", len(scheduler.tasks), *server.address)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        if scheduler.version != loaded_version:
+            save_tasks(scheduler.tasks, args.file)  # Keeps changes made through API
+
+
+if __name__ == "__main__":
+    main()
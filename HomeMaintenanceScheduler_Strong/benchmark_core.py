@@ -0,0 +1,243 @@
+"""
+* Name:         benchmark_core.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Benchmark suite for core modules at scale, using only standard library. Times Scheduler
+*               schedule_task/remove_task/get_next_task, save_tasks/load_tasks, Task.complete_task, & per-category
+*               health computation at 1k to 1M tasks, reporting throughput & peak traced memory (tracemalloc).
+*               Results compared against stored baseline file; slower throughput or higher memory than tolerance
+*               allows fails run w/ exit status 1, & missing baseline fails it w/ exit status 2 so check can't pass
+*               silently. --update-baseline records current results as new baseline.
+* Input:        Command line options: sizes, benchmarks, ops per benchmark, tolerance, baseline & output files.
+* Output:       JSON report w/ ops/sec & peak KiB per benchmark & size, plus list of regressions.
+* BigO:         Dominated by benchmarks themselves, O(n) to O(k * n) per size for k ops.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+from category_health import compute_health_statuses
+from scheduler import Scheduler
+from synthetic_data import SyntheticDataGenerator
+from task import Task, save_tasks, load_tasks
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+DEFAULT_BASELINE = 'benchmark_baseline.json'
+CATEGORIES = ('HVAC', 'Plumbing', 'Electrical', 'Appliances', 'Safety Equipment',
+              'Exterior', 'Interior', 'Lawn and Garden', 'Pest Control', 'Seasonal')
+
+
+def make_tasks(size, seed=0):
+    """
+    Creates reproducible tasks from SyntheticDataGenerator, so benchmarks run on same data as rest of tooling.
+
+    :param size: int - # of tasks.
+    :param seed: int - Dataset seed; task IDs built from it, so tasks from different seeds never collide.
+    :return: list of Task - Tasks in creation order.
+    """
+    return [Task.from_dict(record) for record in SyntheticDataGenerator(seed).iter_records(limit=size)]
+
+
+def make_scheduler(size, seed=0):
+    scheduler = Scheduler()
+    scheduler.schedule_tasks(make_tasks(size, seed))
+    return scheduler
+
+
+# Each benchmark sets up its data, then returns (# of operations, seconds spent in timed section)
+
+def bench_schedule_task(size, ops, directory):
+    scheduler = make_scheduler(size)
+    new_tasks = make_tasks(ops, seed=1)
+    start = perf_counter()
+    for task in new_tasks:
+        scheduler.schedule_task(task)
+    return ops, perf_counter() - start
+
+
+def bench_remove_task(size, ops, directory):
+    scheduler = make_scheduler(size)
+    doomed = random.Random(2).sample(scheduler.tasks, min(ops, size))
+    start = perf_counter()
+    for task in doomed:
+        scheduler.remove_task(task)
+    return len(doomed), perf_counter() - start
+
+
+def bench_get_next_task(size, ops, directory):
+    scheduler = make_scheduler(size)
+    start = perf_counter()
+    for _ in range(ops):
+        scheduler.get_next_task()
+    return ops, perf_counter() - start
+
+
+def bench_complete_task(size, ops, directory):
+    tasks = make_tasks(size)
+    start = perf_counter()
+    for task in tasks[:ops]:
+        task.complete_task()
+    return min(ops, size), perf_counter() - start
+
+
+def bench_save_tasks(size, ops, directory):
+    tasks = make_tasks(size)
+    filename = os.path.join(directory, 'save.json')
+    start = perf_counter()
+    save_tasks(tasks, filename)
+    return size, perf_counter() - start
+
+
+def bench_load_tasks(size, ops, directory):
+    filename = os.path.join(directory, 'load.json')
+    save_tasks(make_tasks(size), filename)
+    start = perf_counter()
+    load_tasks(filename)
+    return size, perf_counter() - start
+
+
+def bench_health(size, ops, directory):
+    tasks = make_tasks(size)
+    start = perf_counter()
+    compute_health_statuses(tasks, CATEGORIES)
+    return size, perf_counter() - start
+
+
+BENCHMARKS = {
+    'scheduler.schedule_task': bench_schedule_task,
+    'scheduler.remove_task': bench_remove_task,
+    'scheduler.get_next_task': bench_get_next_task,
+    'task.complete_task': bench_complete_task,
+    'task.save_tasks': bench_save_tasks,
+    'task.load_tasks': bench_load_tasks,
+    'category_health.compute_health_statuses': bench_health,
+}
+
+
+def run_benchmark(benchmark, size, ops, directory, memory=True):
+    """
+    Runs benchmark once for throughput, then, if memory requested, again under tracemalloc for peak memory so
+    tracing overhead doesn't distort timing.
+
+    :return: dict - ops, seconds, ops_per_sec, & peak_kib (None if memory not measured).
+    """
+    gc.collect()
+    operations, seconds = benchmark(size, ops, directory)
+    result = {'ops': operations, 'seconds': round(seconds, 6),
+              'ops_per_sec': round(operations / seconds, 1) if seconds else None, 'peak_kib': None}
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            benchmark(size, ops, directory)
+            result['peak_kib'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """
+    Finds benchmarks slower or larger than baseline by more than tolerance.
+
+    :param results: dict - Size -> benchmark -> result.
+    :param baseline: dict - Same shape, from baseline file.
+    :param tolerance: float - Allowed fractional slowdown or memory growth, e.g. 0.25.
+    :return: list of str - Regression descriptions; empty if none.
+    """
+    regressions = []
+    for size, benchmarks in results.items():
+        for name, result in benchmarks.items():
+            expected = baseline.get(size, {}).get(name)
+            if not expected:
+                continue
+            if expected.get('ops_per_sec') and result['ops_per_sec'] is not None \
+                    and result['ops_per_sec'] < expected['ops_per_sec'] * (1 - tolerance):
+                regressions.append(f"{name} @ {size}: {result['ops_per_sec']} ops/sec, "
+                                   f"baseline {expected['ops_per_sec']}")
+            if expected.get('peak_kib') and result['peak_kib'] is not None \
+                    and result['peak_kib'] > expected['peak_kib'] * (1 + tolerance):
+                regressions.append(f"{name} @ {size}: {result['peak_kib']} KiB peak, baseline {expected['peak_kib']}")
+    return regressions
+
+
+def run(sizes=DEFAULT_SIZES, names=None, ops=100, memory=True, log=None):
+    """
+    Runs selected benchmarks at each size.
+
+    :param sizes: iterable of int - Task counts.
+    :param names: iterable of str - Benchmark names, defaults all.
+    :param ops: int - Operations per per-task benchmark.
+    :param memory: bool - Measures peak traced memory, defaults True.
+    :param log: file - Progress lines written here if given, e.g. sys.stderr.
+    :return: dict - Size (str) -> benchmark name -> result.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            results[str(size)] = {}
+            for name in names or BENCHMARKS:
+                result = run_benchmark(BENCHMARKS[name], size, ops, directory, memory)
+                results[str(size)][name] = result
+                if log:
+                    print(f"{name} @ {size}: {result['ops_per_sec']} ops/sec, {result['peak_kib']} KiB",
+                          file=log, flush=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark core scheduler, persistence, & health code.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="Task counts.")
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), help="Benchmarks to run.")
+    parser.add_argument('--ops', type=int, default=100, help="Operations per per-task benchmark.")
+    parser.add_argument('--no-memory', action='store_true', help="Skip tracemalloc peak memory pass.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline file to compare against.")
+    parser.add_argument('--update-baseline', action='store_true', help="Write results as new baseline.")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed fractional regression.")
+    parser.add_argument('--output', help="Report file; printed to stdout if omitted.")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.benchmarks, args.ops, not args.no_memory, log=sys.stderr)
+    report = {'python': platform.python_version(), 'platform': platform.platform(), 'results': results,
+              'regressions': []}
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=4)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            report['regressions'] = compare(results, json.load(file), args.tolerance)
+    else:
+        print(f"error: no baseline at {args.baseline}; run w/ --update-baseline to record one.", file=sys.stderr)
+        return 2
+
+    text = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text)
+    else:
+        print(text)
+    for regression in report['regressions']:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if report['regressions'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
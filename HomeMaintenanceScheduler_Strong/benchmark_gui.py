@@ -0,0 +1,177 @@
+"""
+* Name:         benchmark_gui.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Headless benchmark harness for dashboard's hot paths. Runs MainWindow under Qt's offscreen platform
+*               against synthetic task files (1k/10k/100k tasks by default) & times startup to first paint, task
+*               table refresh, single checkbox toggle, & bulk add. Tasks files written to temporary directory & windows
+*               never save on close, so real tasks.json never touched.
+* Input:        Command line options: task set sizes, repeats, bulk add size, seed, & output file.
+* Output:       JSON report w/ min/median/max milliseconds per operation & size, optionally w/ instrumentation spans.
+* BigO:         O(r * n) for r repeats over n tasks.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from datetime import date
+from time import perf_counter
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')  # Must be set before QApplication created
+
+import PySide6
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from instrumentation import instrumentation
+from main_gui import MainWindow
+from synthetic_data import SyntheticDataGenerator
+from task import Task
+from task_table_model import TaskTableModel
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+
+def synthetic_records(size, seed=0, start=None):
+    """
+    Generates reproducible task records w/ SyntheticDataGenerator, so GUI & core benchmarks share one data set.
+
+    :param size: int - # of records.
+    :param seed: int - Dataset seed; task IDs built from it, so records from different seeds never collide.
+    :param start: date - Reference date due dates placed around, defaults today.
+    :return: list of dict - Task records in to_dict format.
+    """
+    return list(SyntheticDataGenerator(seed, start or date.today()).iter_records(limit=size))
+
+
+def summarize(samples):
+    """
+    :param samples: list of float - Durations in seconds.
+    :return: dict - min, median, & max in milliseconds.
+    """
+    return {'min_ms': round(min(samples) * 1000, 3),
+            'median_ms': round(statistics.median(samples) * 1000, 3),
+            'max_ms': round(max(samples) * 1000, 3)}
+
+
+def open_window(tasks_file):
+    """
+    Creates & shows window for tasks file & processes events until first paint done.
+    """
+    window = MainWindow(tasks_file=tasks_file, save_on_close=False)
+    window.show()
+    QApplication.processEvents()
+    return window
+
+
+def close_window(window):
+    window.close()
+    window.deleteLater()
+    QApplication.processEvents()
+
+
+def benchmark_size(size, repeat, bulk_size, seed, directory):
+    """
+    Times each operation repeat times against task set of given size.
+
+    :return: dict - Operation name -> summary.
+    """
+    tasks_file = os.path.join(directory, f'tasks_{size}.json')
+    with open(tasks_file, 'w') as file:
+        json.dump(synthetic_records(size, seed), file)
+
+    startup = []
+    for _ in range(repeat):
+        start = perf_counter()
+        window = open_window(tasks_file)
+        startup.append(perf_counter() - start)
+        close_window(window)
+
+    window = open_window(tasks_file)
+    dashboard = window.dashboard_view
+    refresh, toggle, bulk_add = [], [], []
+    for attempt in range(repeat):
+        start = perf_counter()
+        dashboard.refresh_task_table(window.tasks)
+        QApplication.processEvents()
+        refresh.append(perf_counter() - start)
+
+        index = dashboard.task_model.index(0, TaskTableModel.COMPLETED_COLUMN)
+        checked = Qt.Unchecked if dashboard.task_model.task_at(0).is_completed else Qt.Checked
+        start = perf_counter()
+        dashboard.task_model.setData(index, checked, Qt.CheckStateRole)
+        window.refresh_coalescer.flush()
+        QApplication.processEvents()
+        toggle.append(perf_counter() - start)
+
+        new_tasks = [Task.from_dict(data) for data in synthetic_records(bulk_size, seed + attempt + 1)]
+        start = perf_counter()
+        window.add_loaded_tasks(new_tasks)
+        window.refresh_coalescer.flush()
+        QApplication.processEvents()
+        bulk_add.append(perf_counter() - start)
+    close_window(window)
+
+    return {'startup': summarize(startup), 'refresh_task_table': summarize(refresh),
+            'checkbox_toggle': summarize(toggle), f'bulk_add_{bulk_size}': summarize(bulk_add)}
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3, bulk_size=1000, seed=0, spans=False):
+    """
+    Runs benchmark for each size.
+
+    :param sizes: iterable of int - Task set sizes.
+    :param repeat: int - Repeats per operation.
+    :param bulk_size: int - # of tasks added per bulk add.
+    :param seed: int - Random seed for synthetic tasks.
+    :param spans: bool - Includes instrumentation span summary per size.
+    :return: dict - Machine-readable report.
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    report = {'platform': app.platformName(), 'python': platform.python_version(),
+              'pyside6': PySide6.__version__, 'repeat': repeat, 'results': {}}
+    instrumentation.enabled = spans
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            instrumentation.reset()
+            result = benchmark_size(size, repeat, bulk_size, seed, directory)
+            if spans:
+                result['spans'] = instrumentation.summary()['spans']
+            report['results'][str(size)] = result
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Home Maintenance Scheduler GUI headlessly.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="Task set sizes.")
+    parser.add_argument('--repeat', type=int, default=3, help="Repeats per operation.")
+    parser.add_argument('--bulk-size', type=int, default=1000, help="Tasks added per bulk add.")
+    parser.add_argument('--seed', type=int, default=0, help="Dataset seed for synthetic tasks.")
+    parser.add_argument('--spans', action='store_true', help="Include instrumentation spans in report.")
+    parser.add_argument('--output', help="Report file; printed to stdout if omitted.")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.repeat, args.bulk_size, args.seed, args.spans)
+    text = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,11 @@
 * IDE:          PyCharm CE
 * Language:     Python
 *
-* Description:  Manages health status tracking for maintenance categories. Supports setting & retrieving statuses.
+* Description:  Manages health status tracking for maintenance categories. Supports setting & retrieving statuses,
+*               & computing statuses from tasks' completion in single pass.
 * Input:        Category name & health status values for updates.
 * Output:       Returns health status values; raises exceptions for invalid operations.
-* BigO:         O(1) for get & set operations due to dictionary access.
+* BigO:         O(1) for get & set operations due to dictionary access, O(n) to compute statuses from n tasks.
 *
 * Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
 *                   modified or unmodified. I have not given other fellow student(s) access to my program.
@@ -62,3 +63,55 @@ class CategoryHealth:
         if not isinstance(category, str):
             raise TypeError("Category name must be a string.")
         return self.health_statuses.get(category, None)
+
+
+def count_completion(tasks, categories=None):
+    """
+    Counts completed & total tasks per category in single pass.
+
+    Args:
+        tasks (iterable): Task objects w/ category & is_completed attributes.
+        categories (iterable, optional): Categories to count; defaults every category seen.
+
+    Returns:
+        dict: Category -> [completed count, total count].
+    """
+    counts = {category: [0, 0] for category in categories} if categories is not None else {}
+    restricted = categories is not None
+    for task in tasks:
+        entry = counts.get(task.category)
+        if entry is None:
+            if restricted:
+                continue
+            entry = counts[task.category] = [0, 0]
+        entry[1] += 1
+        if task.is_completed:
+            entry[0] += 1
+    return counts
+
+
+def compute_health_statuses(tasks, categories=None):
+    """
+    Computes health status of each category as percentage of its tasks completed.
+
+    Args:
+        tasks (iterable): Task objects w/ category & is_completed attributes.
+        categories (iterable, optional): Categories to compute; defaults every category seen.
+
+    Returns:
+        dict: Category -> health status from 0 to 100; 0 for categories w/o tasks.
+    """
+    return health_from_counts(count_completion(tasks, categories))
+
+
+def health_from_counts(counts):
+    """
+    Converts completion counts to health statuses.
+
+    Args:
+        counts (dict): Category -> [completed count, total count], e.g. from count_completion.
+
+    Returns:
+        dict: Category -> health status from 0 to 100; 0 for categories w/o tasks.
+    """
+    return {category: (completed / total) * 100 if total else 0 for category, (completed, total) in counts.items()}
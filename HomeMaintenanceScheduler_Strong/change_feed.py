@@ -0,0 +1,302 @@
+"""
+* Name:         change_feed.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Change feed letting other local processes follow task changes. Task additions, changes, & removals
+*               turned into sequenced events keyed by task ID (updates carry only changed fields) & appended in
+*               batches to compact JSON Lines log, w/ sparse index file of (sequence #, byte offset) every few
+*               hundred events. Readers resume after any sequence # by seeking through index & receive events in
+*               batches, either once (read) or by tailing log as it grows (follow). Torn last line from crash
+*               trimmed on reopen.
+* Input:        Task changes from application; sequence # to resume after from consumers.
+* Output:       Append-only event log & index file; batches of event dicts for consumers.
+* BigO:         O(k) to append k events; O(log(n / i) + i + b) to read batch of b events after any of n events w/
+*               index interval i.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from bisect import bisect_right
+
+FIELDS = ('description', 'due_date', 'category', 'frequency', 'priority', 'is_completed')
+
+
+def index_path(path):
+    """
+    :return: str - Index file kept next to log file.
+    """
+    return path + '.idx'
+
+
+def read_index(path):
+    """
+    Reads sparse index of log file.
+
+    :param path: str - Log file.
+    :return: list of tuple - (sequence #, byte offset of that event's line), ascending; empty if no index.
+    """
+    try:
+        with open(index_path(path)) as file:
+            return [tuple(int(value) for value in line.split()) for line in file if line.endswith('\n')]
+    except FileNotFoundError:
+        return []
+
+
+def encode_event(event):
+    return (json.dumps(event, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+class ChangeFeedWriter:
+    """
+    Appends event batches to log file, assigning consecutive sequence #s starting at 1.
+    """
+    def __init__(self, path, index_every=256, fsync=False):
+        """
+        :param path: str - Log file; created if missing, continued if present.
+        :param index_every: int - Events between index entries.
+        :param fsync: bool - Forces each batch to disk before returning, defaults False.
+        """
+        self.path = path
+        self.index_every = index_every
+        self.fsync = fsync
+        self._file = open(path, 'ab+')
+        self.last_seq, self._offset = self._recover()
+        self._index = open(index_path(path), 'a')
+
+    def _recover(self):
+        """
+        Finds last sequence # by scanning from last index entry, trimming incomplete line left by crash.
+
+        :return: tuple - (last sequence #, log size in bytes).
+        """
+        entries = read_index(self.path)
+        last_seq, offset = (entries[-1][0] - 1, entries[-1][1]) if entries else (0, 0)
+        self._file.seek(offset)
+        for line in self._file:
+            if not line.endswith(b'\n'):
+                break
+            last_seq = json.loads(line)['seq']
+            offset += len(line)
+        self._file.truncate(offset)
+        return last_seq, offset
+
+    def append(self, events):
+        """
+        Writes batch of events w/ single write & flush.
+
+        :param events: iterable of tuple - (op, key, fields) where op is 'add', 'update', or 'remove', key
+                                           identifies task, & fields is dict of field values (None for remove).
+        :return: int - Sequence # of last event written.
+        """
+        lines = []
+        index = []
+        timestamp = round(time.time(), 3)
+        for op, key, fields in events:
+            self.last_seq += 1
+            event = {'seq': self.last_seq, 'time': timestamp, 'op': op, 'key': key}
+            if fields:
+                event['fields'] = fields
+            line = encode_event(event)
+            if (self.last_seq - 1) % self.index_every == 0:
+                index.append(f"{self.last_seq} {self._offset}\n")
+            lines.append(line)
+            self._offset += len(line)
+        if not lines:
+            return self.last_seq
+        self._file.write(b''.join(lines))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        if index:
+            self._index.write(''.join(index))  # Written after log so indexed lines always complete
+            self._index.flush()
+        return self.last_seq
+
+    def close(self):
+        self._file.close()
+        self._index.close()
+
+
+class ChangeFeedReader:
+    """
+    Reads events after given sequence # from log file written by ChangeFeedWriter.
+    """
+    def __init__(self, path):
+        """
+        :param path: str - Log file.
+        """
+        self.path = path
+
+    def seek_offset(self, seq):
+        """
+        :param seq: int - Sequence # wanted.
+        :return: int - Byte offset of latest indexed event at or before seq.
+        """
+        entries = read_index(self.path)
+        position = bisect_right(entries, (seq, float('inf'))) - 1
+        return entries[position][1] if position >= 0 else 0
+
+    def read(self, after_seq=0, limit=1000):
+        """
+        Reads one batch of events.
+
+        :param after_seq: int - Last sequence # consumer already has; 0 reads from start.
+        :param limit: int - Maximum events returned.
+        :return: list of dict - Events in sequence order; empty if none newer.
+        """
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, 'rb') as file:
+            file.seek(self.seek_offset(after_seq + 1))
+            events, _ = self._read_batch(file, after_seq, limit)
+        return events
+
+    def follow(self, after_seq=0, batch_size=500, poll_interval=0.5, idle=None):
+        """
+        Tails log, yielding batches of new events as they're appended.
+
+        :param after_seq: int - Last sequence # consumer already has.
+        :param batch_size: int - Maximum events per batch.
+        :param poll_interval: float - Seconds to wait when no new events.
+        :param idle: callable - Called when caught up; returning True stops following, e.g. for tests & one-shot
+                                catch-up.
+        :return: generator of list of dict - Event batches.
+        """
+        while not os.path.exists(self.path):
+            if idle and idle():
+                return
+            time.sleep(poll_interval)
+        with open(self.path, 'rb') as file:
+            file.seek(self.seek_offset(after_seq + 1))
+            while True:
+                events, after_seq = self._read_batch(file, after_seq, batch_size)
+                if events:
+                    yield events
+                    continue
+                if idle and idle():
+                    return
+                time.sleep(poll_interval)
+
+    @staticmethod
+    def _read_batch(file, after_seq, limit):
+        """
+        Reads up to limit complete events newer than after_seq from file's position, leaving position before any
+        incomplete line still being written.
+
+        :return: tuple - (events, last sequence # read).
+        """
+        events = []
+        while len(events) < limit:
+            position = file.tell()
+            line = file.readline()
+            if not line.endswith(b'\n'):
+                file.seek(position)
+                break
+            event = json.loads(line)
+            if event['seq'] > after_seq:
+                events.append(event)
+                after_seq = event['seq']
+        return events, after_seq
+
+
+class TaskChangeRecorder:
+    """
+    Turns task additions, changes, & removals into feed events. Last published fields kept per task, so update
+    events carry only fields that changed & unchanged tasks produce none.
+    """
+    def __init__(self, writer):
+        """
+        :param writer: ChangeFeedWriter - Feed events appended to.
+        """
+        self.writer = writer
+        self._states = {}  # Task ID -> tuple of FIELDS values last published
+
+    @staticmethod
+    def key(task):
+        return task.task_id
+
+    @staticmethod
+    def state(task):
+        return tuple(getattr(task, field) for field in FIELDS)
+
+    def track(self, tasks):
+        """
+        Records current state of tasks already known to consumers (e.g. just loaded from task file) w/o events.
+        """
+        for task in tasks:
+            self._states[task.task_id] = self.state(task)
+
+    def added(self, tasks):
+        """
+        Publishes 'add' event w/ all fields per task.
+
+        :return: int - Last sequence #.
+        """
+        events = []
+        for task in tasks:
+            state = self._states[task.task_id] = self.state(task)
+            events.append(('add', self.key(task), dict(zip(FIELDS, state))))
+        return self.writer.append(events)
+
+    def changed(self, tasks):
+        """
+        Publishes 'update' event w/ changed fields for each tracked task that changed.
+
+        :return: int - Last sequence #.
+        """
+        events = []
+        for task in tasks:
+            previous = self._states.get(task.task_id)
+            if previous is None:
+                continue
+            state = self.state(task)
+            changes = {field: value for field, value, old in zip(FIELDS, state, previous) if value != old}
+            if changes:
+                self._states[task.task_id] = state
+                events.append(('update', self.key(task), changes))
+        return self.writer.append(events)
+
+    def removed(self, tasks):
+        """
+        Publishes 'remove' event per tracked task.
+
+        :return: int - Last sequence #.
+        """
+        events = [('remove', self.key(task), None) for task in tasks
+                  if self._states.pop(task.task_id, None) is not None]
+        return self.writer.append(events)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print task change events as JSON Lines.")
+    parser.add_argument('file', help="Change feed log file.")
+    parser.add_argument('--after', type=int, default=0, help="Last sequence # already seen.")
+    parser.add_argument('--batch-size', type=int, default=500, help="Maximum events per batch.")
+    parser.add_argument('--follow', action='store_true', help="Keep waiting for new events.")
+    args = parser.parse_args(argv)
+
+    reader = ChangeFeedReader(args.file)
+    try:
+        for batch in reader.follow(args.after, args.batch_size, idle=None if args.follow else lambda: True):
+            sys.stdout.write(b''.join(encode_event(event) for event in batch).decode('utf-8'))
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
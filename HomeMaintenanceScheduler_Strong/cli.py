@@ -0,0 +1,250 @@
+"""
+* Name:         cli.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Command line interface for batch jobs (cron) that works on task files directly, w/o Qt or display.
+*               Subcommands: due, overdue, complete, rollover, health, import, & export. Records streamed from &
+*               to task files one at time (JSON, JSON Lines, or CSV), & report lines printed as they're found.
+*               Commands that change tasks write to temporary file that replaces task file once complete. Import
+*               skips records whose task ID already in task file, so importing same file twice adds nothing.
+* Input:        Command line arguments & task files.
+* Output:       Report lines on stdout, updated task files, & exit status (0 success, 1 nothing matched, 2 error).
+* BigO:         O(n) per command over n records, O(1) memory per record except health (O(c) for c categories).
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from itertools import chain
+from category_health import health_from_counts
+from frequency import get_rollover_frequency, to_date
+from task_store import FORMATS, iter_records, resolve_format, unique_ids, write_records
+
+
+def record_due_date(record):
+    """
+    :param record: dict - Task record.
+    :return: date or None - Record's due date, or None if it isn't valid 'YYYY-MM-DD' date.
+    """
+    try:
+        return to_date(record.get('due_date') or '')
+    except ValueError:
+        return None
+
+
+def emit(records, output_format='text', out=None):
+    """
+    Prints records as they arrive, as tab separated report lines or JSON Lines.
+
+    :param records: iterable of dict - Records to print.
+    :param output_format: str - 'text' or 'jsonl'.
+    :param out: file - Output stream, defaults stdout.
+    :return: int - # of records printed.
+    """
+    out = out or sys.stdout
+    count = 0
+    for record in records:
+        if output_format == 'jsonl':
+            out.write(json.dumps(record, separators=(',', ':')) + '\n')
+        else:
+            out.write(f"{record['due_date']}\t{record['priority']}\t{record['category']}\t{record['description']}\n")
+        count += 1
+    return count
+
+
+def rewrite(filename, transform, file_format=None):
+    """
+    Streams records of task file through transform into temporary file, then replaces task file w/ it, so
+    interrupted job never leaves half-written task file.
+
+    :param filename: str - Task file.
+    :param transform: callable - Takes record iterator & yields records to write.
+    :param file_format: str - Task file format; detected if omitted.
+    :return: int - # of records written.
+    """
+    file_format = resolve_format(filename, file_format)
+    handle, temporary = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)), suffix='.tmp')
+    os.close(handle)
+    try:
+        count = write_records(transform(iter_records(filename, file_format)), temporary, file_format)
+        os.replace(temporary, filename)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    return count
+
+
+def roll_over(record, today):
+    """
+    Moves completed task whose due date has arrived to its next due date after today & reopens it.
+
+    :param record: dict - Task record.
+    :param today: date - Rollover date.
+    :return: bool - True if record rolled over.
+    """
+    due_date = record_due_date(record)
+    if not record['is_completed'] or due_date is None or due_date > today:
+        return False
+    frequency = get_rollover_frequency(record.get('frequency', ''))
+    while due_date <= today:
+        due_date = frequency.advance(due_date)
+    record['due_date'] = due_date.strftime('%Y-%m-%d')
+    record['is_completed'] = False
+    return True
+
+
+def command_due(args):
+    end = args.today + timedelta(days=args.days)
+    records = (record for record in iter_records(args.file, args.format)
+               if not record['is_completed'] and args.today <= (record_due_date(record) or date.min) <= end)
+    emit(records, args.output_format)
+    return 0
+
+
+def command_overdue(args):
+    records = (record for record in iter_records(args.file, args.format)
+               if not record['is_completed'] and (record_due_date(record) or date.max) < args.today)
+    emit(records, args.output_format)
+    return 0
+
+
+def command_complete(args):
+    completed = []
+
+    def transform(records):
+        for record in records:
+            if record['description'] == args.description and not record['is_completed'] \
+                    and (args.all or not completed):
+                record['is_completed'] = True
+                completed.append(record)
+            yield record
+
+    rewrite(args.file, transform, args.format)
+    emit(completed, args.output_format)
+    return 0 if completed else 1
+
+
+def command_rollover(args):
+    def transform(records):
+        for record in records:
+            if roll_over(record, args.today):
+                emit([record], args.output_format)
+            yield record
+
+    rewrite(args.file, transform, args.format)
+    return 0
+
+
+def command_health(args):
+    counts = {}
+    for record in iter_records(args.file, args.format):
+        entry = counts.setdefault(record['category'], [0, 0])
+        entry[1] += 1
+        if record['is_completed']:
+            entry[0] += 1
+    for category, status in sorted(health_from_counts(counts).items()):
+        completed, total = counts[category]
+        sys.stdout.write(f"{category}\t{status:.1f}%\t{completed}/{total}\n")
+    return 0
+
+
+def command_import(args):
+    if os.path.abspath(args.source) == os.path.abspath(args.file):
+        raise ValueError("Can't import task file into itself")
+    imported = [0]
+    skipped = [0]
+    seen = set()  # IDs in task file, filled as its records stream past before source records
+
+    def source_records():
+        for record in iter_records(args.source, args.source_format):
+            if record.get('id') in seen:
+                skipped[0] += 1  # Same task already in file, e.g. source imported before
+                continue
+            imported[0] += 1
+            yield record
+
+    rewrite(args.file, lambda records: unique_ids(chain(records, source_records()), seen), args.format)
+    print(f"Imported {imported[0]} tasks into {args.file}"
+          + (f", skipped {skipped[0]} already there" if skipped[0] else ""))
+    return 0
+
+
+def command_export(args):
+    count = write_records(iter_records(args.file, args.format), args.destination, args.destination_format)
+    print(f"Exported {count} tasks to {args.destination}")
+    return 0
+
+
+def build_parser():
+    """
+    :return: argparse.ArgumentParser - Parser w/ one subcommand per batch job.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-f', '--file', default='tasks.json', help="Task file, defaults tasks.json.")
+    common.add_argument('--format', choices=FORMATS, help="Task file format; detected if omitted.")
+    common.add_argument('--today', type=to_date, default=date.today(), help="Date to use as today (YYYY-MM-DD).")
+    common.add_argument('--output-format', choices=('text', 'jsonl'), default='text', help="Report line format.")
+
+    parser = argparse.ArgumentParser(description="Home Maintenance Scheduler batch jobs.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    due = commands.add_parser('due', parents=[common], help="List open tasks due within next days.")
+    due.add_argument('--days', type=int, default=7, help="# of days ahead, defaults 7.")
+    due.set_defaults(handler=command_due)
+
+    commands.add_parser('overdue', parents=[common], help="List open tasks past due date.") \
+        .set_defaults(handler=command_overdue)
+
+    complete = commands.add_parser('complete', parents=[common], help="Mark task completed by description.")
+    complete.add_argument('description', help="Exact task description.")
+    complete.add_argument('--all', action='store_true', help="Complete every matching task, not just first.")
+    complete.set_defaults(handler=command_complete)
+
+    commands.add_parser('rollover', parents=[common], help="Reopen completed tasks at their next due date.") \
+        .set_defaults(handler=command_rollover)
+
+    commands.add_parser('health', parents=[common], help="Show completion health per category.") \
+        .set_defaults(handler=command_health)
+
+    import_parser = commands.add_parser('import', parents=[common], help="Append tasks from another file.")
+    import_parser.add_argument('source', help="File to import from.")
+    import_parser.add_argument('--source-format', choices=FORMATS, help="Source format; detected if omitted.")
+    import_parser.set_defaults(handler=command_import)
+
+    export = commands.add_parser('export', parents=[common], help="Write tasks to another file or format.")
+    export.add_argument('destination', help="File to export to.")
+    export.add_argument('--destination-format', choices=FORMATS, help="Destination format; from extension if omitted.")
+    export.set_defaults(handler=command_export)
+    return parser
+
+
+def main(argv=None):
+    """
+    Runs subcommand.
+
+    :param argv: list of str - Arguments, defaults sys.argv[1:].
+    :return: int - Exit status.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError, KeyError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+* Name:         dependency_graph.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Directed acyclic graph of task prerequisites. Keeps topological order incrementally (Pearce-Kelly
+*               algorithm), only reordering nodes between endpoints of edge that breaks current order, & rejects
+*               edges that would create cycle. Tracks # of unfinished prerequisites per task so tasks that
+*               become ready reported as completions arrive, w/o rescanning graph.
+* Input:        Tasks, prerequisite edges, & completion/reset notifications.
+* Output:       Topological order, readiness of tasks, & callbacks when tasks become ready.
+* BigO:         O(1) for edges that keep order, O(k log k) for k nodes in affected region otherwise;
+*               O(d) per completion for task w/ d dependents.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+
+class DependencyGraph:
+    """
+    Maintains prerequisite edges between tasks w/ incremental topological order & readiness counts.
+    """
+    def __init__(self, on_ready=None):
+        """
+        Initializes empty graph.
+
+        :param on_ready: callable - Called w/ task whenever task becomes ready (incomplete, all prerequisites done).
+        """
+        self.on_ready = on_ready
+        self._order = {}  # Task -> position in topological order
+        self._successors = {}  # Task -> set of tasks that depend on it
+        self._predecessors = {}  # Task -> set of its prerequisites
+        self._waiting = {}  # Task -> # of prerequisites not yet completed
+        self._done = set()  # Tasks currently completed
+        self._next_position = 0
+
+    def __contains__(self, task):
+        return task in self._order
+
+    def add_task(self, task):
+        """
+        Adds task to end of topological order; completion state taken from task.is_completed.
+
+        :param task: Task - Task to add; ignored if already present.
+        """
+        if task in self._order:
+            return
+        self._order[task] = self._next_position
+        self._next_position += 1
+        self._successors[task] = set()
+        self._predecessors[task] = set()
+        self._waiting[task] = 0
+        if task.is_completed:
+            self._done.add(task)
+        else:
+            self._notify_ready(task)
+
+    def remove_task(self, task):
+        """
+        Removes task & all edges touching it.
+
+        :param task: Task - Task to remove; ignored if not present.
+        """
+        if task not in self._order:
+            return
+        for prerequisite in list(self._predecessors[task]):
+            self.remove_dependency(prerequisite, task)
+        for dependent in list(self._successors[task]):
+            self.remove_dependency(task, dependent)
+        del self._order[task], self._successors[task], self._predecessors[task], self._waiting[task]
+        self._done.discard(task)
+
+    def add_dependency(self, before, after):
+        """
+        Adds edge requiring 'before' to be completed before 'after' becomes ready.
+
+        :param before: Task - Prerequisite task.
+        :param after: Task - Dependent task.
+        :raises ValueError: If edge would create cycle; edge not added.
+        """
+        self.add_task(before)
+        self.add_task(after)
+        if before is after:
+            raise ValueError("Task cannot depend on itself.")
+        if after in self._successors[before]:
+            return
+        lower, upper = self._order[after], self._order[before]
+        if lower < upper:
+            forward = self._reach(after, self._successors, lambda position: position <= upper, before)
+            backward = self._reach(before, self._predecessors, lambda position: position >= lower)
+            self._reorder(backward, forward)
+        self._successors[before].add(after)
+        self._predecessors[after].add(before)
+        if before not in self._done:
+            self._waiting[after] += 1
+
+    def remove_dependency(self, before, after):
+        """
+        Removes edge between tasks; topological order stays valid so no reordering needed.
+
+        :param before: Task - Prerequisite task.
+        :param after: Task - Dependent task.
+        """
+        if before not in self._successors or after not in self._successors[before]:
+            return
+        self._successors[before].discard(after)
+        self._predecessors[after].discard(before)
+        if before not in self._done:
+            self._waiting[after] -= 1
+            if self._waiting[after] == 0:
+                self._notify_ready(after)
+
+    def mark_completed(self, task):
+        """
+        Records task completion & reports dependents whose last unfinished prerequisite it was.
+
+        :param task: Task - Completed task.
+        """
+        if task not in self._order or task in self._done:
+            return
+        self._done.add(task)
+        for dependent in self._successors[task]:
+            self._waiting[dependent] -= 1
+            if self._waiting[dependent] == 0:
+                self._notify_ready(dependent)
+
+    def mark_reset(self, task):
+        """
+        Records task reset to incomplete, blocking its dependents again.
+
+        :param task: Task - Reset task.
+        """
+        if task not in self._done:
+            return
+        self._done.discard(task)
+        for dependent in self._successors[task]:
+            self._waiting[dependent] += 1
+        self._notify_ready(task)
+
+    def is_ready(self, task):
+        """
+        Checks whether task is incomplete & all of its prerequisites are completed.
+
+        :param task: Task - Task to check.
+        :return: bool - True if task can be worked on now.
+        """
+        return task in self._order and task not in self._done and self._waiting[task] == 0
+
+    def get_prerequisites(self, task):
+        """
+        :return: set of Task - Direct prerequisites of task.
+        """
+        return set(self._predecessors.get(task, ()))
+
+    def get_dependents(self, task):
+        """
+        :return: set of Task - Tasks that directly depend on task.
+        """
+        return set(self._successors.get(task, ()))
+
+    def topological_order(self):
+        """
+        Returns every task ordered so prerequisites always come before their dependents.
+
+        :return: list of Task - Tasks in topological order.
+        """
+        return sorted(self._order, key=self._order.get)
+
+    def _reach(self, start, edges, in_region, forbidden=None):
+        """
+        Depth-first search from start over given edges, staying inside affected order region.
+
+        :raises ValueError: If search reaches forbidden node, meaning new edge would close cycle.
+        """
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbour in edges[node]:
+                if neighbour is forbidden:
+                    raise ValueError("Dependency would create a cycle.")
+                if neighbour not in visited and in_region(self._order[neighbour]):
+                    visited.add(neighbour)
+                    stack.append(neighbour)
+        return visited
+
+    def _reorder(self, backward, forward):
+        """
+        Reassigns positions held by affected nodes so backward set precedes forward set.
+        """
+        by_position = self._order.get
+        nodes = sorted(backward, key=by_position) + sorted(forward, key=by_position)
+        positions = sorted(self._order[node] for node in nodes)
+        for node, position in zip(nodes, positions):
+            self._order[node] = position
+
+    def _notify_ready(self, task):
+        if self.on_ready and self.is_ready(task):
+            self.on_ready(task)
@@ -0,0 +1,84 @@
+"""
+* Name:         forecast.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Forecasts future occurrences of recurring tasks. Each task's recurrence expanded as lazy generator
+*               & all streams merged in due date order w/ heap, so callers pay only for occurrences they consume.
+* Input:        Tasks w/ due dates & frequencies, optional date range & occurrence limit.
+* Output:       Generators of (date, task) pairs in ascending date order.
+* BigO:         O(n) to start n streams, O(log n) per occurrence yielded.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import calendar
+import heapq
+from datetime import date
+from itertools import islice
+from operator import itemgetter
+from frequency import get_rollover_frequency, to_date
+
+
+def iter_occurrences(task, start=None, end=None):
+    """
+    Lazily yields occurrences of single task, beginning at its due date & repeating at its frequency.
+
+    :param task: Task - Task to expand; unrecognized frequencies repeat annually like task rollover.
+    :param start: date or str - Skips occurrences before this date, defaults no lower bound.
+    :param end: date or str - Stops after this date (inclusive), defaults unbounded.
+    :return: generator of (date, Task) - Occurrences in ascending date order.
+    :raises ValueError: If task's due date isn't formatted as 'YYYY-MM-DD'.
+    """
+    frequency = get_rollover_frequency(task.frequency)
+    anchor = to_date(task.due_date)
+    start = to_date(start) if start is not None else None
+    end = to_date(end) if end is not None else None
+
+    step = 0
+    if start is not None and anchor < start:
+        # Jump close to start instead of stepping through every earlier occurrence
+        step = max(0, int((start - anchor).days / frequency.approximate_days) - 1)
+        while frequency.advance(anchor, step) < start:
+            step += 1
+
+    while True:
+        occurrence = frequency.advance(anchor, step)
+        if end is not None and occurrence > end:
+            return
+        yield occurrence, task
+        step += 1
+
+
+def forecast(tasks, start=None, end=None, limit=None):
+    """
+    Merges occurrence streams of all tasks into one stream ordered by date.
+
+    :param tasks: iterable of Task - Tasks to forecast.
+    :param start: date or str - First date of forecast, defaults no lower bound.
+    :param end: date or str - Last date of forecast (inclusive), defaults unbounded.
+    :param limit: int - Maximum # of occurrences to yield, defaults unlimited.
+    :return: iterator of (date, Task) - Occurrences in ascending date order.
+    """
+    merged = heapq.merge(*(iter_occurrences(task, start, end) for task in tasks), key=itemgetter(0))
+    return islice(merged, limit) if limit is not None else merged
+
+
+def occurrences_in_month(tasks, year, month):
+    """
+    Returns every occurrence falling in given calendar month.
+
+    :param tasks: iterable of Task - Tasks to forecast.
+    :param year: int - Year of month.
+    :param month: int - Month number, 1-12.
+    :return: list of (date, Task) - Occurrences in ascending date order.
+    """
+    last_day = calendar.monthrange(year, month)[1]
+    return list(forecast(tasks, date(year, month, 1), date(year, month, last_day)))
@@ -0,0 +1,158 @@
+"""
+* Name:         frequency.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Compiles task frequency strings such as 'monthly', '3 months' or 'every 2 years' into Frequency
+*               recurrence objects used for due date calculation & task rollover. Parsed frequencies cached &
+*               interned so each distinct frequency is parsed once & shared by every task that uses it.
+* Input:        Frequency strings & due dates as 'YYYY-MM-DD' strings or date objects.
+* Output:       Frequency objects & advanced due dates; raises ValueError for unrecognized frequencies.
+* BigO:         O(1) for cached lookups & date arithmetic, O(k) to parse uncached string of length k.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import calendar
+import re
+from datetime import date, datetime, timedelta
+
+# Named frequencies mapped to (count, unit)
+_KEYWORDS = {
+    'daily': (1, 'days'),
+    'weekly': (1, 'weeks'),
+    'biweekly': (2, 'weeks'),
+    'fortnightly': (2, 'weeks'),
+    'monthly': (1, 'months'),
+    'quarterly': (3, 'months'),
+    'semiannually': (6, 'months'),
+    'semi-annually': (6, 'months'),
+    'annually': (1, 'years'),
+    'yearly': (1, 'years'),
+}
+
+_PATTERN = re.compile(r'^(?:every\s+)?(?:(\d+)\s+)?(day|week|month|year)s?$')
+
+_parsed_cache = {}  # Raw frequency string -> Frequency
+_interned = {}  # (count, unit) -> Frequency
+
+
+class Frequency:
+    """
+    Recurrence of fixed number of days, weeks, months, or years. Month & year steps use calendar arithmetic,
+    clamping to last day of month when target month is shorter (e.g. Jan 31 + 1 month -> Feb 28).
+    """
+    __slots__ = ('count', 'unit')
+
+    UNITS = ('days', 'weeks', 'months', 'years')
+
+    def __init__(self, count, unit):
+        if unit not in self.UNITS:
+            raise ValueError(f"Unhandled frequency unit: {unit}")
+        if count < 1:
+            raise ValueError("Frequency count must be at least 1.")
+        self.count = count
+        self.unit = unit
+
+    def __repr__(self):
+        return f"Frequency({self.count}, '{self.unit}')"
+
+    @property
+    def approximate_days(self):
+        """
+        Average length of one interval in days, useful for estimating how many steps fit in a date range.
+        """
+        return self.count * {'days': 1, 'weeks': 7, 'months': 30.436875, 'years': 365.2425}[self.unit]
+
+    def advance(self, start, steps=1):
+        """
+        Returns date that lies given # of intervals after start. Steps always taken from start rather than
+        chained, so repeated month-end clamping doesn't drift.
+
+        :param start: date or datetime - Date to advance from.
+        :param steps: int - # of intervals to advance, defaults 1.
+        :return: date or datetime - Same type as start.
+        """
+        if self.unit == 'days':
+            return start + timedelta(days=self.count * steps)
+        if self.unit == 'weeks':
+            return start + timedelta(weeks=self.count * steps)
+        months = self.count * steps * (12 if self.unit == 'years' else 1)
+        month_index = start.month - 1 + months
+        year = start.year + month_index // 12
+        month = month_index % 12 + 1
+        day = min(start.day, calendar.monthrange(year, month)[1])
+        return start.replace(year=year, month=month, day=day)
+
+    def next_due_date(self, due_date):
+        """
+        Calculates next due date one interval after given due date.
+
+        :param due_date: str or date - Due date formatted as 'YYYY-MM-DD', or date/datetime object.
+        :return: str - Next due date formatted as 'YYYY-MM-DD'.
+        """
+        return self.advance(to_date(due_date)).strftime('%Y-%m-%d')
+
+
+def to_date(value):
+    """
+    Converts 'YYYY-MM-DD' string or datetime to date object.
+
+    :param value: str, date, or datetime - Value to convert.
+    :return: date - Calendar date.
+    """
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def parse_frequency(text):
+    """
+    Compiles frequency string into shared Frequency object. Results cached by raw string & interned by
+    (count, unit), so '3 months' & 'every 3 months' return same object & each string parsed only once.
+
+    :param text: str - Frequency such as 'weekly', '6 months', or 'every 2 years'.
+    :return: Frequency - Compiled recurrence.
+    :raises ValueError: If frequency isn't recognized.
+    """
+    if not isinstance(text, str):
+        raise ValueError(f"Unhandled frequency: {text}")
+    frequency = _parsed_cache.get(text)
+    if frequency is not None:
+        return frequency
+
+    normalized = ' '.join(text.lower().split())
+    key = _KEYWORDS.get(normalized)
+    if key is None:
+        match = _PATTERN.match(normalized)
+        if not match:
+            raise ValueError(f"Unhandled frequency: {text}")
+        key = (int(match.group(1) or 1), match.group(2) + 's')
+
+    frequency = _interned.get(key)
+    if frequency is None:
+        frequency = _interned[key] = Frequency(*key)
+    _parsed_cache[text] = frequency
+    return frequency
+
+
+def get_rollover_frequency(text):
+    """
+    Returns compiled frequency for task rollover, defaulting to annually if frequency unrecognized.
+
+    :param text: str - Frequency string stored on task.
+    :return: Frequency - Compiled recurrence.
+    """
+    try:
+        return parse_frequency(text)
+    except ValueError:
+        return parse_frequency('annually')
@@ -0,0 +1,135 @@
+"""
+* Name:         history.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Defines EditHistory, bounded undo/redo history of task edits (add, remove, complete, reset, & priority
+*               change). Each step stores only changed tasks' before & after states (due date, completion, priority),
+*               never copy of task list, so memory grows w/ edits made rather than # of tasks. Removal also keeps
+*               tasks that depended on removed task, so undo restores those links. Steps applied back through
+*               target object's restore_task, keeping history independent of GUI.
+* Input:        Task edits recorded as TaskEdit objects, & target restoring task states.
+* Output:       Task states restored on target when steps undone or redone.
+* BigO:         O(k) per record, undo, or redo of step changing k tasks; O(limit * k) memory.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+from collections import deque
+
+
+def snapshot(task):
+    """
+    :param task: Task - Task to capture.
+    :return: tuple - Task's editable state as (due_date, is_completed, priority).
+    """
+    return task.due_date, task.is_completed, task.priority
+
+
+class TaskEdit:
+    """
+    Change of one task from before state to after state; None state means task not in task list (before None for
+    added task, after None for removed task). Dependents lists tasks that depended on removed task.
+    """
+    __slots__ = ('task', 'before', 'after', 'dependents')
+
+    def __init__(self, task, before, after, dependents=()):
+        self.task = task
+        self.before = before
+        self.after = after
+        self.dependents = tuple(dependents)
+
+
+class EditHistory:
+    """
+    Undo stack bounded to limit steps (oldest dropped first) & redo stack cleared whenever new step recorded.
+    """
+    def __init__(self, limit=500):
+        """
+        :param limit: int - Maximum # of undoable steps kept.
+        """
+        self._undo = deque(maxlen=limit)  # (label, tuple of TaskEdit)
+        self._redo = []
+
+    def __len__(self):
+        """
+        :return: int - # of steps that can be undone.
+        """
+        return len(self._undo)
+
+    def record(self, label, edits):
+        """
+        Adds step to history, ignoring edits that left task unchanged.
+
+        :param label: str - Step name shown in Undo/Redo menu items, e.g. "Complete Task".
+        :param edits: iterable of TaskEdit - Task changes made by step.
+        :return: bool - True if step recorded, False if nothing changed.
+        """
+        edits = tuple(edit for edit in edits if edit.before != edit.after)
+        if not edits:
+            return False
+        self._undo.append((label, edits))
+        self._redo.clear()
+        return True
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo_label(self):
+        """
+        :return: str or None - Label of step undo would revert.
+        """
+        return self._undo[-1][0] if self._undo else None
+
+    def redo_label(self):
+        """
+        :return: str or None - Label of step redo would reapply.
+        """
+        return self._redo[-1][0] if self._redo else None
+
+    def undo(self, target):
+        """
+        Reverts latest step, restoring each task's before state (& links to its dependents) in reverse order.
+
+        :param target: object - Provides restore_task(task, state, dependents).
+        :return: str or None - Label of step undone, or None if nothing to undo.
+        """
+        if not self._undo:
+            return None
+        label, edits = self._undo.pop()
+        for edit in reversed(edits):
+            target.restore_task(edit.task, edit.before, edit.dependents)
+        self._redo.append((label, edits))
+        return label
+
+    def redo(self, target):
+        """
+        Reapplies latest undone step, restoring each task's after state.
+
+        :param target: object - Provides restore_task(task, state, dependents).
+        :return: str or None - Label of step redone, or None if nothing to redo.
+        """
+        if not self._redo:
+            return None
+        label, edits = self._redo.pop()
+        for edit in edits:
+            target.restore_task(edit.task, edit.after, ())
+        self._undo.append((label, edits))
+        return label
+
+    def clear(self):
+        """
+        Forgets every step, e.g. after task list replaced.
+        """
+        self._undo.clear()
+        self._redo.clear()
@@ -0,0 +1,200 @@
+"""
+* Name:         instrumentation.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Lightweight timing spans & counters for GUI refresh paths, loading, saving, & scheduler operations.
+*               Enabled by setting HMS_INSTRUMENT environment variable (or enable()); when disabled, spans are
+*               shared no-op object & counters return immediately, so instrumented code pays single attribute check.
+*               Summaries give call counts & p50/p95/max latencies, logged or exported to JSON file.
+* Input:        Span names & counter increments from instrumented code.
+* Output:       Summary dictionaries, log lines, & JSON export (HMS_INSTRUMENT_FILE, defaults 'instrumentation.json').
+* BigO:         O(1) per span & counter, O(s log s) per summary for s retained samples.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from functools import wraps
+from time import perf_counter
+
+logger = logging.getLogger(__name__)
+
+
+class _NullSpan:
+    """
+    Span used while instrumentation disabled; does nothing.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """
+    Times block of code & records duration under name on exit.
+    """
+    __slots__ = ('recorder', 'name', 'start')
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.recorder.record(self.name, perf_counter() - self.start)
+        return False
+
+
+class Instrumentation:
+    """
+    Collects span durations & counters. Most recent sample_limit durations per span kept for percentiles, while
+    call counts & totals cover every call.
+    """
+    def __init__(self, enabled=False, sample_limit=10000):
+        """
+        :param enabled: bool - Records spans & counters when True, defaults False.
+        :param sample_limit: int - Maximum # of durations kept per span for percentiles.
+        """
+        self.enabled = enabled
+        self.sample_limit = sample_limit
+        self._samples = {}  # Span name -> deque of recent durations in seconds
+        self._calls = {}  # Span name -> [call count, total seconds]
+        self.counters = {}  # Counter name -> count
+
+    def span(self, name):
+        """
+        Returns context manager timing enclosed block.
+
+        :param name: str - Span name, e.g. 'dashboard.refresh_task_table'.
+        :return: context manager - Real span if enabled, shared no-op span otherwise.
+        """
+        return _Span(self, name) if self.enabled else _NULL_SPAN
+
+    def timed(self, name=None):
+        """
+        Decorator timing every call of function; checks enabled per call, so can be toggled at runtime.
+
+        :param name: str - Span name, defaults function's qualified name.
+        """
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, name, amount=1):
+        """
+        Increments counter.
+
+        :param name: str - Counter name.
+        :param amount: int - Amount added, defaults 1.
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name, seconds):
+        """
+        Records one duration for span.
+
+        :param name: str - Span name.
+        :param seconds: float - Duration in seconds.
+        """
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.sample_limit)
+            self._calls[name] = [0, 0.0]
+        samples.append(seconds)
+        calls = self._calls[name]
+        calls[0] += 1
+        calls[1] += seconds
+
+    def reset(self):
+        """
+        Discards all recorded spans & counters.
+        """
+        self._samples.clear()
+        self._calls.clear()
+        self.counters.clear()
+
+    def summary(self):
+        """
+        :return: dict - 'spans': name -> calls, total_ms, p50_ms, p95_ms, max_ms; 'counters': name -> count.
+        """
+        spans = {}
+        for name, samples in self._samples.items():
+            ordered = sorted(samples)
+            calls, total = self._calls[name]
+            spans[name] = {
+                'calls': calls,
+                'total_ms': round(total * 1000, 3),
+                'p50_ms': round(_percentile(ordered, 50) * 1000, 3),
+                'p95_ms': round(_percentile(ordered, 95) * 1000, 3),
+                'max_ms': round(ordered[-1] * 1000, 3),
+            }
+        return {'spans': spans, 'counters': dict(self.counters)}
+
+    def log_summary(self, level=logging.INFO):
+        """
+        Writes one log line per span & counter, slowest spans by total time first.
+        """
+        summary = self.summary()
+        for name, stats in sorted(summary['spans'].items(), key=lambda item: -item[1]['total_ms']):
+            logger.log(level, "%s: %d calls, p50 %.3f ms, p95 %.3f ms, max %.3f ms", name, stats['calls'],
+                       stats['p50_ms'], stats['p95_ms'], stats['max_ms'])
+        for name, value in sorted(summary['counters'].items()):
+            logger.log(level, "%s: %d", name, value)
+
+    def export_json(self, filename=None):
+        """
+        Writes summary to JSON file.
+
+        :param filename: str - Output file, defaults HMS_INSTRUMENT_FILE or 'instrumentation.json'.
+        :return: str - File written.
+        """
+        filename = filename or os.environ.get('HMS_INSTRUMENT_FILE', 'instrumentation.json')
+        with open(filename, 'w') as file:
+            json.dump(self.summary(), file, indent=4)
+        return filename
+
+
+def _percentile(ordered, percent):
+    """
+    Nearest-rank percentile of sorted, non-empty samples.
+    """
+    rank = max(1, -(-len(ordered) * percent // 100))  # Ceiling w/o floats
+    return ordered[int(rank) - 1]
+
+
+# Shared instance used by application modules
+instrumentation = Instrumentation(enabled=os.environ.get('HMS_INSTRUMENT', '') not in ('', '0'))
+span = instrumentation.span
+timed = instrumentation.timed
+count = instrumentation.count
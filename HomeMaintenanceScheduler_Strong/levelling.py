@@ -0,0 +1,240 @@
+"""
+* Name:         levelling.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Capacity-aware workload levelling. Spreads flexible tasks across fixed-length periods (days or
+*               weeks) so no period exceeds capacity, placing each task in latest period w/ room that doesn't
+*               pass its latest allowable date. Higher priority tasks placed first, so they get periods closest
+*               to their due dates & lower priority tasks pushed into earlier periods. Full periods skipped w/
+*               union-find structure so placement stays near constant time for large portfolios; period freed by
+*               completion or removal reopened on its own (sorted list of reopened periods, folded back into
+*               union-find once it grows) & offered to overflowed tasks, highest priority first.
+* Input:        Tasks, per-period capacity, period length, & optional weight (e.g. hours) per task.
+* Output:       Assignment of each task to planned period & list of tasks that couldn't fit.
+* BigO:         O(n log n) for initial levelling (sorting), near O(1) amortized per placement or update, plus
+*               O(k log k) to offer freed capacity to k overflowed tasks.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+from bisect import bisect_right, insort
+from datetime import date, timedelta
+from frequency import to_date
+
+
+class WorkloadLeveller:
+    """
+    Assigns tasks to periods under per-period capacity using greedy latest-fit placement.
+    """
+    def __init__(self, capacity, period_days=7, start=None, weight=None, is_flexible=None):
+        """
+        Initializes empty plan.
+
+        :param capacity: int or float - Maximum load per period (task count or hours).
+        :param period_days: int - Length of each period in days, defaults 7 (weekly).
+        :param start: date or str - First day of first period, defaults today.
+        :param weight: callable - Task -> load it consumes, defaults 1 per task.
+        :param is_flexible: callable - Task -> bool; fixed tasks stay in their due period, defaults all flexible.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        if period_days < 1:
+            raise ValueError("Period must be at least one day.")
+        self.capacity = capacity
+        self.period_days = period_days
+        self.start = to_date(start) if start is not None else date.today()
+        self.weight = weight or (lambda task: 1)
+        self.is_flexible = is_flexible or (lambda task: True)
+        self.loads = {}  # Period index -> load assigned to it
+        self.assignments = {}  # Task -> (period index, weight)
+        self.overflow = set()  # Tasks placed past capacity because no earlier period had room
+        self._parent = {}  # Union-find: full period -> next candidate period before it
+        self._reopened = []  # Sorted periods w/ room again that union-find paths may still skip
+
+    def period_of(self, day):
+        """
+        Returns index of period containing given day; days before start fall into first period.
+
+        :param day: date or str - Day to locate.
+        :return: int - Period index.
+        """
+        return max(0, (to_date(day) - self.start).days // self.period_days)
+
+    def period_start(self, index):
+        """
+        Returns first day of period.
+
+        :param index: int - Period index.
+        :return: date - First day of period.
+        """
+        return self.start + timedelta(days=index * self.period_days)
+
+    def level(self, tasks):
+        """
+        Clears current plan & levels given tasks. Completed tasks skipped. Fixed tasks placed first in their due
+        period, then flexible tasks placed in (priority, due date) order.
+
+        :param tasks: iterable of Task - Tasks to level.
+        :return: dict - Task -> planned period start date.
+        """
+        self.loads.clear()
+        self.assignments.clear()
+        self.overflow.clear()
+        self._parent.clear()
+        self._reopened.clear()
+        pending = [task for task in tasks if not task.is_completed]
+        for task in pending:
+            if not self.is_flexible(task):
+                self._assign(task, self.period_of(task.due_date), self.weight(task))
+        flexible = [task for task in pending if self.is_flexible(task)]
+        for task in sorted(flexible, key=lambda t: (t.priority, t.due_date)):
+            self._place(task)
+        return {task: self.period_start(period) for task, (period, _) in self.assignments.items()}
+
+    def update_task(self, task):
+        """
+        Re-levels single task after it changes, leaving every other assignment untouched.
+
+        :param task: Task - Task whose due date, weight, priority, or completion changed.
+        """
+        freed = self._unassign(task)
+        if not task.is_completed:
+            if self.is_flexible(task):
+                self._place(task)
+            else:
+                self._assign(task, self.period_of(task.due_date), self.weight(task))
+        if freed is not None:
+            self._refill(freed)  # After task itself re-placed, so it keeps its slot if still best
+
+    def remove_task(self, task):
+        """
+        Removes task from plan, freeing capacity it used for overflowed tasks.
+
+        :param task: Task - Task to remove; ignored if not planned.
+        """
+        freed = self._unassign(task)
+        if freed is not None:
+            self._refill(freed)
+
+    def _unassign(self, task):
+        """
+        Removes task's assignment, reopening its period if it drops below capacity.
+
+        :return: int or None - Task's period, or None if task wasn't planned.
+        """
+        assignment = self.assignments.pop(task, None)
+        if assignment is None:
+            return None
+        period, weight = assignment
+        self.overflow.discard(task)
+        self.loads[period] -= weight
+        if self.loads[period] < self.capacity and self._parent.pop(period, None) is not None:
+            # Compressed paths may still skip period, so _find also checks reopened periods
+            insort(self._reopened, period)
+            if len(self._reopened) > max(32, len(self.loads) // 8):
+                self._rebuild()  # Amortized: needs many reopenings since last rebuild
+        return period
+
+    def _rebuild(self):
+        """
+        Rebuilds union-find from loads, clearing reopened periods.
+        """
+        self._parent = {period: period - 1 for period, load in self.loads.items() if load >= self.capacity}
+        self._reopened.clear()
+
+    def _refill(self, period):
+        """
+        Clears overflow of tasks in period that now fit, then moves overflowed tasks allowed in period into it,
+        highest priority first, while it has room. Each moved task frees room in period it overflowed, which is
+        offered on in turn.
+
+        :param period: int - Period w/ freed capacity.
+        """
+        freed = [period]
+        while freed and self.overflow:
+            period = freed.pop()
+            overflowed = sorted(self.overflow, key=lambda t: (t.priority, t.due_date))
+            excess = self.loads.get(period, 0) - self.capacity
+            over = sum(self.assignments[task][1] for task in overflowed if self.assignments[task][0] == period)
+            for task in overflowed:
+                weight = self.assignments[task][1]
+                if self.assignments[task][0] == period and over - weight >= excess:
+                    self.overflow.discard(task)  # Fits now w/o leaving period over capacity
+                    over -= weight
+            for task in overflowed:
+                if self.loads.get(period, 0) >= self.capacity:
+                    break
+                weight = self.assignments[task][1]
+                if task in self.overflow and self.period_of(task.due_date) >= period \
+                        and self.loads.get(period, 0) + weight <= self.capacity:
+                    freed.append(self._unassign(task))
+                    self._assign(task, period, weight)
+
+    def planned_date(self, task):
+        """
+        Returns start date of period task planned in.
+
+        :param task: Task - Planned task.
+        :return: date or None - Period start date, or None if task isn't planned.
+        """
+        assignment = self.assignments.get(task)
+        return self.period_start(assignment[0]) if assignment else None
+
+    def get_period_tasks(self, index):
+        """
+        Returns tasks planned in period, ordered by priority & due date.
+
+        :param index: int - Period index.
+        :return: list of Task - Tasks in period.
+        """
+        tasks = [task for task, (period, _) in self.assignments.items() if period == index]
+        return sorted(tasks, key=lambda t: (t.priority, t.due_date))
+
+    def _find(self, period):
+        """
+        Returns latest period at or before given period that isn't full, or -1 if none.
+        """
+        reopened = self._reopened
+        position = bisect_right(reopened, period)
+        latest_reopened = reopened[position - 1] if position else -1
+        parent = self._parent
+        while period > latest_reopened and period in parent:
+            next_period = parent[period]
+            if next_period in parent:
+                parent[period] = parent[next_period]  # Path halving
+            period = parent[period]
+        return max(period, latest_reopened)
+
+    def _place(self, task):
+        """
+        Places flexible task in latest period w/ room that doesn't pass its due date.
+        """
+        weight = self.weight(task)
+        latest = self.period_of(task.due_date)
+        period = self._find(latest)
+        while period >= 0 and self.loads.get(period, 0) + weight > self.capacity:
+            period = self._find(period - 1)  # Period has some room but not enough for this task
+        if period < 0:
+            period = latest
+            self.overflow.add(task)
+        self._assign(task, period, weight)
+
+    def _assign(self, task, period, weight):
+        """
+        Records assignment & marks period full once capacity reached.
+        """
+        self.loads[period] = self.loads.get(period, 0) + weight
+        self.assignments[task] = (period, weight)
+        if self.loads[period] >= self.capacity and period not in self._parent:
+            self._parent[period] = period - 1
+            position = bisect_right(self._reopened, period) - 1
+            if position >= 0 and self._reopened[position] == period:
+                del self._reopened[position]
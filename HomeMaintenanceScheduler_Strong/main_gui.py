@@ -20,16 +20,31 @@
 *                   modified or unmodified. I have not given other fellow student(s) access to my program.
 """
 
+import argparse
+import logging
 import sys
-from datetime import datetime, timedelta
-from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QLabel, QVBoxLayout, QStackedWidget, QPushButton, QTableWidget, QTableWidgetItem, QCheckBox
-from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt
-from task import Task, AddTaskDialog, save_tasks
+from datetime import datetime
+from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QStackedWidget, QPushButton, QTableView, QHeaderView, QProgressBar, QCalendarWidget, QListWidget, QComboBox, QLineEdit
+from PySide6.QtGui import QAction, QFont, QKeySequence, QTextCharFormat
+from PySide6.QtCore import Qt, QDate, QPropertyAnimation, QThreadPool, QTimer
+from task import Task, AddTaskDialog, save_tasks, load_tasks, link_prerequisites
 from category_health import CategoryHealth
 from pre_defined_tasks import PreDefinedTasks
 from scheduler import Scheduler
-import json
+from frequency import parse_frequency
+from template_instantiation import TemplateInstantiator
+from task_table_model import TaskTableModel
+from subscriptions import SubscriptionManager
+from refresh_coalescer import RefreshCoalescer
+from task_loader import TaskLoadWorker
+from occurrence_index import OccurrenceIndex
+from task_filter import TaskFilter, IncrementalTaskFilter
+from instrumentation import instrumentation, span
+from history import EditHistory, TaskEdit, snapshot
+from change_feed import ChangeFeedWriter, TaskChangeRecorder
+from reports import ScheduleReports
+
+logger = logging.getLogger(__name__)
 
 # Global list of categories for tasks
 CATEGORIES = [
@@ -42,28 +57,51 @@ class MainWindow(QMainWindow):
     """
     Initializes main window & its associated views, setting up layout & data interactions.
     """
-    def __init__(self):
+    VIEWS = ("Dashboard", "Calendar", "Tasks", "Settings")
+
+    def __init__(self, async_load=False, prewarm_views=False, tasks_file='tasks.json', save_on_close=True,
+                 change_feed_file=None):
+        """
+        :param async_load: bool - Loads tasks on worker thread after window shown instead of before, defaults False.
+        :param prewarm_views: bool - Builds secondary views one per idle event loop tick after startup, defaults
+                                     False; otherwise each view built on first navigation.
+        :param tasks_file: str - JSON file tasks loaded from & saved to, defaults 'tasks.json'.
+        :param save_on_close: bool - Saves tasks & any instrumentation summary when window closes, defaults True.
+        :param change_feed_file: str - Change feed log task changes published to for other processes, defaults None
+                                       (no feed).
+        """
         super().__init__()
+        self.tasks_file = tasks_file
+        self.save_on_close = save_on_close
         self.setWindowTitle("Home Maintenance Scheduler")
         self.setGeometry(100, 100, 800, 600)
 
-        # Initialize scheduler
+        # Initialize scheduler, whose task registry is window's task list, & registry owning task signal connections
         self.scheduler = Scheduler()
+        self.registry = self.scheduler.registry  # Task ID -> Task; single source of truth for window & scheduler
+        self.subscriptions = SubscriptionManager()
+        self.reports = ScheduleReports(self.scheduler, CATEGORIES)  # Health recomputed only for changed categories
+
+        # Batches task changes so bulk edits cause one health recalculation & repaint per event loop tick
+        self.refresh_coalescer = RefreshCoalescer(parent=self)
+        self.refresh_coalescer.flushed.connect(self.apply_changes)
+
+        # Undo/redo of task edits, kept as per-task before & after states rather than copies of task list
+        self.history = EditHistory()
+
+        # Publishes each batch of task changes as sequenced events other local processes can follow
+        self.change_recorder = TaskChangeRecorder(ChangeFeedWriter(change_feed_file)) if change_feed_file else None
 
         # Initialize UI components before loading tasks
         self.category_health = CategoryHealth()
         self.predefined_tasks = PreDefinedTasks()
         self.dashboard_view = DashboardWidget(self)
-        self.calendar_view = CalendarWidget()
-        self.task_view = TaskWidget()
-        self.settings_view = SettingsWidget()
 
+        # Only dashboard built up front; secondary views built on first navigation, so startup doesn't pay for them
         self.stacked_widget = QStackedWidget()
         self.stacked_widget.addWidget(self.dashboard_view)
-        self.stacked_widget.addWidget(self.calendar_view)
-        self.stacked_widget.addWidget(self.task_view)
-        self.stacked_widget.addWidget(self.settings_view)
         self.setCentralWidget(self.stacked_widget)
+        self._views = {"Dashboard": self.dashboard_view}  # View name -> widget, for views built so far
 
         # Setup menu & status bar
         self.create_menu_bar()
@@ -71,39 +109,221 @@ class MainWindow(QMainWindow):
 
         # Set initial view
         self.stacked_widget.setCurrentWidget(self.dashboard_view)
+        if prewarm_views:
+            QTimer.singleShot(0, self.prewarm_views)
 
         # Load tasks after all components are initialized
-        self.tasks = self.load_tasks()  # This will use dashboard_view, so it must be initialized first
+        self.load_worker = None
+        self.loading_complete = not async_load
+        if async_load:
+            self.load_tasks_async()  # Rows & health values stream in while window already showing
+            return
+        self.load_tasks()  # This will use dashboard_view, so it must be initialized first
+        if self.change_recorder:
+            self.change_recorder.track(self.tasks)
 
         # Additional setup as required
         self.dashboard_view.refresh_task_table(self.tasks)
         self.recalculate_health_statuses()
 
+    @property
+    def tasks(self):
+        """
+        :return: list of Task - Tasks in window's registry, in order added.
+        """
+        return self.registry.tasks()
+
+    @property
+    def calendar_view(self):
+        """
+        :return: CalendarWidget - Calendar view, built on first access.
+        """
+        return self.view("Calendar")
+
+    @property
+    def task_view(self):
+        """
+        :return: TaskWidget - Task list view, built on first access.
+        """
+        return self.view("Tasks")
+
+    @property
+    def settings_view(self):
+        """
+        :return: SettingsWidget - Settings view, built on first access.
+        """
+        return self.view("Settings")
+
+    def view(self, name):
+        """
+        Returns view, building it & adding it to stacked widget first time it's requested.
+
+        :param name: str - One of VIEWS.
+        :return: QWidget - View widget.
+        """
+        widget = self._views.get(name)
+        if widget is None:
+            with span(f'main.build_view.{name}'):
+                widget = self._create_view(name)
+                self.stacked_widget.addWidget(widget)
+            self._views[name] = widget
+        return widget
+
+    def _create_view(self, name):
+        """
+        Builds secondary view from current task list.
+        """
+        if name == "Calendar":
+            widget = CalendarWidget()
+            widget.set_tasks(self.tasks)
+            return widget
+        if name == "Tasks":
+            return TaskWidget(self)  # Filters scheduler's tasks when first shown
+        if name == "Settings":
+            return SettingsWidget()
+        raise ValueError(f"Unknown view: {name}")
+
+    def show_view(self, name):
+        """
+        Switches stacked widget to view, building view if needed.
+
+        :param name: str - One of VIEWS.
+        """
+        self.stacked_widget.setCurrentWidget(self.view(name))
+
+    def prewarm_views(self, names=None):
+        """
+        Builds views not yet built, one per event loop tick, so idle time absorbs construction cost w/o blocking
+        dashboard's first paint.
+
+        :param names: list of str - Views to build, defaults all views.
+        """
+        pending = [name for name in (names or self.VIEWS) if name not in self._views]
+        if pending:
+            self.view(pending[0])
+            if len(pending) > 1:
+                QTimer.singleShot(0, lambda: self.prewarm_views(pending[1:]))
+
     def load_tasks(self):
         """
         Loads tasks into scheduler, either from JSON file if available, or from predefined data.
         """
-        loaded_tasks = self.load_tasks_from_file()
+        with span('main.load_tasks_from_file'):
+            loaded_tasks = self.load_tasks_from_file()
         if not loaded_tasks:  # If no tasks are loaded (i.e., file doesn't exist or is empty)
             # Predefined tasks are loaded only if no existing tasks are found
-            task1 = Task("Replace air filters", "2024-07-28", "HVAC", "monthly", priority=1)
-            task2 = Task("Check thermostat operation", "2025-04-29", "HVAC", "annually", priority=2)
-            loaded_tasks = [task1, task2]
+            loaded_tasks = self.create_default_tasks()
 
-        for task in loaded_tasks:
-            self.scheduler.schedule_task(task)
+        self.scheduler.schedule_tasks(loaded_tasks)  # Sorts once instead of once per task
         self.refresh_task_view()
         return loaded_tasks  # Ensures return statement
 
     @staticmethod
-    def load_tasks_from_file():
-        """Tries to load tasks from 'tasks.json' file."""
-        try:
-            with open('tasks.json', 'r') as file:
-                tasks_data = json.load(file)
-                return [Task.from_dict(data) for data in tasks_data]
-        except FileNotFoundError:
-            return []  # Return empty list if no tasks are stored yet
+    def create_default_tasks():
+        """Creates starter tasks used when no tasks are stored yet."""
+        task1 = Task("Replace air filters", "2024-07-28", "HVAC", "monthly", priority=1)
+        task2 = Task("Check thermostat operation", "2025-04-29", "HVAC", "annually", priority=2)
+        return [task1, task2]
+
+    def load_tasks_async(self, filename=None, chunk_size=500):
+        """
+        Loads tasks on QThreadPool worker; parsed records arrive in chunks & are appended to scheduler, table,
+        & health values as they come. Status bar shows progress & Cancel button.
+
+        :param filename: str - Task file to load, defaults window's tasks file.
+        :param chunk_size: int - # of tasks added to UI per chunk.
+        """
+        self.loading_complete = False
+        self._loaded_records = []
+        self._loaded_tasks = []  # Tasks created from _loaded_records, in same order
+        self.load_worker = TaskLoadWorker(filename or self.tasks_file, chunk_size)
+        self.load_worker.signals.chunk_loaded.connect(self.handle_loaded_chunk)
+        self.load_worker.signals.progress.connect(self.handle_load_progress)
+        self.load_worker.signals.finished.connect(self.handle_load_finished)
+        self.load_worker.signals.failed.connect(self.handle_load_failed)
+
+        self.load_progress_bar.setRange(0, 0)  # Busy indicator until total known
+        self.load_progress_bar.show()
+        self.cancel_load_button.show()
+        self.statusBar().showMessage("Loading tasks...")
+        for category in CATEGORIES:
+            self.refresh_coalescer.mark_category_dirty(category)  # Health panel shown before first chunk arrives
+        QThreadPool.globalInstance().start(self.load_worker)
+
+    def cancel_loading(self):
+        """
+        Stops background loading after current chunk; tasks already loaded stay visible.
+        """
+        if self.load_worker:
+            self.load_worker.cancel()
+
+    def handle_loaded_chunk(self, records):
+        """
+        Creates tasks for one chunk of records & appends them to scheduler & table, marking categories dirty so
+        health recalculated once per event loop tick.
+        """
+        with span('main.handle_loaded_chunk'):
+            tasks = [Task.from_dict(data) for data in records]
+            self._loaded_records.extend(records)
+            self._loaded_tasks.extend(tasks)
+            self.add_loaded_tasks(tasks)
+
+    def add_loaded_tasks(self, tasks):
+        """
+        Appends already ordered tasks to scheduler (& so task registry) & table.
+        """
+        self.scheduler.schedule_tasks(tasks)
+        self.dashboard_view.append_tasks_to_table(tasks)
+        if self.change_recorder:
+            self.change_recorder.track(tasks)
+        if "Calendar" in self._views:
+            self.calendar_view.add_tasks(tasks)
+        if "Tasks" in self._views:
+            self.task_view.tasks_changed()
+        for category in {task.category for task in tasks}:
+            self.refresh_coalescer.mark_category_dirty(category)
+
+    def handle_load_progress(self, loaded, total):
+        """
+        Updates progress indicator w/ # of tasks loaded so far.
+        """
+        self.load_progress_bar.setRange(0, total)
+        self.load_progress_bar.setValue(loaded)
+
+    def handle_load_finished(self, completed):
+        """
+        Links prerequisites across all loaded tasks & hides progress indicator. Starter tasks added if file held
+        no tasks.
+
+        :param completed: bool - False if loading cancelled before all tasks delivered.
+        """
+        self.load_progress_bar.hide()
+        self.cancel_load_button.hide()
+        self.load_worker = None
+        if not completed:
+            self.statusBar().showMessage(f"Loading cancelled after {len(self.registry)} tasks")
+            return  # loading_complete stays False so partial task list never overwrites file
+        self.loading_complete = True
+        link_prerequisites(self._loaded_tasks, self._loaded_records)
+        self.scheduler.link_prerequisites(self._loaded_tasks)  # Drops prerequisites that would form cycle
+        self._loaded_records = []
+        self._loaded_tasks = []
+        if not self.registry:
+            self.add_loaded_tasks(self.create_default_tasks())
+        self.statusBar().showMessage("Ready")
+
+    def handle_load_failed(self, message):
+        """
+        Hides progress indicator & reports why task file couldn't be loaded.
+        """
+        self.load_progress_bar.hide()
+        self.cancel_load_button.hide()
+        self.load_worker = None
+        self.statusBar().showMessage(f"Failed to load tasks: {message}")
+
+    def load_tasks_from_file(self):
+        """Tries to load tasks from window's tasks file, 'tasks.json' by default."""
+        return load_tasks(self.tasks_file)  # Returns empty list if no tasks are stored yet
 
     def create_menu_bar(self):
         """
@@ -115,6 +335,28 @@ class MainWindow(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+        edit_menu = menu_bar.addMenu("&Edit")
+        self.undo_action = QAction("&Undo", self)
+        self.undo_action.setShortcut(QKeySequence.Undo)
+        self.undo_action.triggered.connect(self.undo)
+        edit_menu.addAction(self.undo_action)
+        self.redo_action = QAction("&Redo", self)
+        self.redo_action.setShortcut(QKeySequence.Redo)
+        self.redo_action.triggered.connect(self.redo)
+        edit_menu.addAction(self.redo_action)
+        edit_menu.addSeparator()
+        remove_action = QAction("Re&move Selected Tasks", self)
+        remove_action.setShortcut(QKeySequence.Delete)
+        remove_action.triggered.connect(self.remove_selected_tasks)
+        edit_menu.addAction(remove_action)
+        self.update_edit_actions()
+
+        view_menu = menu_bar.addMenu("&View")
+        for name in self.VIEWS:
+            view_action = QAction(name, self)
+            view_action.triggered.connect(lambda checked=False, view_name=name: self.show_view(view_name))
+            view_menu.addAction(view_action)
+
     def create_status_bar(self):
         """
         Creates status bar for application window.
@@ -122,18 +364,24 @@ class MainWindow(QMainWindow):
         status_bar = self.statusBar()
         status_bar.showMessage("Ready")
 
+        # Background loading indicator, shown only while tasks load
+        self.load_progress_bar = QProgressBar()
+        self.load_progress_bar.setMaximumWidth(200)
+        self.cancel_load_button = QPushButton("Cancel")
+        self.cancel_load_button.clicked.connect(self.cancel_loading)
+        status_bar.addPermanentWidget(self.load_progress_bar)
+        status_bar.addPermanentWidget(self.cancel_load_button)
+        self.load_progress_bar.hide()
+        self.cancel_load_button.hide()
+
     def get_predefined_tasks(self):
         """
         Retrieves predefined tasks & converts them into Task objects for scheduler.
         """
-        predefined_task_objects = []
-        for category in CATEGORIES:
-            tasks = PreDefinedTasks.get_tasks_for_category(category)
-            for task_info in tasks:
-                task_description, frequency = task_info
-                task_due_date = self.calculate_due_date_based_on_frequency(frequency)
-                predefined_task_objects.append(Task(task_description, task_due_date, category, frequency))
-        return predefined_task_objects
+        instantiator = TemplateInstantiator(CATEGORIES)
+        due_dates = instantiator.due_dates_for(datetime.now())  # Computed once per distinct frequency
+        return [Task(task_description, task_due_date, category, frequency)
+                for (category, task_description, frequency, _), task_due_date in zip(instantiator.templates, due_dates)]
 
     @staticmethod
     def calculate_due_date_based_on_frequency(frequency):
@@ -142,69 +390,219 @@ class MainWindow(QMainWindow):
 
         :param frequency: str - Frequency of task.
         :return: str - Due date of task formatted as 'YYYY-MM-DD'.
+        :raises ValueError: If frequency isn't recognized.
         """
-        due_date = datetime.now()
-        if frequency == 'weekly':
-            due_date += timedelta(weeks=1)
-        elif frequency == 'monthly':
-            due_date += timedelta(days=30)
-        elif frequency == '3 months':
-            due_date += timedelta(days=30 * 3)
-        elif frequency == '6 months':
-            due_date += timedelta(days=30 * 6)
-        elif frequency == 'annually':
-            due_date = due_date.replace(year=due_date.year + 1)
-        elif frequency == '2 years':
-            due_date = due_date.replace(year=due_date.year + 2)
-        elif frequency == '3 years':
-            due_date = due_date.replace(year=due_date.year + 3)
-        else:
-            raise ValueError(f"Unhandled frequency: {frequency}")
-
+        due_date = parse_frequency(frequency).advance(datetime.now())
         return due_date.strftime('%Y-%m-%d')
 
     def handle_new_task(self, task):
         """
-        Adds new task to system & updates UI components accordingly.
+        Adds new task to system & updates UI components accordingly, recording addition for undo.
         """
-        if task not in self.tasks:
-            self.tasks.append(task)
-            self.dashboard_view.refresh_task_table(self.tasks)
-            self.recalculate_health_statuses()
+        if task not in self.registry:
+            self._add_task(task)
+            self.record_edit("Add Task", [TaskEdit(task, None, snapshot(task))])
 
-    def task_changed(self):
+    def remove_tasks(self, tasks):
+        """
+        Removes tasks from system & UI components as single undoable step.
+
+        :param tasks: iterable of Task - Tasks to remove.
+        """
+        edits = []
+        for task in tasks:
+            if task in self.registry:
+                before = snapshot(task)
+                edits.append(TaskEdit(task, before, None, self._remove_task(task)))  # Undo relinks dependents
+        self.record_edit("Remove Task" if len(edits) == 1 else "Remove Tasks", edits)
+
+    def remove_selected_tasks(self):
+        """
+        Removes tasks selected in dashboard table.
         """
-        Handles updates when task properties change, updating health status & refreshing task table.
+        model = self.dashboard_view.task_model
+        rows = sorted({index.row() for index in self.dashboard_view.task_table.selectionModel().selectedIndexes()})
+        self.remove_tasks([model.task_at(row) for row in rows])
+
+    def change_task_priority(self, task, priority):
+        """
+        Sets task's priority & re-sorts scheduler, recording change for undo.
+
+        :param task: Task - Task to change.
+        :param priority: int - New priority (1-3).
         """
-        print("Task changed signal received")
+        before = snapshot(task)
+        task.set_priority(priority)  # Emits task_updated, so row & views refresh w/ next batch
+        self.scheduler.reschedule_task(task)
+        self.record_edit("Change Priority", [TaskEdit(task, before, snapshot(task))])
+
+    def _add_task(self, task):
+        self.scheduler.schedule_task(task)  # Registers task, so task list & scheduler can't drift apart
+        if self.change_recorder:
+            self.change_recorder.added([task])
+        self.dashboard_view.add_task_to_table(task)  # Full refresh kept for bulk loads
+        if "Calendar" in self._views:
+            self.calendar_view.add_tasks([task])
+        if "Tasks" in self._views:
+            self.task_view.tasks_changed()
         self.recalculate_health_statuses()
-        # self.dashboard_view.refresh_task_table(self.tasks)
 
-    @staticmethod
-    def mark_task_as_complete(task, is_completed):
+    def _remove_task(self, task):
+        dependents = self.scheduler.remove_task(task)
+        self.subscriptions.unsubscribe_task(task)
+        if self.change_recorder:
+            self.change_recorder.removed([task])
+        self.dashboard_view.task_model.remove_task(task)
+        if "Calendar" in self._views:
+            self.calendar_view.remove_tasks([task])
+        if "Tasks" in self._views:
+            self.task_view.tasks_changed()
+        self.recalculate_health_statuses([task.category])
+        return dependents
+
+    def restore_task(self, task, state, dependents=()):
+        """
+        Puts task back into recorded state for undo or redo: removes task if state None, re-adds task if it was
+        removed (relinking tasks that depended on it), & otherwise restores due date, completion, & priority
+        through scheduler.
+
+        :param task: Task - Task to restore.
+        :param state: tuple or None - State from history.snapshot, or None if task shouldn't exist.
+        :param dependents: iterable of Task - Tasks that depended on task when it was removed.
+        """
+        if state is None:
+            if task in self.registry:
+                self._remove_task(task)
+            return
+        due_date, is_completed, priority = state
+        if task not in self.registry:
+            task.due_date, task.is_completed, task.priority = state
+            self._add_task(task)
+            for dependent in dependents:
+                if dependent in self.registry:
+                    try:
+                        self.scheduler.add_dependency(task, dependent)
+                    except ValueError:
+                        pass  # Later edits made link cyclic
+                else:
+                    dependent.add_prerequisite(task)  # Linked if dependent itself restored later
+            return
+        task.due_date = due_date
+        if bool(is_completed) != bool(task.is_completed):
+            if is_completed:
+                self.scheduler.task_completed(task)
+            else:
+                self.scheduler.task_reset(task)
+        task.is_completed = is_completed  # Exact stored value, e.g. check state saved by older versions
+        task.set_priority(priority)
+        self.scheduler.reschedule_task(task)
+        task.task_updated.emit()
+
+    def record_edit(self, label, edits):
         """
-        Toggles task's completion status & emits signal indicating task updated.
+        Records step in edit history & refreshes Undo/Redo menu items.
         """
-        task.is_completed = is_completed
+        self.history.record(label, edits)
+        self.update_edit_actions()
+
+    def undo(self):
+        """
+        Reverts latest task edit.
+        """
+        label = self.history.undo(self)
+        if label:
+            self.statusBar().showMessage(f"Undid {label}")
+        self.update_edit_actions()
+
+    def redo(self):
+        """
+        Reapplies latest undone task edit.
+        """
+        label = self.history.redo(self)
+        if label:
+            self.statusBar().showMessage(f"Redid {label}")
+        self.update_edit_actions()
+
+    def update_edit_actions(self):
+        """
+        Enables Undo/Redo menu items only when there's step to undo or redo, naming that step.
+        """
+        undo_label, redo_label = self.history.undo_label(), self.history.redo_label()
+        self.undo_action.setEnabled(undo_label is not None)
+        self.undo_action.setText(f"&Undo {undo_label}" if undo_label else "&Undo")
+        self.redo_action.setEnabled(redo_label is not None)
+        self.redo_action.setText(f"&Redo {redo_label}" if redo_label else "&Redo")
+
+    def task_changed(self):
+        """
+        Handles updates when task properties change by marking task dirty; table rows & health status refreshed
+        once per batch in apply_changes.
+        """
+        instrumentation.count('main.task_changed')
+        task = self.sender()
+        if isinstance(task, Task):
+            self.refresh_coalescer.mark_task_dirty(task)
+        else:
+            for category in CATEGORIES:
+                self.refresh_coalescer.mark_category_dirty(category)
+
+    def apply_changes(self, change_set):
+        """
+        Applies one batch of task changes: repaints changed rows & recalculates health of changed categories.
+
+        :param change_set: ChangeSet - Tasks & categories changed since last batch.
+        """
+        instrumentation.count('main.apply_changes.tasks', len(change_set.tasks))
+        with span('main.apply_changes'):
+            self.scheduler.touch(*change_set.tasks)  # Covers tasks changed outside scheduler, e.g. complete_task
+            for task in change_set.tasks:
+                self.dashboard_view.task_model.task_changed(task)  # Repaints only changed row
+            if "Calendar" in self._views:
+                self.calendar_view.update_tasks(change_set.tasks)  # Re-buckets only changed tasks' occurrences
+            if "Tasks" in self._views:
+                self.task_view.tasks_changed()  # Completion changes can move tasks in or out of filter
+            if self.change_recorder:
+                self.change_recorder.changed(change_set.tasks)  # One feed batch per coalesced change batch
+            self.recalculate_health_statuses(change_set.categories)
+
+    def mark_task_as_complete(self, task, is_completed):
+        """
+        Toggles task's completion status through scheduler, so tasks depending on it unblock or block again,
+        & emits signal indicating task updated. Recorded for undo, so accidental checkbox click can be reverted.
+        """
+        before = snapshot(task)
+        if is_completed:
+            self.scheduler.task_completed(task)
+        else:
+            self.scheduler.task_reset(task)
         task.task_updated.emit()
+        self.record_edit("Complete Task" if is_completed else "Reset Task", [TaskEdit(task, before, snapshot(task))])
 
-    def recalculate_health_statuses(self):
+    def recalculate_health_statuses(self, categories=None):
         """
-        Recalculates health status based on completion state of tasks w/ each category.
+        Recalculates health status based on completion state of tasks w/ each category. Categories unchanged since
+        last calculation served from reports cache; changed ones recalculated in single pass over tasks.
+
+        :param categories: iterable of str - Categories to recalculate, defaults all categories.
         """
-        for category in CATEGORIES:
-            completed_tasks = sum(1 for task in self.tasks if task.category == category and task.is_completed)
-            total_tasks = sum(1 for task in self.tasks if task.category == category)
-            health_status = (completed_tasks / total_tasks) * 100 if total_tasks else 0
-            self.category_health.set_health_status(category, health_status)
-        self.dashboard_view.refresh_health_status(self.category_health.health_statuses)
+        with span('main.recalculate_health_statuses'):
+            categories = CATEGORIES if categories is None else [c for c in CATEGORIES if c in set(categories)]
+            for category, health_status in self.reports.health_statuses(categories).items():
+                self.category_health.set_health_status(category, health_status)
+            self.dashboard_view.refresh_health_status(self.category_health.health_statuses)
 
     def closeEvent(self, event):
         """
         Performs cleanup actions before application window closed.
         Automatically called when window attempts close.
         """
-        self.save_state()  # Saves current state before closing
+        if self.save_on_close:
+            self.save_state()  # Saves current state before closing
+            if instrumentation.enabled:
+                instrumentation.log_summary()
+                instrumentation.export_json()
+        if self.change_recorder:
+            self.change_recorder.writer.close()
         super().closeEvent(event)
 
     def save_state(self):
@@ -212,8 +610,12 @@ class MainWindow(QMainWindow):
         Saves current state of application to persistent storage.
         Saves all tasks to JSON file.
         """
-        if hasattr(self, 'tasks') and self.tasks:  # Check if tasks exist & not empty
-            save_tasks(self.tasks)  # Save tasks to JSON file
+        if not getattr(self, 'loading_complete', True):
+            self.cancel_loading()
+            logger.warning("Tasks not fully loaded; skipping save to avoid overwriting stored tasks.")
+        elif self.registry:  # Check tasks exist
+            with span('main.save_tasks'):
+                save_tasks(self.tasks, self.tasks_file)  # Save tasks to JSON file
         else:
             print("No tasks to save or task list not initialized.")
 
@@ -221,15 +623,10 @@ class MainWindow(QMainWindow):
         """
         Refreshes task view by reloading tasks from scheduler into task table UI component.
         """
-        # Clears existing tasks in UI
-        self.dashboard_view.task_table.setRowCount(0)
-
-        # Gets all tasks from scheduler in sorted order
-        tasks = self.scheduler.get_all_tasks()
-
-        # Iterate through sorted tasks & add them to UI
-        for task in tasks:
-            self.dashboard_view.add_task_to_table(task)
+        # Gets all tasks from scheduler in sorted order & replaces table rows w/ them
+        self.dashboard_view.refresh_task_table(self.scheduler.get_all_tasks())
+        if "Tasks" in self._views:
+            self.task_view.tasks_changed()
 
 
 class DashboardWidget(QWidget):
@@ -253,12 +650,20 @@ class DashboardWidget(QWidget):
 
         self.health_layout = QVBoxLayout()
         self.layout.addLayout(self.health_layout)
+        self.health_rows = {}  # Category -> (QLabel, QProgressBar), kept between refreshes
+        self.health_values = {}  # Category -> last displayed status
+        self.animate_health = False  # Animates progress bars toward new values when True
+        self._health_animations = {}  # Category -> running QPropertyAnimation
 
         # Task Table Configuration
         # ------------------------------------------------------------
-        self.task_table = QTableWidget()
-        self.task_table.setColumnCount(5)  # Including Priority column
-        self.task_table.setHorizontalHeaderLabels(["Priority", "Description", "Due Date", "Category", "Completed"])
+        # Model/view table: only visible rows rendered, completion drawn through check state role
+        self.task_model = TaskTableModel()
+        self.task_model.completion_toggled.connect(self.main_window.mark_task_as_complete)
+        self.task_model.priority_edited.connect(self.main_window.change_task_priority)
+        self.task_table = QTableView()
+        self.task_table.setModel(self.task_model)
+        self.task_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)  # Uniform rows, no per-row sizing
         self.layout.addWidget(self.task_table)
 
         # Task Addition & Management
@@ -277,47 +682,85 @@ class DashboardWidget(QWidget):
     def refresh_health_status(self, health_statuses):
         """
         Updates display of health statuses for each category based on completion rate of associated tasks.
+        Widgets created once per category; only categories whose value changed are updated.
         """
-        while self.health_layout.count():
-            child = self.health_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
         for category, status in health_statuses.items():
-            label = QLabel(f"{category}: {status}%")
-            self.health_layout.addWidget(label)
+            if self.health_values.get(category) == status:
+                continue
+            self.health_values[category] = status
+            row = self.health_rows.get(category)
+            if row is None:
+                row = self.health_rows[category] = self._create_health_row()
+            label, progress_bar = row
+            label.setText(f"{category}: {status}%")
+            self._set_health_bar_value(category, progress_bar, round(status))
+
+        for category in set(self.health_rows) - set(health_statuses):
+            label, _ = self.health_rows.pop(category)
+            self.health_values.pop(category, None)
+            label.parentWidget().deleteLater()  # Row container owns label & progress bar
+
+    def _create_health_row(self):
+        """
+        Creates persistent label & progress bar for one category.
+        """
+        label = QLabel()
+        progress_bar = QProgressBar()
+        progress_bar.setRange(0, 100)
+        progress_bar.setTextVisible(False)
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.addWidget(label)
+        row_layout.addWidget(progress_bar)
+        self.health_layout.addWidget(row)
+        return label, progress_bar
+
+    def _set_health_bar_value(self, category, progress_bar, value):
+        """
+        Sets progress bar value, animating from current value if animate_health enabled.
+        """
+        animation = self._health_animations.pop(category, None)
+        if animation:
+            animation.stop()
+        if not self.animate_health:
+            progress_bar.setValue(value)
+            return
+        animation = QPropertyAnimation(progress_bar, b"value", self)
+        animation.setDuration(250)
+        animation.setStartValue(progress_bar.value())
+        animation.setEndValue(value)
+        animation.start()
+        self._health_animations[category] = animation
 
     def refresh_task_table(self, tasks):
         """
         Refreshes task table w/ updated task data, ensuring table reflects current task priorities & statuses.
         """
-        print("Starting to refresh task table...")
-        self.task_table.setRowCount(0)
-        for task in sorted(tasks, key=lambda t: t.priority):
-            self.add_task_to_table(task)
-        print("Resizing rows...")
-        self.task_table.resizeRowsToContents()
-        print("Finished refreshing task table.")
+        with span('dashboard.refresh_task_table'):
+            self.task_model.set_tasks(sorted(tasks, key=lambda t: t.priority))
+            # One connection per task however often table refreshed; tasks no longer shown disconnected
+            self.main_window.subscriptions.sync('dashboard', self.task_model.tasks, self.main_window.task_changed)
 
     def add_task_to_table(self, task):
         """
-        Adds single task row to task table, including interactive components like checkboxes for task completion.
+        Inserts single task row after rows of same or higher priority, where refresh_task_table would put it,
+        w/o resetting model; completion checkbox drawn by view from model's check state.
         """
-        row_position = self.task_table.rowCount()
-        self.task_table.insertRow(row_position)
+        tasks = self.task_model.tasks
+        row = len(tasks)
+        while row and tasks[row - 1].priority > task.priority:
+            row -= 1
+        self.task_model.insert_task(task, row)
+        self.main_window.subscriptions.subscribe(task, 'dashboard', self.main_window.task_changed)
 
-        self.task_table.setItem(row_position, 0, QTableWidgetItem(str(task.priority)))
-        self.task_table.setItem(row_position, 1, QTableWidgetItem(task.description))
-        self.task_table.setItem(row_position, 2, QTableWidgetItem(task.due_date))
-        self.task_table.setItem(row_position, 3, QTableWidgetItem(task.category))
-
-        complete_checkbox = QCheckBox()
-        complete_checkbox.setChecked(task.is_completed)
-        complete_checkbox.stateChanged.connect(
-            lambda state, t=task: self.main_window.mark_task_as_complete(t, state))
-        self.task_table.setCellWidget(row_position, 4, complete_checkbox)
-
-        task.task_updated.connect(self.main_window.task_changed)
+    def append_tasks_to_table(self, tasks):
+        """
+        Appends batch of tasks as rows w/ single model insert, e.g. while tasks stream in from background load.
+        """
+        self.task_model.append_tasks(tasks)
+        for task in tasks:
+            self.main_window.subscriptions.subscribe(task, 'dashboard', self.main_window.task_changed)
 
     def open_add_task_dialog(self):
         """
@@ -339,23 +782,178 @@ class DashboardWidget(QWidget):
             self.add_task_to_table(new_task)
 
 
-# Placeholder widgets for Calendar, Tasks, Settings
 class CalendarWidget(QWidget):
+    """
+    Month & week calendar of task occurrences. Days w/ tasks highlighted on month page, & selected day or week
+    listed below. Backed by OccurrenceIndex, so changing month is cached lookup & task changes touch only their days.
+    """
     def __init__(self):
         super().__init__()
+        self.index = OccurrenceIndex()
+        self._highlighted_days = []
+
         layout = QVBoxLayout()
-        label = QLabel("Calendar View")
-        layout.addWidget(label)
+        self.mode_selector = QComboBox()
+        self.mode_selector.addItems(["Month", "Week"])
+        self.mode_selector.currentTextChanged.connect(self.show_selection)
+        layout.addWidget(self.mode_selector)
+
+        self.calendar = QCalendarWidget()
+        self.calendar.setFirstDayOfWeek(Qt.Monday)
+        self.calendar.currentPageChanged.connect(self.show_month)
+        self.calendar.selectionChanged.connect(self.show_selection)
+        layout.addWidget(self.calendar)
+
+        self.occurrence_list = QListWidget()
+        layout.addWidget(self.occurrence_list)
         self.setLayout(layout)
 
+    def set_tasks(self, tasks):
+        """
+        Replaces indexed tasks & redraws current month.
+        """
+        self.index.clear()
+        self.index.add_tasks(tasks)
+        self.refresh()
+
+    def add_tasks(self, tasks):
+        """
+        Indexes new tasks & redraws current month.
+        """
+        self.index.add_tasks(tasks)
+        self.refresh()
+
+    def remove_tasks(self, tasks):
+        """
+        Drops removed tasks' occurrences & redraws current month.
+        """
+        for task in tasks:
+            if task in self.index:
+                self.index.remove_task(task)
+        self.refresh()
+
+    def update_tasks(self, tasks):
+        """
+        Re-indexes changed tasks, invalidating only days they moved from or to, & redraws current month.
+        """
+        for task in tasks:
+            if task in self.index:
+                self.index.update_task(task)
+        self.refresh()
+
+    def refresh(self):
+        """
+        Redraws displayed month & occurrence list.
+        """
+        self.show_month(self.calendar.yearShown(), self.calendar.monthShown())
+        self.show_selection()
+
+    def show_month(self, year, month):
+        """
+        Highlights days w/ task occurrences on displayed month page, using cached month grid.
+        """
+        for day in self._highlighted_days:
+            self.calendar.setDateTextFormat(day, QTextCharFormat())
+        self._highlighted_days = []
+        for week in self.index.month_grid(year, month):
+            for day, tasks in week:
+                if tasks:
+                    busy_format = QTextCharFormat()
+                    busy_format.setFontWeight(QFont.Bold)
+                    busy_format.setToolTip("\n".join(task.description for task in tasks))
+                    qdate = QDate(day.year, day.month, day.day)
+                    self.calendar.setDateTextFormat(qdate, busy_format)
+                    self._highlighted_days.append(qdate)
+
+    def show_selection(self):
+        """
+        Lists tasks for selected day (Month mode) or for each day of selected week (Week mode).
+        """
+        selected = self.calendar.selectedDate()
+        day = datetime(selected.year(), selected.month(), selected.day()).date()
+        days = self.index.week(day) if self.mode_selector.currentText() == "Week" else [(day, self.index.tasks_on(day))]
+        self.occurrence_list.clear()
+        for occurrence_day, tasks in days:
+            for task in tasks:
+                self.occurrence_list.addItem(f"{occurrence_day:%a %Y-%m-%d}  {task.description} ({task.category})")
+
 
 class TaskWidget(QWidget):
-    def __init__(self):
+    """
+    Filterable list of all tasks in scheduler order. Category, priority, & completion filters plus description
+    search go through IncrementalTaskFilter, so narrowing filter (e.g. typing into search box) only rescans
+    previous result & rows never re-sorted.
+    """
+    ALL = "All"
+    STATUSES = {"All": None, "Open": False, "Completed": True}
+
+    def __init__(self, main_window):
         super().__init__()
-        layout = QVBoxLayout()
-        label = QLabel("Task View")
-        layout.addWidget(label)
-        self.setLayout(layout)
+        self.main_window = main_window
+        self.task_filter = IncrementalTaskFilter(main_window.scheduler.get_all_tasks)
+        self._stale = True  # Filter reapplied when view next shown
+
+        layout = QVBoxLayout(self)
+        filter_layout = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search descriptions")
+        self.search_edit.textChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.search_edit)
+
+        self.category_selector = QComboBox()
+        self.category_selector.addItems([self.ALL] + CATEGORIES)
+        self.priority_selector = QComboBox()
+        self.priority_selector.addItems([self.ALL, "1", "2", "3"])
+        self.status_selector = QComboBox()
+        self.status_selector.addItems(list(self.STATUSES))
+        for selector in (self.category_selector, self.priority_selector, self.status_selector):
+            selector.currentTextChanged.connect(self.apply_filter)
+            filter_layout.addWidget(selector)
+        layout.addLayout(filter_layout)
+
+        self.task_model = TaskTableModel()
+        self.task_model.completion_toggled.connect(self.main_window.mark_task_as_complete)
+        self.task_model.priority_edited.connect(self.main_window.change_task_priority)
+        self.task_table = QTableView()
+        self.task_table.setModel(self.task_model)
+        self.task_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        layout.addWidget(self.task_table)
+
+    def current_filter(self):
+        """
+        :return: TaskFilter - Criteria currently selected in filter controls.
+        """
+        category = self.category_selector.currentText()
+        priority = self.priority_selector.currentText()
+        return TaskFilter(categories=None if category == self.ALL else [category],
+                          priorities=None if priority == self.ALL else [int(priority)],
+                          completed=self.STATUSES[self.status_selector.currentText()],
+                          text=self.search_edit.text())
+
+    def apply_filter(self):
+        """
+        Shows tasks matching current filter controls, refining previous result when filter only narrowed.
+        """
+        self.task_model.set_tasks(self.task_filter.apply(self.current_filter()))
+        self._stale = False
+
+    def tasks_changed(self):
+        """
+        Drops cached filter result after tasks added or changed. Visible rows refreshed now, hidden view on next show.
+        """
+        self.task_filter.invalidate()
+        if self.isVisible():
+            self.apply_filter()
+        else:
+            self._stale = True
+
+    def showEvent(self, event):
+        if self._stale:
+            self.apply_filter()
+        super().showEvent(event)
+
+
+# Placeholder widget for Settings
 
 
 class SettingsWidget(QWidget):
@@ -368,9 +966,13 @@ class SettingsWidget(QWidget):
 
 
 # Main function to run application
-def main():
-    app = QApplication(sys.argv)
-    window = MainWindow()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Home Maintenance Scheduler.")
+    parser.add_argument('--change-feed', metavar='FILE',
+                        help="Publish task changes to this change feed log for other processes; off by default.")
+    args, qt_args = parser.parse_known_args(sys.argv[1:] if argv is None else argv)  # Rest left for Qt
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = MainWindow(async_load=True, prewarm_views=True, change_feed_file=args.change_feed)
     window.show()
     sys.exit(app.exec())
 
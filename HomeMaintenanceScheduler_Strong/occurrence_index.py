@@ -0,0 +1,175 @@
+"""
+* Name:         occurrence_index.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Defines OccurrenceIndex, date-bucketed index (day -> tasks) of task occurrences backing calendar
+*               view, w/ small LRU cache of computed month grids. Index extended lazily as user navigates past
+*               indexed horizon, & task changes invalidate only buckets & month grids they touch.
+* Input:        Tasks, task changes, & requested months, weeks, or days.
+* Output:       Tasks occurring on day, 7-day weeks, & 6-week month grids.
+* BigO:         O(1) per day lookup & cached month, O(42) per uncached month, O(k) per task change w/ k occurrences.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+from collections import OrderedDict
+from datetime import date, timedelta
+from forecast import iter_occurrences
+from frequency import to_date
+
+
+class OccurrenceIndex:
+    """
+    Buckets task occurrences by day over indexed date range & caches month grids built from buckets.
+    """
+    def __init__(self, start=None, horizon_days=365, cache_size=12):
+        """
+        :param start: date or str - First indexed day, defaults first day of current month.
+        :param horizon_days: int - # of days indexed initially; extended on demand.
+        :param cache_size: int - Maximum # of month grids kept in LRU cache.
+        """
+        self.start = to_date(start) if start is not None else date.today().replace(day=1)
+        self.end = self.start + timedelta(days=horizon_days)
+        self.cache_size = cache_size
+        self._buckets = {}  # Day -> dict of tasks (ordered set)
+        self._task_days = {}  # Task -> list of days it occurs on
+        self._month_cache = OrderedDict()  # (year, month) -> month grid
+
+    def __contains__(self, task):
+        return task in self._task_days
+
+    def add_tasks(self, tasks):
+        """
+        Indexes occurrences of tasks within indexed range.
+
+        :param tasks: iterable of Task - Tasks to index; tasks already indexed ignored.
+        """
+        for task in tasks:
+            if task not in self._task_days:
+                self._task_days[task] = []
+                self._index(task, self.start, self.end)
+
+    def add_task(self, task):
+        """
+        Indexes occurrences of single task.
+        """
+        self.add_tasks([task])
+
+    def remove_task(self, task):
+        """
+        Removes task's occurrences & invalidates month grids they appeared in.
+
+        :param task: Task - Task to remove; ignored if not indexed.
+        """
+        for day in self._task_days.pop(task, []):
+            bucket = self._buckets.get(day)
+            if bucket is not None:
+                bucket.pop(task, None)
+                if not bucket:
+                    del self._buckets[day]
+            self._invalidate(day)
+
+    def update_task(self, task):
+        """
+        Re-indexes task after its due date or frequency changed.
+
+        :param task: Task - Changed task.
+        """
+        self.remove_task(task)
+        self.add_task(task)
+
+    def clear(self):
+        """
+        Removes every task & cached grid.
+        """
+        self._buckets.clear()
+        self._task_days.clear()
+        self._month_cache.clear()
+
+    def tasks_on(self, day):
+        """
+        :param day: date or str - Day to look up.
+        :return: list of Task - Tasks occurring on day.
+        """
+        day = to_date(day)
+        self._ensure_indexed(day)
+        return list(self._buckets.get(day, ()))
+
+    def week(self, day):
+        """
+        Returns Monday-to-Sunday week containing day.
+
+        :param day: date or str - Any day in week.
+        :return: list of (date, list of Task) - 7 days w/ their tasks.
+        """
+        day = to_date(day)
+        monday = day - timedelta(days=day.weekday())
+        self._ensure_indexed(monday + timedelta(days=6))
+        return [(monday + timedelta(days=offset), list(self._buckets.get(monday + timedelta(days=offset), ())))
+                for offset in range(7)]
+
+    def month_grid(self, year, month):
+        """
+        Returns 6-week grid of month as shown by calendar, starting on Monday on or before first of month.
+        Grids cached in LRU order, so revisiting recent months is single lookup.
+
+        :param year: int - Year of month.
+        :param month: int - Month number, 1-12.
+        :return: list of list of (date, tuple of Task) - 6 weeks of 7 days.
+        """
+        key = (year, month)
+        grid = self._month_cache.get(key)
+        if grid is not None:
+            self._month_cache.move_to_end(key)
+            return grid
+        first = date(year, month, 1)
+        grid_start = first - timedelta(days=first.weekday())
+        self._ensure_indexed(grid_start + timedelta(days=41))
+        buckets = self._buckets
+        grid = [[(day, tuple(buckets.get(day, ())))
+                 for day in (grid_start + timedelta(days=week * 7 + offset) for offset in range(7))]
+                for week in range(6)]
+        self._month_cache[key] = grid
+        if len(self._month_cache) > self.cache_size:
+            self._month_cache.popitem(last=False)
+        return grid
+
+    def _index(self, task, start, end):
+        """
+        Adds task's occurrences between start & end to buckets.
+        """
+        days = self._task_days[task]
+        try:
+            for day, _ in iter_occurrences(task, start, end):
+                self._buckets.setdefault(day, {})[task] = None
+                days.append(day)
+                self._invalidate(day)
+        except ValueError:
+            pass  # Task w/o valid 'YYYY-MM-DD' due date has no occurrences to show
+
+    def _ensure_indexed(self, day):
+        """
+        Extends indexed range to include day, indexing only newly covered dates.
+        """
+        if day <= self.end:
+            return
+        old_end = self.end
+        self.end = day + timedelta(days=90)  # Extends in quarters so scrolling ahead doesn't extend per month
+        for task in self._task_days:
+            self._index(task, old_end + timedelta(days=1), self.end)
+
+    def _invalidate(self, day):
+        """
+        Drops cached grids that can show day: its own month plus neighbours whose grids spill into it.
+        """
+        month_index = day.year * 12 + day.month - 1
+        for index in (month_index - 1, month_index, month_index + 1):
+            self._month_cache.pop((index // 12, index % 12 + 1), None)
@@ -0,0 +1,213 @@
+"""
+* Name:         portfolio_report.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Nightly health & overdue rollup across portfolio of task files (one per property). Files sent to
+*               ProcessPoolExecutor in chunks, w/ bounded # of chunks in flight, & each worker streams its files
+*               record by record into small per-category aggregates, so no process ever holds all tasks. Partial
+*               aggregates merged in parent as they complete.
+* Input:        Task files or directories of them, worker count, chunk size, in-flight limit, & report date.
+* Output:       JSON report of per-category completion health & overdue counts, plus optional per-file JSON Lines.
+* BigO:         O(n / w) time for n records over w workers, O(c) memory per file summary for c categories.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import date
+from itertools import islice
+from category_health import health_from_counts
+from frequency import to_date
+from task_store import EXTENSIONS, iter_records
+
+
+def iter_task_files(paths):
+    """
+    Lazily lists task files, walking directories for files w/ task file extensions.
+
+    :param paths: iterable of str - Files or directories.
+    :return: generator of str - Task file paths.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, names in os.walk(path):
+                for name in sorted(names):
+                    if os.path.splitext(name)[1].lower() in EXTENSIONS:
+                        yield os.path.join(directory, name)
+        else:
+            yield path
+
+
+def summarize_file(filename, today):
+    """
+    Streams one task file into per-category [completed, total, overdue] counts.
+
+    :param filename: str - Task file.
+    :param today: date - Tasks open & due before this date counted overdue.
+    :return: dict - file, tasks, categories (category -> [completed, total, overdue]), & error (None if read).
+    """
+    categories = {}
+    tasks = 0
+    try:
+        for record in iter_records(filename):
+            entry = categories.get(record['category'])
+            if entry is None:
+                entry = categories[record['category']] = [0, 0, 0]
+            entry[1] += 1
+            if record['is_completed']:
+                entry[0] += 1
+            else:
+                try:
+                    if to_date(record.get('due_date') or '') < today:
+                        entry[2] += 1
+                except ValueError:
+                    pass  # Task w/o valid due date can't be overdue
+            tasks += 1
+    except (OSError, ValueError, KeyError) as error:
+        return {'file': filename, 'tasks': tasks, 'categories': categories, 'error': str(error)}
+    return {'file': filename, 'tasks': tasks, 'categories': categories, 'error': None}
+
+
+def summarize_chunk(filenames, today):
+    """
+    Worker entry point: summarizes chunk of files, amortizing inter-process overhead over several files.
+
+    :param filenames: list of str - Task files.
+    :param today: str - Report date as 'YYYY-MM-DD'.
+    :return: list of dict - One summary per file.
+    """
+    today = to_date(today)
+    return [summarize_file(filename, today) for filename in filenames]
+
+
+class PortfolioTotals:
+    """
+    Merges per-file summaries into portfolio-wide per-category counts.
+    """
+    def __init__(self):
+        self.files = 0
+        self.tasks = 0
+        self.categories = {}  # Category -> [completed, total, overdue]
+        self.errors = {}  # File -> error message
+
+    def merge(self, summary):
+        """
+        Adds one file summary to totals.
+
+        :param summary: dict - Summary from summarize_file.
+        """
+        self.files += 1
+        self.tasks += summary['tasks']
+        if summary['error']:
+            self.errors[summary['file']] = summary['error']
+        for category, counts in summary['categories'].items():
+            entry = self.categories.setdefault(category, [0, 0, 0])
+            for index, value in enumerate(counts):
+                entry[index] += value
+
+    def report(self):
+        """
+        :return: dict - files, tasks, per-category health/completed/total/overdue, & errors.
+        """
+        health = health_from_counts({category: counts[:2] for category, counts in self.categories.items()})
+        return {
+            'files': self.files,
+            'tasks': self.tasks,
+            'overdue': sum(counts[2] for counts in self.categories.values()),
+            'categories': {category: {'health': round(health[category], 1), 'completed': completed, 'total': total,
+                                      'overdue': overdue}
+                           for category, (completed, total, overdue) in sorted(self.categories.items())},
+            'errors': self.errors,
+        }
+
+
+def chunked(iterable, size):
+    """
+    :return: generator of list - Consecutive lists of up to size items.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_report(paths, workers=None, chunk_size=16, max_in_flight=None, today=None, on_file=None):
+    """
+    Summarizes every task file on process pool & merges results.
+
+    :param paths: iterable of str - Task files or directories.
+    :param workers: int - Worker processes, defaults CPU count.
+    :param chunk_size: int - Files per submitted chunk.
+    :param max_in_flight: int - Maximum chunks submitted but not yet merged, defaults 2 per worker.
+    :param today: date or str - Report date, defaults today.
+    :param on_file: callable - Called w/ each file summary as it's merged, e.g. to stream per-file lines.
+    :return: dict - Portfolio report from PortfolioTotals.report.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    today = to_date(today or date.today()).isoformat()
+    totals = PortfolioTotals()
+
+    def collect(futures):
+        for future in futures:
+            for summary in future.result():
+                totals.merge(summary)
+                if on_file:
+                    on_file(summary)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in chunked(iter_task_files(paths), chunk_size):
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(pool.submit(summarize_chunk, chunk, today))
+        collect(pending)  # Iterating futures waits for each
+    return totals.report()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Roll up health & overdue tasks across many task files.")
+    parser.add_argument('paths', nargs='+', help="Task files or directories of task files.")
+    parser.add_argument('--workers', type=int, help="Worker processes, defaults CPU count.")
+    parser.add_argument('--chunk-size', type=int, default=16, help="Files per worker task.")
+    parser.add_argument('--max-in-flight', type=int, help="Chunks in flight at once, defaults 2 per worker.")
+    parser.add_argument('--today', help="Report date (YYYY-MM-DD), defaults today.")
+    parser.add_argument('--per-file', help="Also write per-file summaries to this JSON Lines file.")
+    parser.add_argument('--output', help="Report file; printed to stdout if omitted.")
+    args = parser.parse_args(argv)
+
+    per_file = open(args.per_file, 'w') if args.per_file else None
+    try:
+        on_file = (lambda summary: per_file.write(json.dumps(summary, separators=(',', ':')) + '\n')) \
+            if per_file else None
+        report = run_report(args.paths, args.workers, args.chunk_size, args.max_in_flight, args.today, on_file)
+    finally:
+        if per_file:
+            per_file.close()
+
+    text = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text)
+    else:
+        print(text)
+    return 1 if report['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
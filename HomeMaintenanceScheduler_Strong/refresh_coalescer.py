@@ -0,0 +1,97 @@
+"""
+* Name:         refresh_coalescer.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Defines RefreshCoalescer, which collects dirty tasks & categories as task signals arrive & flushes
+*               them as one ChangeSet on next event loop tick (or after frame interval), so bulk edits of many
+*               tasks cause single health recalculation & repaint instead of one per task.
+* Input:        Tasks & categories marked dirty.
+* Output:       flushed signal carrying one ChangeSet per batch.
+* BigO:         O(1) per dirty mark, O(k) per flush for k distinct dirty items.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class ChangeSet:
+    """
+    Batch of tasks & categories that changed since last flush.
+    """
+    __slots__ = ('tasks', 'categories')
+
+    def __init__(self, tasks, categories):
+        self.tasks = tasks
+        self.categories = categories
+
+
+class RefreshCoalescer(QObject):
+    """
+    Coalesces task change notifications into batches delivered once per event loop tick.
+    """
+    flushed = Signal(object)  # ChangeSet
+
+    def __init__(self, interval_ms=0, parent=None):
+        """
+        Initializes coalescer w/ single-shot timer.
+
+        :param interval_ms: int - Delay before flushing; 0 flushes on next event loop tick, ~16 once per frame.
+        """
+        super().__init__(parent)
+        self._tasks = {}  # Dirty tasks in arrival order (dict used as ordered set)
+        self._categories = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def pending(self):
+        """
+        :return: bool - True if changes waiting to be flushed.
+        """
+        return bool(self._tasks or self._categories)
+
+    def mark_task_dirty(self, task):
+        """
+        Records task & its category as changed & schedules flush.
+
+        :param task: Task - Changed task.
+        """
+        self._tasks[task] = None
+        self._categories.add(task.category)
+        self._schedule()
+
+    def mark_category_dirty(self, category):
+        """
+        Records category as changed w/o specific task, e.g. after task removed.
+
+        :param category: str - Changed category.
+        """
+        self._categories.add(category)
+        self._schedule()
+
+    def flush(self):
+        """
+        Emits pending changes as one ChangeSet immediately; does nothing if no changes pending.
+        """
+        self._timer.stop()
+        if not self.pending:
+            return
+        change_set = ChangeSet(list(self._tasks), self._categories)
+        self._tasks = {}
+        self._categories = set()
+        self.flushed.emit(change_set)
+
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
@@ -0,0 +1,275 @@
+"""
+* Name:         reminders.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Defines ReminderService, asyncio service that fires reminder callbacks when tasks come due. Reminder
+*               times indexed in hierarchical TimingWheel, so service sleeps until next occupied tick instead of
+*               polling tasks, & rescheduled from task_updated signal when Task.complete_task advances due date.
+*               Includes log callback & WebhookNotifier posting JSON to local URL as stand-in for notifications.
+*               Qt loaded only for Task objects w/ signals, so standalone daemon reads task file w/o Qt.
+* Input:        Tasks, reminder callbacks, lead time, & time of day reminders sent.
+* Output:       Reminder objects passed to callbacks at reminder time.
+* BigO:         O(1) amortized per reminder scheduled, cancelled, or fired.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import math
+import time
+import urllib.request
+from datetime import datetime, timedelta
+from datetime import time as time_of_day
+from functools import partial
+from frequency import to_date
+from task_store import iter_records
+from timing_wheel import TimingWheel
+
+logger = logging.getLogger(__name__)
+
+
+class Reminder:
+    """
+    Reminder that task comes due on due date, sent at remind_at.
+    """
+    __slots__ = ('task', 'due_date', 'remind_at')
+
+    def __init__(self, task, due_date, remind_at):
+        self.task = task
+        self.due_date = due_date
+        self.remind_at = remind_at
+
+    def to_dict(self):
+        return {'description': self.task.description, 'category': self.task.category,
+                'due_date': self.due_date.isoformat(), 'remind_at': self.remind_at.isoformat()}
+
+
+class TaskRecord:
+    """
+    Read-only task read straight from task file, so standalone daemon needs neither Task nor Qt.
+    """
+    __slots__ = ('description', 'category', 'due_date')
+
+    def __init__(self, description, category, due_date):
+        self.description = description
+        self.category = category
+        self.due_date = due_date
+
+
+def load_records(filename):
+    """
+    :param filename: str - Task file in any task_store format.
+    :return: list of TaskRecord - Tasks in file order; empty if file doesn't exist.
+    """
+    return [TaskRecord(record.get('description', ''), record.get('category', ''), record.get('due_date'))
+            for record in iter_records(filename)]
+
+
+def log_reminder(reminder):
+    """
+    Reminder callback writing one log line per reminder.
+    """
+    logger.info("Task due %s: %s (%s)", reminder.due_date, reminder.task.description, reminder.task.category)
+
+
+class WebhookNotifier:
+    """
+    Async reminder callback posting reminder as JSON to local webhook, standing in for desktop or phone notification.
+    Request sent on worker thread so event loop never blocks on network.
+    """
+    def __init__(self, url, timeout=5):
+        """
+        :param url: str - Webhook URL, e.g. 'http://127.0.0.1:8080/reminders'.
+        :param timeout: float - Seconds to wait for webhook.
+        """
+        self.url = url
+        self.timeout = timeout
+
+    async def __call__(self, reminder):
+        await asyncio.to_thread(self.post, reminder.to_dict())
+
+    def post(self, payload):
+        request = urllib.request.Request(self.url, data=json.dumps(payload).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'}, method='POST')
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return response.status
+
+
+class ReminderService:
+    """
+    Keeps one pending reminder per task in timing wheel & dispatches them from asyncio loop as they come due.
+    """
+    def __init__(self, callbacks=None, lead_time=timedelta(0), remind_time=time_of_day(9, 0), tick_seconds=60,
+                 clock=time.time, subscriptions=None):
+        """
+        :param callbacks: list of callable - Called w/ each Reminder; coroutine functions awaited. Defaults logging.
+        :param lead_time: timedelta - How long before due date reminder sent.
+        :param remind_time: datetime.time - Time of day on due date (less lead time) reminder sent, defaults 9:00.
+        :param tick_seconds: float - Timing wheel resolution; reminders never sent early, at most one tick late.
+        :param clock: callable - Returns current POSIX timestamp, defaults time.time.
+        :param subscriptions: SubscriptionManager - Registry used to follow task_updated, defaults own registry
+                              created when first task w/ task_updated added.
+        """
+        self.callbacks = list(callbacks) if callbacks is not None else [log_reminder]
+        self.lead_time = lead_time
+        self.remind_time = remind_time
+        self.tick_seconds = tick_seconds
+        self.clock = clock
+        self.subscriptions = subscriptions
+        self.wheel = TimingWheel(current_tick=math.floor(clock() / tick_seconds))
+        self._entries = {}  # Task -> (Timer or None once sent, due date reminder is for)
+        self._wakeup = asyncio.Event()
+        self._running = False
+        self._callback_tasks = set()  # Running async callbacks, referenced until done
+
+    def __len__(self):
+        """
+        :return: int - # of reminders waiting to be sent.
+        """
+        return len(self.wheel)
+
+    def add_tasks(self, tasks):
+        """
+        Schedules reminder at each task's due date & follows task's changes.
+
+        :param tasks: iterable of Task - Tasks to watch.
+        """
+        for task in tasks:
+            self.add_task(task)
+
+    def add_task(self, task):
+        if task in self._entries:
+            return
+        if hasattr(task, 'task_updated'):
+            if self.subscriptions is None:
+                from subscriptions import SubscriptionManager  # Task w/ signals means Qt already loaded
+                self.subscriptions = SubscriptionManager()
+            self.subscriptions.subscribe(task, 'reminders', partial(self.update_task, task))
+        self._schedule(task)
+
+    def remove_task(self, task):
+        """
+        Cancels task's reminder & stops following it.
+        """
+        timer, _ = self._entries.pop(task, (None, None))
+        if timer is not None:
+            self.wheel.cancel(timer)
+        if self.subscriptions is not None:
+            self.subscriptions.unsubscribe(task, 'reminders')
+
+    def update_task(self, task):
+        """
+        Moves task's reminder when its due date changed, e.g. advanced by complete_task; other changes ignored.
+
+        :param task: Task - Changed task.
+        """
+        entry = self._entries.get(task)
+        if entry is None or self._due_date(task) == entry[1]:
+            return
+        if entry[0] is not None:
+            self.wheel.cancel(entry[0])
+        self._schedule(task)
+
+    def dispatch_due(self):
+        """
+        Sends every reminder whose time has come.
+
+        :return: list of Reminder - Reminders sent.
+        """
+        sent = []
+        for timer in self.wheel.advance(math.floor(self.clock() / self.tick_seconds)):
+            reminder = timer.item
+            self._entries[reminder.task] = (None, reminder.due_date)
+            for callback in self.callbacks:
+                self._call(callback, reminder)
+            sent.append(reminder)
+        return sent
+
+    async def run(self):
+        """
+        Sends reminders as they come due until stop called, sleeping until next occupied timing wheel tick or until
+        reminder added.
+        """
+        self._running = True
+        while self._running:
+            self._wakeup.clear()
+            self.dispatch_due()
+            next_tick = self.wheel.next_event_tick()
+            timeout = None if next_tick is None else max(0.0, next_tick * self.tick_seconds - self.clock())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self):
+        """
+        Stops run loop after current iteration.
+        """
+        self._running = False
+        self._wakeup.set()
+
+    def _due_date(self, task):
+        try:
+            return to_date(task.due_date)
+        except (TypeError, ValueError):
+            return None  # Task w/o valid due date gets no reminder
+
+    def _schedule(self, task):
+        due_date = self._due_date(task)
+        if due_date is None:
+            self._entries[task] = (None, None)
+            return
+        remind_at = datetime.combine(due_date, self.remind_time) - self.lead_time
+        deadline = math.ceil(remind_at.timestamp() / self.tick_seconds)  # Rounded up so never sent early
+        timer = self.wheel.schedule(deadline, Reminder(task, due_date, remind_at))
+        self._entries[task] = (timer, due_date)
+        self._wakeup.set()  # Run loop may be sleeping past new reminder
+
+    def _call(self, callback, reminder):
+        try:
+            result = callback(reminder)
+            if inspect.isawaitable(result):
+                callback_task = asyncio.ensure_future(result)
+                self._callback_tasks.add(callback_task)
+                callback_task.add_done_callback(self._callback_done)
+        except Exception:
+            logger.exception("Reminder callback failed for %s", reminder.task.description)
+
+    def _callback_done(self, callback_task):
+        self._callback_tasks.discard(callback_task)
+        if not callback_task.cancelled() and callback_task.exception() is not None:
+            logger.error("Reminder callback failed: %s", callback_task.exception())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send reminders as tasks come due.")
+    parser.add_argument('file', nargs='?', default='tasks.json', help="Task file, defaults tasks.json.")
+    parser.add_argument('--lead-days', type=int, default=0, help="Days before due date to remind.")
+    parser.add_argument('--webhook', help="Local webhook URL to post reminders to.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    callbacks = [log_reminder] + ([WebhookNotifier(args.webhook)] if args.webhook else [])
+    service = ReminderService(callbacks, lead_time=timedelta(days=args.lead_days))
+    service.add_tasks(load_records(args.file))
+    logger.info("Watching %d reminders", len(service))
+    try:
+        asyncio.run(service.run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+* Name:         reports.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Memoized reports derived from scheduler: sorted task lists, dependency order, per-category health,
+*               & per-category overdue counts. Results kept in bounded LRU VersionedCache stamped w/ scheduler's
+*               global version (whole-list reports) or category's version (per-category reports), so report only
+*               recomputed when something it depends on changed, & only for categories that changed.
+* Input:        Scheduler whose version counters track changes; report parameters (categories, sort key, date).
+* Output:       Cached or freshly computed reports; treat returned lists & dicts as read-only.
+* BigO:         O(1) per cached report or category; O(n) for changed categories' single pass over n tasks, O(n log n)
+*               for changed sorted list.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+from collections import OrderedDict
+from datetime import date
+from category_health import compute_health_statuses
+from frequency import to_date
+
+MISSING = object()  # Lookup result for absent or stale entries
+
+
+class VersionedCache:
+    """
+    LRU cache whose entries hold version they were computed at; entry w/ other version treated as missing.
+    """
+    def __init__(self, maxsize=256):
+        """
+        :param maxsize: int - Maximum entries; least recently used evicted first.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # Key -> (version, value)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, key, version):
+        """
+        :return: object - Cached value if computed at version, else MISSING.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def store(self, key, version, value):
+        """
+        Caches value computed at version, evicting least recently used entry if full.
+        """
+        self._entries[key] = (version, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key, version, compute):
+        """
+        Returns cached value for key at version, computing & caching it if missing or stale.
+
+        :param compute: callable - Computes value w/o arguments.
+        """
+        value = self.lookup(key, version)
+        if value is MISSING:
+            value = compute()
+            self.store(key, version, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+
+class ScheduleReports:
+    """
+    Reports over scheduler's tasks, memoized against scheduler's version counters.
+    """
+    def __init__(self, scheduler, categories=None, maxsize=256):
+        """
+        :param scheduler: Scheduler - Tasks & version counters reported on.
+        :param categories: iterable of str - Default categories for per-category reports, defaults categories
+                                             scheduler has seen.
+        :param maxsize: int - Maximum cached results.
+        """
+        self.scheduler = scheduler
+        self.categories = list(categories) if categories is not None else None
+        self.cache = VersionedCache(maxsize)
+
+    def _categories(self, categories):
+        if categories is not None:
+            return list(categories)
+        return self.categories if self.categories is not None else sorted(self.scheduler.category_versions)
+
+    def _per_category(self, name, categories, compute, *args):
+        """
+        Assembles per-category report from cached categories, computing all stale categories in one call.
+
+        :param compute: callable - Takes (tasks, stale categories, *args) & returns category -> value.
+        :return: dict - Category -> value, in requested order.
+        """
+        scheduler = self.scheduler
+        categories = self._categories(categories)
+        results = {}
+        stale = []
+        for category in categories:
+            value = self.cache.lookup((name, category) + args, scheduler.category_version(category))
+            if value is MISSING:
+                stale.append(category)
+            else:
+                results[category] = value
+        if stale:
+            for category, value in compute(scheduler.registry, stale, *args).items():  # Unsorted, so no sort
+                self.cache.store((name, category) + args, scheduler.category_version(category), value)
+                results[category] = value
+        return {category: results[category] for category in categories}
+
+    def health_statuses(self, categories=None):
+        """
+        :param categories: iterable of str - Categories to report, defaults reports' categories.
+        :return: dict - Category -> health status from 0 to 100.
+        """
+        return self._per_category('health', categories, compute_health_statuses)
+
+    def overdue_counts(self, today=None, categories=None):
+        """
+        :param today: date or str - Open tasks due before this date counted, defaults today.
+        :param categories: iterable of str - Categories to report, defaults reports' categories.
+        :return: dict - Category -> # of overdue tasks.
+        """
+        return self._per_category('overdue', categories, count_overdue, to_date(today or date.today()))
+
+    def sorted_tasks(self, key=None):
+        """
+        :param key: callable - Sort key, defaults priority then due date (scheduler order); use same function
+                               object on each call so result can be reused.
+        :return: list of Task - Sorted tasks.
+        """
+        return self.cache.get(('sorted', key), self.scheduler.version,
+                              lambda: sorted(self.scheduler.registry, key=key or scheduler_order))
+
+    def dependency_order(self):
+        """
+        :return: list of Task - Tasks w/ prerequisites before dependents.
+        """
+        return self.cache.get(('dependency_order',), self.scheduler.version,
+                              self.scheduler.get_tasks_in_dependency_order)
+
+
+def scheduler_order(task):
+    return task.priority, task.due_date
+
+
+def count_overdue(tasks, categories, today):
+    """
+    Counts open tasks due before today per category in single pass.
+
+    :param tasks: iterable of Task - Tasks to count.
+    :param categories: iterable of str - Categories to count.
+    :param today: date - Report date.
+    :return: dict - Category -> overdue count.
+    """
+    counts = {category: 0 for category in categories}
+    for task in tasks:
+        if task.category in counts and not task.is_completed:
+            try:
+                if to_date(task.due_date) < today:
+                    counts[task.category] += 1
+            except (TypeError, ValueError):
+                pass  # Task w/o valid due date can't be overdue
+    return counts
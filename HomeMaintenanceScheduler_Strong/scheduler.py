@@ -12,51 +12,172 @@
 * Description:  Manages schedule of tasks, allowing for adding, sorting, & retrieving based on priority & due date.
 * Input:        Tasks to be scheduled w/ attributes including description, due date, category, frequency, & priority.
 * Output:       Operations on tasks such as scheduling & retrieval don't produce output directly but affect scheduler.
-* BigO:         O(n log n) for sorting, O(1) for task retrieval.
+*               Optional levelling mode spreads tasks across periods under per-period capacity. Dependency-aware
+*               retrieval returns only tasks whose prerequisites are completed. Tasks held in TaskRegistry keyed by
+*               task ID, which can be shared w/ Users & GUI, & sorted list rebuilt only when read after change.
+* BigO:         O(1) to add, find, or remove task, O(n log n) for sorting on first read after change, O(1) for task
+*               retrieval, near O(1) amortized per levelled task update,
+*               O(log n) amortized for next ready task.
 *
 * Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
                     modified or unmodified. I have not given other fellow student(s) access to my program.
 """
 
+import heapq
+import logging
+from itertools import count
+from dependency_graph import DependencyGraph
+from instrumentation import timed
+from levelling import WorkloadLeveller
+from task_registry import TaskRegistry
+
+logger = logging.getLogger(__name__)
+
 
 class Scheduler:
     """
     Maintains list of tasks, providing functionality to add, sort, & retrieve them based on priority & due date.
     """
-    def __init__(self):
+    def __init__(self, registry=None):
+        """
+        Initializes scheduler w/ task registry storing scheduled tasks.
+        :param registry: TaskRegistry - Registry shared w/ other components, defaults new empty registry.
+        """
+        self.registry = registry if registry is not None else TaskRegistry()
+        self._sorted_tasks = []
+        self._sorted_stamp = None  # (version, registry version) _sorted_tasks built at
+        self.leveller = None  # WorkloadLeveller when levelling mode enabled
+        self.dependencies = DependencyGraph(on_ready=self._push_ready)
+        self._ready_heap = []  # (priority, due_date, sequence, task) for tasks that became ready; lazily validated
+        self._ready_sequence = count()
+        self._pending_dependents = {}  # Prerequisite not yet scheduled -> dependents waiting for it
+        # Incremented on every change, globally & per category of changed tasks, so readers (e.g. API ETags &
+        # ScheduleReports cache) can tell whether anything they depend on changed
+        self.version = 0
+        self.category_versions = {}
+
+    def touch(self, *tasks):
+        """
+        Bumps global version & versions of changed tasks' categories. Called by every changing method, & by
+        callers after changing tasks outside scheduler, e.g. through Task.complete_task.
+        :param tasks: Task - Tasks that changed.
+        """
+        self.version += 1
+        for category in {task.category for task in tasks}:
+            self.category_versions[category] = self.category_versions.get(category, 0) + 1
+
+    def category_version(self, category):
         """
-        Initializes empty list to store scheduled tasks.
+        :param category: str - Category name.
+        :return: int - Version of category, increased whenever task in it added, removed, or changed.
         """
-        self.tasks = []
+        return self.category_versions.get(category, 0)
 
-    def _sort_tasks(self):
+    @property
+    def tasks(self):
         """
-        Method to sort tasks by priority & due date. Called internally after operation that may change task order.
+        Scheduled tasks sorted by priority & due date. Sorted lazily: list rebuilt on first read after any change
+        (tracked by version & registry version), so bursts of changes cost one sort. Treat as read-only.
+        :return: list of Task - Sorted tasks.
         """
-        self.tasks.sort(key=lambda x: (x.priority, x.due_date))
+        stamp = (self.version, self.registry.version)
+        if stamp != self._sorted_stamp:
+            self._sorted_tasks = sorted(self.registry, key=lambda x: (x.priority, x.due_date))
+            self._sorted_stamp = stamp
+        return self._sorted_tasks
 
+    def __contains__(self, task):
+        """
+        :param task: Task or str - Task or task ID.
+        """
+        return task in self.registry
+
+    def get_task(self, task_id):
+        """
+        :param task_id: str - Task ID.
+        :return: Task or None - Scheduled task w/ ID.
+        """
+        return self.registry.get(task_id)
+
+    @timed('scheduler.schedule_task')
     def schedule_task(self, task):
         """
-        Adds task to scheduler & sorts tasks to maintain order.
-        :param task: Task - Task to be added to scheduler.
+        Adds task to scheduler; order restored on next read of tasks.
+        :param task: Task - Task to be added to scheduler; scheduling it again does nothing.
+        :raises ValueError: If different task already scheduled w/ same ID.
+        """
+        if not self.registry.add(task) and task in self.dependencies:
+            return
+        self.touch(task)
+        self._add_to_graph(task)
+        if self.leveller:
+            self.leveller.update_task(task)
+
+    @timed('scheduler.schedule_tasks')
+    def schedule_tasks(self, tasks):
+        """
+        Adds batch of tasks to scheduler, sorted once on next read rather than per task. Whole batch checked
+        before any task registered, so rejected batch leaves scheduler unchanged.
+        :param tasks: iterable of Task - Tasks to be added to scheduler; already scheduled tasks skipped.
+        :raises ValueError: If different task already scheduled, or earlier in batch, w/ same ID as one in batch.
         """
-        self.tasks.append(task)
-        self._sort_tasks()
+        tasks = list(tasks)
+        batch = {}  # Task ID -> task w/ that ID, scheduled or earlier in batch
+        for task in tasks:
+            if batch.setdefault(task.task_id, self.registry.get(task.task_id, task)) is not task:
+                raise ValueError(f"Duplicate task ID: {task.task_id}")
+        tasks = [task for task in tasks if self.registry.add(task) or task not in self.dependencies]
+        self.touch(*tasks)
+        for task in tasks:
+            self.dependencies.add_task(task)  # Whole batch first, so links (& any cycle) resolved in task order
+        for task in tasks:
+            self._add_to_graph(task)
+        if self.leveller:
+            for task in tasks:
+                self.leveller.update_task(task)
 
     def get_next_task(self):
         """
         Retrieves next task from scheduler based on highest priority & earliest due date.
+        In levelling mode, returns first task of earliest planned period instead (priority breaks ties within
+        period). Levelling gives higher priority tasks periods closest to their due dates, so lower priority task
+        planned in earlier period comes first.
         :return: Task - Task w/ highest priority & earliest due date.
         """
+        if self.leveller:
+            assignments = self.leveller.assignments
+            return min(assignments, key=lambda t: (assignments[t][0], t.priority, t.due_date), default=None)
         return self.tasks[0] if self.tasks else None
 
+    @timed('scheduler.remove_task')
     def remove_task(self, task):
         """
-        Removes specified task from list & re-sorts list to maintain order.
+        Removes specified task from scheduler, along w/ it from prerequisites of tasks depending on it, so no
+        task keeps link to unscheduled task.
         :param task: Task - Task to be removed from scheduler.
+        :return: list of Task - Tasks that depended on removed task, e.g. so links can be restored by undo.
+        :raises KeyError: If task isn't scheduled.
+        """
+        self.registry.remove(task)
+        self.touch(task)
+        dependents = list(self.dependencies.get_dependents(task)) if task in self.dependencies else []
+        for dependent in dependents:
+            dependent.remove_prerequisite(task)
+        self.dependencies.remove_task(task)
+        for prerequisite in task.prerequisites:
+            pending = self._pending_dependents.get(prerequisite)
+            if pending and task in pending:
+                pending.remove(task)
+        if self.leveller:
+            self.leveller.remove_task(task)
+        return dependents
+
+    def clear(self):
         """
-        self.tasks.remove(task)
-        self._sort_tasks()
+        Removes every task from scheduler.
+        """
+        for task in self.registry.tasks():
+            self.remove_task(task)
 
     def get_all_tasks(self):
         """
@@ -65,10 +186,159 @@ class Scheduler:
         """
         return self.tasks
 
+    @timed('scheduler.task_completed')
     def task_completed(self, task):
         """
-        Marks task completed & resorts list to reflect any priority changes.
+        Marks task completed.
         :param task: Task - Task to be marked completed.
         """
+        self.touch(task)
         task.is_completed = True
-        self._sort_tasks()
+        self.dependencies.mark_completed(task)
+        if self.leveller:
+            self.leveller.update_task(task)
+
+    @timed('scheduler.task_reset')
+    def task_reset(self, task):
+        """
+        Marks task incomplete again, blocking tasks that depend on it.
+        :param task: Task - Task to be marked incomplete.
+        """
+        self.touch(task)
+        task.is_completed = False
+        self.dependencies.mark_reset(task)
+        if self.leveller:
+            self.leveller.update_task(task)
+
+    def add_dependency(self, before, after):
+        """
+        Requires one scheduled task to be completed before another becomes ready.
+        :param before: Task - Prerequisite task.
+        :param after: Task - Dependent task.
+        :raises ValueError: If dependency would create cycle.
+        """
+        self.touch()
+        self.dependencies.add_dependency(before, after)
+        after.add_prerequisite(before)
+
+    def remove_dependency(self, before, after):
+        """
+        Removes dependency between two tasks.
+        :param before: Task - Prerequisite task.
+        :param after: Task - Dependent task.
+        """
+        self.touch()
+        self.dependencies.remove_dependency(before, after)
+        after.remove_prerequisite(before)
+
+    @timed('scheduler.get_next_ready_task')
+    def get_next_ready_task(self):
+        """
+        Retrieves highest priority, earliest due task that is incomplete & has all prerequisites completed.
+        :return: Task or None - Next ready task, or None if every task is done or blocked.
+        """
+        heap = self._ready_heap
+        while heap:
+            priority, due_date, _, task = heap[0]
+            if not self.dependencies.is_ready(task):
+                heapq.heappop(heap)  # Stale entry: task completed, blocked again, or removed
+            elif (priority, due_date) != (task.priority, task.due_date):
+                heapq.heappop(heap)
+                self._push_ready(task)  # Priority or due date changed since entry pushed
+            else:
+                return task
+        return None
+
+    def get_tasks_in_dependency_order(self):
+        """
+        Retrieves all tasks ordered so prerequisites always come before tasks that depend on them.
+        :return: list of Task - Tasks in topological order.
+        """
+        return self.dependencies.topological_order()
+
+    def link_prerequisites(self, tasks):
+        """
+        Adds dependency links for prerequisites recorded on scheduled tasks after they were scheduled, e.g. once
+        background load linked them. Prerequisites that would form cycle dropped, as when scheduling.
+        :param tasks: iterable of Task - Scheduled tasks whose prerequisites changed.
+        """
+        self.touch()
+        for task in tasks:
+            self._link_prerequisites(task)
+
+    def _add_to_graph(self, task):
+        """
+        Adds task to dependency graph along w/ prerequisite links recorded on tasks.
+        """
+        self.dependencies.add_task(task)
+        self._link_prerequisites(task)
+        for dependent in self._pending_dependents.pop(task, []):
+            self._link(task, dependent)
+
+    def _link_prerequisites(self, task):
+        """
+        Links task to its scheduled prerequisites; others wait in _pending_dependents until scheduled.
+        """
+        for prerequisite in list(task.prerequisites):
+            if prerequisite in self.dependencies:
+                self._link(prerequisite, task)
+            else:
+                dependents = self._pending_dependents.setdefault(prerequisite, [])
+                if task not in dependents:
+                    dependents.append(task)
+
+    def _link(self, before, after):
+        """
+        Adds dependency edge, dropping prerequisite instead if edge would form cycle (e.g. cyclic task file), so
+        loading never fails on it.
+        """
+        try:
+            self.dependencies.add_dependency(before, after)
+        except ValueError as error:
+            after.remove_prerequisite(before)
+            logger.warning("Dropped prerequisite '%s' of '%s': %s", before.description, after.description, error)
+
+    def _push_ready(self, task):
+        heapq.heappush(self._ready_heap, (task.priority, task.due_date, next(self._ready_sequence), task))
+
+    @timed('scheduler.reschedule_task')
+    def reschedule_task(self, task):
+        """
+        Re-sorts tasks (on next read) & re-levels single task after its priority, due date, or completion changed.
+        :param task: Task - Task that changed.
+        """
+        self.touch(task)
+        if self.leveller:
+            self.leveller.update_task(task)
+
+    def enable_levelling(self, capacity, period_days=7, start=None, weight=None, is_flexible=None):
+        """
+        Switches scheduler to levelling mode & levels all current tasks.
+        :param capacity: int or float - Maximum load per period (task count, or hours if weight returns hours).
+        :param period_days: int - Length of each period in days, defaults 7 (weekly).
+        :param start: date or str - First day of first period, defaults today.
+        :param weight: callable - Task -> load it consumes, defaults 1 per task.
+        :param is_flexible: callable - Task -> bool; fixed tasks stay in their due period, defaults all flexible.
+        :return: WorkloadLeveller - Leveller holding planned periods.
+        """
+        self.touch()
+        self.leveller = WorkloadLeveller(capacity, period_days, start, weight, is_flexible)
+        self.leveller.level(self.tasks)
+        return self.leveller
+
+    def disable_levelling(self):
+        """
+        Returns scheduler to strict priority & due date ordering.
+        """
+        self.touch()
+        self.leveller = None
+
+    def get_levelled_tasks(self):
+        """
+        Retrieves incomplete tasks ordered by planned period, then priority & due date.
+        :return: list of Task - Levelled tasks, or empty list if levelling mode isn't enabled.
+        """
+        if not self.leveller:
+            return []
+        assignments = self.leveller.assignments
+        return sorted(assignments, key=lambda t: (assignments[t][0], t.priority, t.due_date))
@@ -0,0 +1,126 @@
+"""
+* Name:         subscriptions.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Defines SubscriptionManager, registry owning signal connections between tasks & consumers such as
+*               views & scheduler. Guarantees at most one connection per (task, consumer, signal), disconnects on
+*               removal, & reports live connection counts so signal fan-out stays constant over session.
+* Input:        Tasks, consumer keys, slots, & signal names.
+* Output:       Connected & disconnected Qt signals; connection counts.
+* BigO:         O(1) per subscribe/unsubscribe, O(n) to sync consumer w/ n tasks.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+from PySide6.QtCore import QObject
+
+
+class SubscriptionManager:
+    """
+    Tracks every connection it makes so repeated subscriptions are ignored & connections can be removed later.
+    """
+    def __init__(self):
+        """
+        Initializes empty registry.
+        """
+        self._connections = {}  # (task, consumer, signal name) -> Qt connection handle
+        self._by_task = {}  # Task -> set of keys
+        self._by_consumer = {}  # Consumer -> set of keys
+
+    def subscribe(self, task, consumer, slot, signal_name='task_updated'):
+        """
+        Connects task's signal to slot unless consumer already subscribed to that signal of task.
+
+        :param task: Task - Task emitting signal.
+        :param consumer: hashable - Key identifying subscriber, e.g. 'dashboard'.
+        :param slot: callable - Slot to connect.
+        :param signal_name: str - Name of task signal, defaults 'task_updated'.
+        :return: bool - True if new connection made, False if already subscribed.
+        """
+        key = (task, consumer, signal_name)
+        if key in self._connections:
+            return False
+        # Connection handle kept so only this connection is removed, even if slot shared by several consumers
+        self._connections[key] = getattr(task, signal_name).connect(slot)
+        self._by_task.setdefault(task, set()).add(key)
+        self._by_consumer.setdefault(consumer, set()).add(key)
+        return True
+
+    def unsubscribe(self, task, consumer, signal_name='task_updated'):
+        """
+        Disconnects consumer from task's signal, if subscribed.
+
+        :return: bool - True if connection removed.
+        """
+        key = (task, consumer, signal_name)
+        connection = self._connections.pop(key, None)
+        if connection is None:
+            return False
+        QObject.disconnect(connection)
+        self._discard(self._by_task, task, key)
+        self._discard(self._by_consumer, consumer, key)
+        return True
+
+    def unsubscribe_task(self, task):
+        """
+        Disconnects every consumer from task, e.g. when task removed.
+
+        :param task: Task - Task being removed.
+        """
+        for _, consumer, signal_name in list(self._by_task.get(task, ())):
+            self.unsubscribe(task, consumer, signal_name)
+
+    def unsubscribe_consumer(self, consumer):
+        """
+        Disconnects consumer from every task, e.g. when view closed.
+
+        :param consumer: hashable - Consumer key.
+        """
+        for task, _, signal_name in list(self._by_consumer.get(consumer, ())):
+            self.unsubscribe(task, consumer, signal_name)
+
+    def sync(self, consumer, tasks, slot, signal_name='task_updated'):
+        """
+        Makes consumer subscribed to exactly given tasks: new tasks connected, tasks no longer present disconnected.
+
+        :param consumer: hashable - Consumer key.
+        :param tasks: iterable of Task - Tasks consumer should listen to.
+        :param slot: callable - Slot to connect for new tasks.
+        :param signal_name: str - Name of task signal, defaults 'task_updated'.
+        """
+        wanted = set(tasks)
+        for task, _, name in list(self._by_consumer.get(consumer, ())):
+            if name == signal_name and task not in wanted:
+                self.unsubscribe(task, consumer, signal_name)
+        for task in wanted:
+            self.subscribe(task, consumer, slot, signal_name)
+
+    def connection_count(self, task=None, consumer=None):
+        """
+        Returns # of live connections, optionally limited to one task or consumer.
+
+        :return: int - Live connection count.
+        """
+        if task is not None and consumer is not None:
+            return sum(1 for key in self._by_task.get(task, ()) if key[1] == consumer)
+        if task is not None:
+            return len(self._by_task.get(task, ()))
+        if consumer is not None:
+            return len(self._by_consumer.get(consumer, ()))
+        return len(self._connections)
+
+    @staticmethod
+    def _discard(index, owner, key):
+        keys = index.get(owner)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[owner]
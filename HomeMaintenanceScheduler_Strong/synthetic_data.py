@@ -0,0 +1,170 @@
+"""
+* Name:         synthetic_data.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Deterministic synthetic task data for load & stress testing. Each user (property) adopts share of
+*               PreDefinedTasks templates, & each adopted template yields current occurrence plus history of earlier
+*               occurrences. Priorities weighted by category, & per-user completion & overdue tendencies drawn around
+*               configured rates. Each user has own random generator seeded from dataset seed & user #, so any
+*               range of users reproduced exactly (task IDs included), & records streamed to JSON, JSON Lines, or
+*               CSV w/o holding them.
+* Input:        Seed, # of users or tasks, reference date, & distribution parameters.
+* Output:       Task records (w/ 'property' key) yielded one at time or written to task file.
+* BigO:         O(n) time for n records, O(t) memory for t templates.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+from itertools import count, islice
+from frequency import parse_frequency, to_date
+from pre_defined_tasks import PreDefinedTasks
+from task_store import FORMATS, write_records
+
+REFERENCE_DATE = date(2025, 1, 1)  # Fixed default so datasets don't change from day to day
+DEFAULT_PRIORITY_WEIGHTS = (0.15, 0.45, 0.4)  # Chance of priority 1, 2, & 3
+PRIORITY_WEIGHTS = {
+    'Safety Equipment': (0.6, 0.3, 0.1),
+    'HVAC': (0.3, 0.5, 0.2),
+    'Plumbing': (0.3, 0.5, 0.2),
+    'Electrical': (0.3, 0.5, 0.2),
+}
+
+
+def clamp(value, low=0.0, high=1.0):
+    return max(low, min(high, value))
+
+
+class SyntheticDataGenerator:
+    """
+    Generates reproducible task records for users x templates x histories.
+    """
+    def __init__(self, seed=0, today=REFERENCE_DATE, adoption_rate=0.7, completion_rate=0.6, overdue_ratio=0.15,
+                 history_completion_rate=0.9, max_history=3, categories=None):
+        """
+        :param seed: int - Dataset seed; same seed & parameters always give same records.
+        :param today: date or str - Reference date overdue & upcoming occurrences placed around.
+        :param adoption_rate: float - Chance user has any given template.
+        :param completion_rate: float - Mean chance current occurrence already completed this cycle.
+        :param overdue_ratio: float - Mean chance current occurrence open & past due.
+        :param history_completion_rate: float - Chance earlier occurrence was completed rather than missed.
+        :param max_history: int - Maximum earlier occurrences per template; each user template gets 0 to this many.
+        :param categories: list of str - Template categories to use, defaults all.
+        """
+        self.seed = seed
+        self.today = to_date(today)
+        self.adoption_rate = adoption_rate
+        self.completion_rate = completion_rate
+        self.overdue_ratio = overdue_ratio
+        self.history_completion_rate = history_completion_rate
+        self.max_history = max_history
+        if categories is None:
+            categories = list(PreDefinedTasks.TASKS_WITH_FREQUENCIES)
+        self.templates = []  # (category, description, frequency text, Frequency, interval days, priority weights)
+        for category in categories:
+            for description, frequency in PreDefinedTasks.get_tasks_for_category(category):
+                compiled = parse_frequency(frequency)
+                self.templates.append((category, description, frequency, compiled,
+                                       max(1, round(compiled.approximate_days)),
+                                       PRIORITY_WEIGHTS.get(category, DEFAULT_PRIORITY_WEIGHTS)))
+
+    def user_name(self, user):
+        return f"Property {user:07d}"
+
+    def iter_user_records(self, user):
+        """
+        Yields records of one user, using generator seeded only by dataset seed & user #.
+
+        :param user: int - User #.
+        :return: generator of dict - User's task records.
+        """
+        generator = random.Random(f"{self.seed}:{user}")
+        name = self.user_name(user)
+        numbers = count()  # Task IDs built from seed, user #, & record # so they're reproducible too
+        completion = clamp(generator.gauss(self.completion_rate, 0.15))
+        overdue = clamp(generator.gauss(self.overdue_ratio, 0.05))
+        today = self.today
+        for category, description, frequency, compiled, interval, weights in self.templates:
+            if generator.random() >= self.adoption_rate:
+                continue
+            priority = generator.choices((1, 2, 3), weights)[0]
+            if generator.random() < overdue:
+                due_date = today - timedelta(days=generator.randint(1, interval))
+                is_completed = False
+            else:
+                due_date = today + timedelta(days=generator.randrange(interval))
+                is_completed = generator.random() < completion
+            for step in range(generator.randint(0, self.max_history), 0, -1):
+                yield {'id': f"{self.seed}-{user}-{next(numbers)}", 'property': name, 'description': description,
+                       'due_date': compiled.advance(due_date, -step).isoformat(), 'category': category,
+                       'frequency': frequency, 'priority': priority,
+                       'is_completed': generator.random() < self.history_completion_rate, 'prerequisites': []}
+            yield {'id': f"{self.seed}-{user}-{next(numbers)}", 'property': name, 'description': description,
+                   'due_date': due_date.isoformat(), 'category': category, 'frequency': frequency,
+                   'priority': priority, 'is_completed': is_completed, 'prerequisites': []}
+
+    def iter_records(self, users=None, first_user=0, limit=None):
+        """
+        Lazily yields records user by user.
+
+        :param users: int - # of users, defaults unlimited (use limit).
+        :param first_user: int - First user #, so shards of large dataset can be generated separately.
+        :param limit: int - Maximum # of records.
+        :return: generator of dict - Task records.
+        """
+        user_numbers = count(first_user) if users is None else range(first_user, first_user + users)
+        records = (record for user in user_numbers for record in self.iter_user_records(user))
+        return islice(records, limit) if limit is not None else records
+
+    def write(self, filename, users=None, first_user=0, limit=None, file_format=None):
+        """
+        Streams records to task file.
+
+        :param filename: str - File to write.
+        :param file_format: str - 'json', 'jsonl', or 'csv'; from extension if omitted.
+        :return: int - # of records written.
+        """
+        if users is None and limit is None:
+            raise ValueError("Give # of users or record limit")
+        return write_records(self.iter_records(users, first_user, limit), filename, file_format)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write reproducible synthetic task dataset.")
+    parser.add_argument('output', help="File to write (.json, .jsonl, or .csv).")
+    parser.add_argument('--format', choices=FORMATS, help="Output format; from extension if omitted.")
+    parser.add_argument('--users', type=int, help="# of users (properties).")
+    parser.add_argument('--tasks', type=int, help="Stop after this many records.")
+    parser.add_argument('--first-user', type=int, default=0, help="First user #, for sharded generation.")
+    parser.add_argument('--seed', type=int, default=0, help="Dataset seed, defaults 0.")
+    parser.add_argument('--today', type=to_date, default=REFERENCE_DATE, help="Reference date, defaults 2025-01-01.")
+    parser.add_argument('--adoption-rate', type=float, default=0.7, help="Chance user has each template.")
+    parser.add_argument('--completion-rate', type=float, default=0.6, help="Mean current completion rate.")
+    parser.add_argument('--overdue-ratio', type=float, default=0.15, help="Mean share of overdue occurrences.")
+    parser.add_argument('--max-history', type=int, default=3, help="Maximum earlier occurrences per template.")
+    args = parser.parse_args(argv)
+
+    generator = SyntheticDataGenerator(args.seed, args.today, args.adoption_rate, args.completion_rate,
+                                       args.overdue_ratio, max_history=args.max_history)
+    try:
+        written = generator.write(args.output, args.users, args.first_user, args.tasks, args.format)
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    print(f"Wrote {written} tasks to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,7 +11,8 @@
 *
 * Description:  Defines Task class to model maintenance tasks w/ comprehensive attributes & signal mechanisms
 *               for property changes, & AddTaskDialog class for GUI-based task creation. Includes methods to
-*               serialize tasks to JSON format & back to Task instances.
+*               serialize tasks to JSON format & back to Task instances. Each task has stable ID, generated once &
+*               kept in task file, so tasks & prerequisite links identified independent of description.
 * Input:        Attributes for creating task instance & user inputs from GUI for task creation.
 * Output:       Emits signals for property changes in Task class, creates tasks from user input in AddTaskDialog,
 *               & supports saving to & loading from JSON format.
@@ -22,9 +23,11 @@
 """
 
 import json
-from datetime import timedelta, datetime
+import uuid
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QDateEdit, QComboBox, QPushButton, QMessageBox, QSpinBox
 from PySide6.QtCore import Signal, QObject, QDate
+from frequency import get_rollover_frequency
+from task_store import unique_ids
 
 
 class Task(QObject):
@@ -35,14 +38,36 @@ class Task(QObject):
     task_updated = Signal()
     priority_changed = Signal(int)  # Signal for priority changes w/ new priority as argument
 
-    def __init__(self, description, due_date, category, frequency, priority=3, is_completed=False):
+    def __init__(self, description, due_date, category, frequency, priority=3, is_completed=False, task_id=None,
+                 property_name=None):
+        """
+        :param task_id: str - Stable ID, e.g. from task file; new unique ID generated if omitted.
+        :param property_name: str - Property task belongs to when tasks for many properties kept together.
+        """
         super().__init__()
+        self.task_id = task_id or uuid.uuid4().hex
         self.description = description
         self.due_date = due_date
         self.category = category
         self.frequency = frequency
         self.priority = self._validate_priority(priority)
+        self.property_name = property_name
         self.is_completed = is_completed  # Now explicitly accepting 'is_completed' in constructor
+        self.prerequisites = []  # Tasks that must be completed before this one
+
+    def add_prerequisite(self, task):
+        """
+        Records task that must be completed before this one.
+        """
+        if task is not self and task not in self.prerequisites:
+            self.prerequisites.append(task)
+
+    def remove_prerequisite(self, task):
+        """
+        Removes prerequisite task, if present.
+        """
+        if task in self.prerequisites:
+            self.prerequisites.remove(task)
 
     @staticmethod
     def _validate_priority(priority):
@@ -58,14 +83,8 @@ class Task(QObject):
         """
         Marks task as completed, calculates next due date based on task's frequency, & emits task_updated signal.
         """
-        next_due_date = datetime.strptime(self.due_date, '%Y-%m-%d')
-        # Calculate next due date based on frequency
-        adjustment = {
-            'weekly': timedelta(weeks=1),
-            'monthly': timedelta(days=30),
-            'annually': timedelta(days=365)
-        }.get(self.frequency, timedelta(days=365))  # Default to annually if frequency is unrecognized
-        self.due_date = (next_due_date + adjustment).strftime('%Y-%m-%d')
+        # Calculate next due date based on frequency, defaulting to annually if frequency is unrecognized
+        self.due_date = get_rollover_frequency(self.frequency).next_due_date(self.due_date)
         self.is_completed = True
         self.task_updated.emit()
 
@@ -77,14 +96,19 @@ class Task(QObject):
         self.task_updated.emit()
 
     def to_dict(self):
-        return {
+        data = {
+            'id': self.task_id,
             'description': self.description,
             'due_date': self.due_date,
             'category': self.category,
             'frequency': self.frequency,
             'priority': self.priority,
-            'is_completed': self.is_completed
+            'is_completed': self.is_completed,
+            'prerequisites': [task.task_id for task in self.prerequisites]
         }
+        if self.property_name is not None:
+            data['property'] = self.property_name  # Only for multi-property task sets, so other files unchanged
+        return data
 
     @classmethod
     def from_dict(cls, data):
@@ -98,7 +122,9 @@ class Task(QObject):
             category=data['category'],
             frequency=data['frequency'],
             priority=data['priority'],
-            is_completed=data.get('is_completed', False)
+            is_completed=data.get('is_completed', False),
+            task_id=data.get('id') or None,  # Records from older files & other sources get new ID
+            property_name=data.get('property')
         )
 
 
@@ -180,7 +206,7 @@ def load_tasks(filename='tasks.json'):
     Loads tasks from JSON file & returns them as list of Task objects.
 
     Attempts read JSON file specified & convert back into list of Task objects using 'from_dict' class method of Task.
-    If file doesn't exist, returns empty list.
+    If file doesn't exist, returns empty list. Task repeating ID of earlier one gets new ID.
 
     :param filename: str - Filename from load tasks, defaults 'tasks.json'.
     :return: list of Task - List of deserialized Task objects.
@@ -188,6 +214,29 @@ def load_tasks(filename='tasks.json'):
     try:
         with open(filename, 'r') as file:
             tasks_data = json.load(file)
-            return [Task.from_dict(data) for data in tasks_data]
     except FileNotFoundError:
         return []  # Return  empty list if no tasks stored.
+    tasks_data = list(unique_ids(tasks_data))
+    tasks = [Task.from_dict(data) for data in tasks_data]
+    link_prerequisites(tasks, tasks_data)
+    return tasks
+
+
+def link_prerequisites(tasks, tasks_data):
+    """
+    Restores prerequisite links between loaded tasks. Prerequisites stored by task ID; references that aren't IDs
+    of loaded tasks resolved as descriptions (as stored by older files) to first task w/ that description, &
+    unknown references ignored.
+
+    :param tasks: list of Task - Tasks created from tasks_data, in same order.
+    :param tasks_data: list of dict - Serialized task records.
+    """
+    by_id = {task.task_id: task for task in tasks}
+    by_description = {}
+    for task in tasks:
+        by_description.setdefault(task.description, task)
+    for task, data in zip(tasks, tasks_data):
+        for reference in data.get('prerequisites', []):
+            prerequisite = by_id.get(reference) or by_description.get(reference)
+            if prerequisite is not None:
+                task.add_prerequisite(prerequisite)
@@ -0,0 +1,104 @@
+"""
+* Name:         task_filter.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Filtering layer between scheduler & task list views. TaskFilter holds category, priority, completion,
+*               & description text criteria. IncrementalTaskFilter remembers last result, so filter that only narrows
+*               previous one (e.g. typing another character) refines previous result instead of rescanning every
+*               task. Results keep scheduler's existing order, so nothing re-sorted per keystroke.
+* Input:        Source of tasks in scheduler order & filter criteria.
+* Output:       Lists of matching tasks in scheduler order.
+* BigO:         O(n) for full scan, O(m) to refine previous result of m tasks.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+
+class TaskFilter:
+    """
+    Immutable set of filter criteria; None for criterion means no restriction.
+    """
+    __slots__ = ('categories', 'priorities', 'completed', 'text')
+
+    def __init__(self, categories=None, priorities=None, completed=None, text=''):
+        """
+        :param categories: iterable of str - Allowed categories, defaults all.
+        :param priorities: iterable of int - Allowed priorities, defaults all.
+        :param completed: bool - Only completed (True) or only open (False) tasks, defaults both.
+        :param text: str - Case-insensitive text description must contain, defaults any.
+        """
+        self.categories = frozenset(categories) if categories is not None else None
+        self.priorities = frozenset(priorities) if priorities is not None else None
+        self.completed = completed
+        self.text = text.strip().lower()
+
+    def matches(self, task):
+        """
+        :param task: Task - Task to test.
+        :return: bool - True if task meets every criterion.
+        """
+        return ((self.categories is None or task.category in self.categories)
+                and (self.priorities is None or task.priority in self.priorities)
+                and (self.completed is None or bool(task.is_completed) == self.completed)
+                and (not self.text or self.text in task.description.lower()))
+
+    def narrows(self, other):
+        """
+        Checks whether every task matching this filter also matches other filter.
+
+        :param other: TaskFilter - Previously applied filter.
+        :return: bool - True if this filter at least as strict as other.
+        """
+        return (self._subset(self.categories, other.categories)
+                and self._subset(self.priorities, other.priorities)
+                and (other.completed is None or self.completed == other.completed)
+                and other.text in self.text)
+
+    @staticmethod
+    def _subset(narrower, wider):
+        return wider is None or (narrower is not None and narrower <= wider)
+
+
+class IncrementalTaskFilter:
+    """
+    Applies TaskFilters to task source, refining previous result when new filter only narrows it.
+    """
+    def __init__(self, source):
+        """
+        :param source: callable - Returns tasks in display order, e.g. Scheduler.get_all_tasks.
+        """
+        self.source = source
+        self._last_filter = None
+        self._last_result = None
+        self.full_scans = 0  # # of times every source task was scanned, useful for diagnostics
+
+    def apply(self, task_filter):
+        """
+        Returns tasks matching filter, in source order.
+
+        :param task_filter: TaskFilter - Criteria to apply.
+        :return: list of Task - Matching tasks.
+        """
+        if self._last_result is not None and task_filter.narrows(self._last_filter):
+            candidates = self._last_result
+        else:
+            candidates = self.source()
+            self.full_scans += 1
+        self._last_result = [task for task in candidates if task_filter.matches(task)]
+        self._last_filter = task_filter
+        return self._last_result
+
+    def invalidate(self):
+        """
+        Forgets previous result after tasks added, removed, or changed, so next apply rescans source.
+        """
+        self._last_filter = None
+        self._last_result = None
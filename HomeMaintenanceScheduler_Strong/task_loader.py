@@ -0,0 +1,82 @@
+"""
+* Name:         task_loader.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Defines TaskLoadWorker, QRunnable that reads & orders task records from JSON file on QThreadPool
+*               thread & delivers them to GUI thread in chunks, so window can appear immediately & fill in
+*               progressively. Task objects themselves created on GUI thread, since they're QObjects w/ signals.
+*               Records repeating earlier record's ID given new ID, so duplicate never stops load partway.
+* Input:        Filename, chunk size, & optional cancellation request.
+* Output:       Signals carrying chunks of task records, progress, & completion or failure.
+* BigO:         O(n log n) on worker thread to parse & order n records, O(c) per chunk on GUI thread.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import json
+import threading
+from PySide6.QtCore import QObject, QRunnable, Signal
+from task_store import unique_ids
+
+
+class TaskLoaderSignals(QObject):
+    """
+    Signals emitted by TaskLoadWorker; delivered to GUI thread through queued connections.
+    """
+    chunk_loaded = Signal(list)  # List of task records in scheduling order
+    progress = Signal(int, int)  # Records delivered so far, total records
+    finished = Signal(bool)  # True if every record delivered, False if cancelled
+    failed = Signal(str)  # Error message if file couldn't be read
+
+
+class TaskLoadWorker(QRunnable):
+    """
+    Parses task file & orders records by priority & due date off GUI thread, then emits them in chunks.
+    """
+    def __init__(self, filename='tasks.json', chunk_size=500):
+        """
+        :param filename: str - Task file to load, defaults 'tasks.json'.
+        :param chunk_size: int - # of records per chunk_loaded emission.
+        """
+        super().__init__()
+        self.filename = filename
+        self.chunk_size = chunk_size
+        self.signals = TaskLoaderSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """
+        Requests worker stop before next chunk; chunks already emitted still delivered.
+        """
+        self._cancelled.set()
+
+    def run(self):
+        try:
+            with open(self.filename, 'r') as file:
+                tasks_data = json.load(file)
+        except FileNotFoundError:
+            tasks_data = []  # No tasks stored yet
+        except (OSError, ValueError) as error:
+            self.signals.failed.emit(str(error))
+            return
+
+        tasks_data = list(unique_ids(tasks_data))  # In file order, so first task keeps repeated ID
+        # Same order Scheduler keeps, so rows can be appended as they arrive
+        tasks_data.sort(key=lambda data: (data.get('priority', 3), str(data.get('due_date', ''))))
+        total = len(tasks_data)
+        for start in range(0, total, self.chunk_size):
+            if self._cancelled.is_set():
+                self.signals.finished.emit(False)
+                return
+            chunk = tasks_data[start:start + self.chunk_size]
+            self.signals.chunk_loaded.emit(chunk)
+            self.signals.progress.emit(start + len(chunk), total)
+        self.signals.finished.emit(True)
@@ -0,0 +1,105 @@
+"""
+* Name:         task_registry.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Defines TaskRegistry, single map of stable task ID -> Task shared by Scheduler, Users, & GUI, so
+*               every component sees same tasks & membership, lookup, & removal never scan list. Tasks kept in
+*               order registered, & version counter bumped on every add or remove lets holders of derived lists
+*               (e.g. scheduler's sorted list) tell when to rebuild them.
+* Input:        Tasks w/ task_id attribute.
+* Output:       Registered tasks, looked up by ID or Task.
+* BigO:         O(1) for add, remove, get, & membership; O(n) to list n tasks.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+
+class TaskRegistry:
+    """
+    Tasks keyed by task ID, in order registered.
+    """
+    def __init__(self, tasks=()):
+        """
+        :param tasks: iterable of Task - Tasks to register initially.
+        """
+        self._tasks = {}  # Task ID -> Task
+        self.version = 0
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __iter__(self):
+        return iter(self._tasks.values())
+
+    def __contains__(self, item):
+        """
+        :param item: Task or str - Task (must be registered object itself) or task ID.
+        """
+        if isinstance(item, str):
+            return item in self._tasks
+        return self._tasks.get(getattr(item, 'task_id', None)) is item
+
+    def add(self, task):
+        """
+        Registers task; registering same task again does nothing.
+
+        :param task: Task - Task to register.
+        :return: bool - True if task newly registered.
+        :raises ValueError: If different task already registered w/ same ID.
+        """
+        existing = self._tasks.get(task.task_id)
+        if existing is task:
+            return False
+        if existing is not None:
+            raise ValueError(f"Duplicate task ID: {task.task_id}")
+        self._tasks[task.task_id] = task
+        self.version += 1
+        return True
+
+    def remove(self, task):
+        """
+        :param task: Task - Registered task to remove.
+        :raises KeyError: If task isn't registered.
+        """
+        if self._tasks.get(task.task_id) is not task:
+            raise KeyError(task.task_id)
+        del self._tasks[task.task_id]
+        self.version += 1
+
+    def discard(self, task):
+        """
+        Removes task if registered.
+
+        :return: bool - True if task was removed.
+        """
+        if task not in self:
+            return False
+        self.remove(task)
+        return True
+
+    def get(self, task_id, default=None):
+        """
+        :param task_id: str - Task ID.
+        :return: Task - Registered task, or default if none has ID.
+        """
+        return self._tasks.get(task_id, default)
+
+    def tasks(self):
+        """
+        :return: list of Task - Registered tasks, in order registered.
+        """
+        return list(self._tasks.values())
+
+    def clear(self):
+        self._tasks.clear()
+        self.version += 1
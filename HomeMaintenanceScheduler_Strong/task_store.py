@@ -0,0 +1,291 @@
+"""
+* Name:         task_store.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Streams task records (dictionaries in Task.to_dict format) to & from JSON Lines files, one record
+*               per line, so large task sets can be written & read w/o holding all of them in memory. Also streams
+*               JSON array (tasks.json) & CSV files, w/ format detected from extension or first character, so tools
+*               w/o Qt can read & write any supported task file. Repeated task IDs replaced on load, so one bad
+*               record can't stop whole file loading.
+* Input:        Iterables of task records & filenames.
+* Output:       JSON, JSON Lines, & CSV files & generators of task records.
+* BigO:         O(n) to write or read n records, O(1) memory per record.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import csv
+import json
+import os
+import uuid
+
+FORMATS = ('json', 'jsonl', 'csv')
+FIELDS = ('id', 'property', 'description', 'due_date', 'category', 'frequency', 'priority', 'is_completed',
+          'prerequisites')
+NUMBER_TAIL = frozenset(' \t\r\n0123456789.eE+-')  # Characters that may follow partial number
+EXTENSIONS = {'.json': 'json', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.csv': 'csv'}
+
+
+def write_json_lines(records, filename, append=False):
+    """
+    Writes task records to JSON Lines file, one compact JSON object per line.
+
+    :param records: iterable of dict - Task records to be written.
+    :param filename: str - File to write records to.
+    :param append: bool - Appends to existing file instead of replacing it, defaults False.
+    :return: int - # of records written.
+    """
+    count = 0
+    with open(filename, 'a' if append else 'w') as file:
+        for record in records:
+            file.write(json.dumps(record, separators=(',', ':')))
+            file.write('\n')
+            count += 1
+    return count
+
+
+def iter_json_lines(filename):
+    """
+    Lazily reads task records from JSON Lines file, skipping blank lines.
+
+    :param filename: str - File to read records from.
+    :return: generator of dict - Task records in file order.
+    """
+    with open(filename, 'r') as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def detect_format(filename, file_format=None):
+    """
+    Determines task file format from explicit format, file extension, or first non-blank character.
+
+    :param filename: str - Task file.
+    :param file_format: str - Explicit format, returned unchanged if given.
+    :return: str - 'json', 'jsonl', or 'csv'.
+    :raises ValueError: If format unknown or can't be detected.
+    """
+    if file_format:
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown task file format: {file_format}")
+        return file_format
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in EXTENSIONS:
+        return EXTENSIONS[extension]
+    try:
+        with open(filename, 'r') as file:
+            first = file.read(4096).lstrip()[:1]
+    except FileNotFoundError:
+        first = ''
+    if first == '[':
+        return 'json'
+    if first == '{':
+        return 'jsonl'
+    raise ValueError(f"Can't detect task file format of {filename}")
+
+
+def resolve_format(filename, file_format=None):
+    """
+    Determines format to write task file in: explicit format, else existing file's format, else from extension.
+
+    :param filename: str - Task file.
+    :param file_format: str - Explicit format.
+    :return: str - 'json', 'jsonl', or 'csv'; 'json' for new file w/o known extension.
+    """
+    if file_format or os.path.exists(filename):
+        return detect_format(filename, file_format)
+    return EXTENSIONS.get(os.path.splitext(filename)[1].lower(), 'json')
+
+
+def unique_ids(records, seen=None):
+    """
+    Yields records w/ unique task IDs: record repeating ID already seen (e.g. hand-edited file) gets copy w/ new
+    ID, so loading never fails on duplicate ID. Prerequisite references to repeated ID resolve to first record.
+
+    :param records: iterable of dict - Task records.
+    :param seen: set of str - IDs already in use; updated w/ IDs of records as they pass.
+    :return: generator of dict - Records in same order.
+    """
+    seen = set() if seen is None else seen
+    for record in records:
+        if record.get('id') in seen:
+            record = dict(record, id=uuid.uuid4().hex)
+        if 'id' in record:
+            seen.add(record['id'])
+        yield record
+
+
+def normalize_record(record):
+    """
+    Converts record read from any format to Task.to_dict types: int priority, bool is_completed, & list of
+    prerequisite IDs (or descriptions, in older files). Empty ID & property (e.g. blank CSV cells) dropped, so task
+    gets new ID.
+
+    :param record: dict - Raw record.
+    :return: dict - Normalized record.
+    """
+    completed = record.get('is_completed', False)
+    if isinstance(completed, str):
+        completed = completed.strip().lower() in ('true', '1', 'yes')
+    prerequisites = record.get('prerequisites') or []
+    if isinstance(prerequisites, str):
+        prerequisites = [reference for reference in prerequisites.split(';') if reference]
+    normalized = dict(record)
+    normalized['priority'] = int(record.get('priority') or 3)
+    normalized['is_completed'] = bool(completed)
+    normalized['prerequisites'] = prerequisites
+    for key in ('id', 'property'):
+        if key in normalized and not normalized[key]:
+            del normalized[key]
+    return normalized
+
+
+def iter_json_array(filename, chunk_size=65536):
+    """
+    Lazily reads records from JSON array file, decoding one element at time from buffered chunks.
+
+    :param filename: str - File holding JSON array of records.
+    :param chunk_size: int - # of characters read per chunk.
+    :return: generator of dict - Records in file order.
+    :raises ValueError: If file isn't JSON array.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename, 'r') as file:
+        buffer = ''
+        position = 0
+        started = False
+        exhausted = False
+        while True:
+            # Skips whitespace & separators between elements
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position == len(buffer) and not exhausted:
+                chunk = file.read(chunk_size)
+                exhausted = not chunk
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            if not started:
+                if buffer[position:position + 1] != '[':
+                    raise ValueError(f"{filename} isn't JSON array")
+                started = True
+                position += 1
+                continue
+            if buffer[position:position + 1] == ']' or (exhausted and position == len(buffer)):
+                return
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except ValueError:
+                if exhausted:
+                    raise
+                end = None
+            if end is not None and not exhausted:
+                # Number cut at end of buffer (e.g. 12 of 1234) still decodes, so element only complete if
+                # something besides number characters & whitespace follows it in buffer
+                rest = end
+                while rest < len(buffer) and buffer[rest] in NUMBER_TAIL:
+                    rest += 1
+                if rest == len(buffer):
+                    end = None
+            if end is None:
+                chunk = file.read(chunk_size)  # Element continues past buffer
+                exhausted = not chunk
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            yield record
+            position = end
+
+
+def write_json_array(records, filename):
+    """
+    Writes records as indented JSON array like save_tasks, one record at time.
+
+    :param records: iterable of dict - Records to write.
+    :param filename: str - File to write.
+    :return: int - # of records written.
+    """
+    count = 0
+    with open(filename, 'w') as file:
+        file.write('[')
+        for record in records:
+            file.write(',\n    ' if count else '\n    ')
+            file.write(json.dumps(record, indent=4).replace('\n', '\n    '))
+            count += 1
+        file.write('\n]' if count else ']')
+    return count
+
+
+def iter_csv(filename):
+    """
+    Lazily reads records from CSV file w/ header row; prerequisites separated by ';'.
+
+    :param filename: str - CSV file.
+    :return: generator of dict - Normalized records in file order.
+    """
+    with open(filename, 'r', newline='') as file:
+        for row in csv.DictReader(file):
+            yield normalize_record(row)
+
+
+def write_csv(records, filename):
+    """
+    Writes records to CSV file w/ header row.
+
+    :param records: iterable of dict - Records to write.
+    :param filename: str - File to write.
+    :return: int - # of records written.
+    """
+    count = 0
+    with open(filename, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for record in records:
+            row = dict(record)
+            row['prerequisites'] = ';'.join(record.get('prerequisites') or [])
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def iter_records(filename, file_format=None):
+    """
+    Lazily reads normalized task records from task file in any supported format.
+
+    :param filename: str - Task file.
+    :param file_format: str - 'json', 'jsonl', or 'csv'; detected if omitted.
+    :return: generator of dict - Records in file order; nothing if file doesn't exist.
+    """
+    if not os.path.exists(filename):
+        return
+    file_format = detect_format(filename, file_format)
+    if file_format == 'csv':
+        yield from iter_csv(filename)
+        return
+    records = iter_json_array(filename) if file_format == 'json' else iter_json_lines(filename)
+    for record in records:
+        yield normalize_record(record)
+
+
+def write_records(records, filename, file_format=None):
+    """
+    Writes task records to task file in any supported format.
+
+    :param records: iterable of dict - Records to write.
+    :param filename: str - File to write.
+    :param file_format: str - 'json', 'jsonl', or 'csv'; resolved w/ resolve_format if omitted.
+    :return: int - # of records written.
+    """
+    file_format = resolve_format(filename, file_format)
+    if file_format == 'csv':
+        return write_csv(records, filename)
+    if file_format == 'jsonl':
+        return write_json_lines(records, filename)
+    return write_json_array(records, filename)
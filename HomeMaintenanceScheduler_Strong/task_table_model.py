@@ -0,0 +1,182 @@
+"""
+* Name:         task_table_model.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Defines TaskTableModel, Qt table model exposing tasks to QTableView. View asks model only for rows
+*               currently visible, completion checkbox drawn through check state role instead of per-row widget,
+*               & single task edits reported w/ dataChanged for that row instead of rebuilding table.
+* Input:        List of tasks & user edits of completion check state.
+* Output:       Cell data for view & completion_toggled signal when user checks or unchecks task.
+* BigO:         O(1) per cell lookup, per task change, & to append row, O(n) to reset, insert, or remove rows.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+
+
+class TaskTableModel(QAbstractTableModel):
+    """
+    Table model of tasks w/ Priority, Description, Due Date, Category, & checkable Completed columns.
+    """
+    HEADERS = ["Priority", "Description", "Due Date", "Category", "Completed"]
+    PRIORITY_COLUMN = 0
+    COMPLETED_COLUMN = 4
+
+    completion_toggled = Signal(object, bool)  # Task & new completion state requested by user
+    priority_edited = Signal(object, int)  # Task & new priority entered by user
+
+    def __init__(self, tasks=None, parent=None):
+        super().__init__(parent)
+        self.tasks = []
+        self._rows = {}  # Task -> row index
+        if tasks:
+            self.set_tasks(tasks)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.tasks)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Returns display text for first four columns & check state for Completed column.
+        """
+        if not index.isValid():
+            return None
+        task = self.tasks[index.row()]
+        column = index.column()
+        if column == self.COMPLETED_COLUMN:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if task.is_completed else Qt.Unchecked
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return (str(task.priority), task.description, str(task.due_date), task.category)[column]
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == self.COMPLETED_COLUMN:
+            flags |= Qt.ItemIsUserCheckable
+        elif index.isValid() and index.column() == self.PRIORITY_COLUMN:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """
+        Handles user toggling Completed checkbox or entering priority (1-3) by emitting completion_toggled or
+        priority_edited; row refreshed once task updates.
+        """
+        if not index.isValid():
+            return False
+        if index.column() == self.PRIORITY_COLUMN and role == Qt.EditRole:
+            try:
+                priority = int(value)
+            except (TypeError, ValueError):
+                return False
+            if priority not in (1, 2, 3):
+                return False
+            self.priority_edited.emit(self.tasks[index.row()], priority)
+            return True
+        if index.column() != self.COMPLETED_COLUMN or role != Qt.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.Checked
+        self.completion_toggled.emit(self.tasks[index.row()], checked)
+        return True
+
+    def set_tasks(self, tasks):
+        """
+        Replaces all rows w/ given tasks in given order.
+
+        :param tasks: iterable of Task - Tasks to display.
+        """
+        self.beginResetModel()
+        self.tasks = list(tasks)
+        self._rows = {task: row for row, task in enumerate(self.tasks)}
+        self.endResetModel()
+
+    def append_task(self, task):
+        """
+        Adds single task as last row.
+
+        :param task: Task - Task to display.
+        """
+        self.insert_task(task, len(self.tasks))
+
+    def insert_task(self, task, row):
+        """
+        Adds single task at given row, moving later rows down one.
+
+        :param task: Task - Task to display.
+        :param row: int - Row for task, from 0 to # of rows.
+        """
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.tasks.insert(row, task)
+        for index in range(row, len(self.tasks)):
+            self._rows[self.tasks[index]] = index
+        self.endInsertRows()
+
+    def append_tasks(self, tasks):
+        """
+        Adds batch of tasks as last rows w/ single insert notification.
+
+        :param tasks: list of Task - Tasks to display.
+        """
+        if not tasks:
+            return
+        first = len(self.tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+        for row, task in enumerate(tasks, first):
+            self.tasks.append(task)
+            self._rows[task] = row
+        self.endInsertRows()
+
+    def remove_task(self, task):
+        """
+        Removes task's row, if displayed.
+
+        :param task: Task - Task to remove.
+        """
+        row = self._rows.get(task)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.tasks[row]
+        self._rows = {task: index for index, task in enumerate(self.tasks)}
+        self.endRemoveRows()
+
+    def task_at(self, row):
+        """
+        :return: Task - Task displayed in given row.
+        """
+        return self.tasks[row]
+
+    def row_of(self, task):
+        """
+        :return: int or None - Row displaying task, or None if task isn't displayed.
+        """
+        return self._rows.get(task)
+
+    def task_changed(self, task):
+        """
+        Notifies views that single task's row changed so only that row repaints.
+
+        :param task: Task - Task whose attributes changed.
+        """
+        row = self._rows.get(task)
+        if row is not None:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.COMPLETED_COLUMN))
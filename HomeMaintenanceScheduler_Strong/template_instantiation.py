@@ -0,0 +1,129 @@
+"""
+* Name:         template_instantiation.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Bulk instantiation of PreDefinedTasks templates for many properties at once. Templates & their
+*               frequencies compiled once, & due dates computed once per distinct (start date, frequency) pair,
+*               so onboarding N properties streams task records in batches into scheduler or JSON Lines file.
+* Input:        Property names, optional per-property start dates, & batch size.
+* Output:       Task records in Task.to_dict format w/ 'property' key, or Task objects (w/ property_name) in
+*               scheduler.
+* BigO:         O(N * t) for N properties & t templates, w/ O(f) date calculations per distinct start date.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+from datetime import date
+from frequency import parse_frequency, to_date
+from pre_defined_tasks import PreDefinedTasks
+from task import Task
+from task_store import write_json_lines
+
+
+class TemplateInstantiator:
+    """
+    Instantiates every predefined task template for batches of properties, reusing precomputed due dates.
+    """
+    def __init__(self, categories=None, priority=3):
+        """
+        Compiles templates for given categories once.
+
+        :param categories: list of str - Categories to instantiate, defaults all PreDefinedTasks categories.
+        :param priority: int - Priority assigned to instantiated tasks, defaults 3.
+        """
+        if categories is None:
+            categories = list(PreDefinedTasks.TASKS_WITH_FREQUENCIES)
+        self.priority = priority
+        self.templates = [
+            (category, description, frequency, parse_frequency(frequency))
+            for category in categories
+            for description, frequency in PreDefinedTasks.get_tasks_for_category(category)
+        ]
+        self._due_dates = {}  # Start date -> tuple of due dates aligned w/ self.templates
+
+    def due_dates_for(self, start):
+        """
+        Returns due date of every template for given start date, computing each distinct frequency only once.
+
+        :param start: date, datetime, or str - Date templates are scheduled from.
+        :return: tuple of str - Due dates formatted as 'YYYY-MM-DD', aligned w/ templates.
+        """
+        start = to_date(start)
+        due_dates = self._due_dates.get(start)
+        if due_dates is None:
+            by_frequency = {}
+            for _, _, _, frequency in self.templates:
+                if frequency not in by_frequency:
+                    by_frequency[frequency] = frequency.advance(start).strftime('%Y-%m-%d')
+            due_dates = self._due_dates[start] = tuple(by_frequency[template[3]] for template in self.templates)
+        return due_dates
+
+    def iter_records(self, properties, start_dates=None, default_start=None):
+        """
+        Lazily yields one task record per template for each property.
+
+        :param properties: iterable of str - Property names to instantiate templates for.
+        :param start_dates: dict - Optional property name -> start date overrides.
+        :param default_start: date or str - Start date for properties w/o override, defaults today.
+        :return: generator of dict - Task records w/ 'property' key.
+        """
+        start_dates = start_dates or {}
+        default_start = to_date(default_start) if default_start is not None else date.today()
+        for property_name in properties:
+            due_dates = self.due_dates_for(start_dates.get(property_name, default_start))
+            for (category, description, frequency, _), due_date in zip(self.templates, due_dates):
+                yield {
+                    'property': property_name,
+                    'description': description,
+                    'due_date': due_date,
+                    'category': category,
+                    'frequency': frequency,
+                    'priority': self.priority,
+                    'is_completed': False
+                }
+
+    def iter_batches(self, properties, batch_size=1000, start_dates=None, default_start=None):
+        """
+        Groups instantiated task records into lists of at most batch_size records.
+
+        :return: generator of list of dict - Batches of task records.
+        """
+        batch = []
+        for record in self.iter_records(properties, start_dates, default_start):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def load_into_scheduler(self, scheduler, properties, batch_size=1000, start_dates=None, default_start=None):
+        """
+        Instantiates templates as Task objects & adds them to scheduler one batch at a time.
+
+        :param scheduler: Scheduler - Scheduler receiving tasks.
+        :return: list of Task - Tasks added to scheduler.
+        """
+        added = []
+        for batch in self.iter_batches(properties, batch_size, start_dates, default_start):
+            tasks = [Task.from_dict(record) for record in batch]
+            scheduler.schedule_tasks(tasks)
+            added.extend(tasks)
+        return added
+
+    def write_json_lines(self, filename, properties, start_dates=None, default_start=None, append=False):
+        """
+        Streams instantiated task records to JSON Lines file w/o building them all in memory.
+
+        :param filename: str - File to write records to.
+        :return: int - # of records written.
+        """
+        return write_json_lines(self.iter_records(properties, start_dates, default_start), filename, append)
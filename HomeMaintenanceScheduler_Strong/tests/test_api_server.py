@@ -0,0 +1,143 @@
+"""
+* Name:         test_api_server.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests local API serves read & batch write endpoints over one keep-alive connection & answers
+*               conditional requests w/ 304 until scheduler changes.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) over tasks served by tests.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import http.client
+import json
+import unittest
+from api_server import ApiServer, SchedulerApi
+from category_health import CategoryHealth
+from scheduler import Scheduler
+from task import Task
+from user import User
+
+
+class TestApiServer(unittest.TestCase):
+    """
+    Unit tests for SchedulerApi served by ApiServer.
+    """
+
+    def setUp(self):
+        """Starts server on free port over scheduler w/ three tasks & one user."""
+        self.scheduler = Scheduler()
+        self.scheduler.schedule_tasks([Task("Change Filter", "2025-01-10", "HVAC", "monthly", priority=1),
+                                       Task("Test Alarm", "2025-02-10", "Safety Equipment", "monthly", priority=2),
+                                       Task("Clean Gutters", "2025-03-10", "Exterior", "annually", priority=3)])
+        self.category_health = CategoryHealth()
+        self.users = {'Sam': User('Sam', self.scheduler.registry)}
+        self.server = ApiServer(SchedulerApi(self.scheduler, self.users, self.category_health), port=0)
+        self.server.start()
+        self.connection = http.client.HTTPConnection(*self.server.address, timeout=5)
+
+    def tearDown(self):
+        self.connection.close()
+        self.server.stop()
+
+    def request(self, method, path, body=None, headers=None):
+        data = None if body is None else json.dumps(body)
+        self.connection.request(method, path, data, headers or {})
+        response = self.connection.getresponse()
+        content = response.read()
+        return response, json.loads(content) if content else None
+
+    def test_read_endpoints(self):
+        """Test next task, due range, & health endpoints."""
+        _, body = self.request('GET', '/tasks/next')
+        self.assertEqual(body['task']['description'], "Change Filter")
+        _, body = self.request('GET', '/tasks?start=2025-02-01&end=2025-03-31&completed=false')
+        self.assertEqual([task['description'] for task in body['tasks']], ["Test Alarm", "Clean Gutters"])
+        _, body = self.request('GET', '/health')
+        self.assertEqual(body['health']['HVAC'], 0)
+        self.assertEqual(self.category_health.get_health_status('HVAC'), 0)
+        _, body = self.request('GET', '/overdue?today=2025-02-15')
+        self.assertEqual(body['overdue'], {'Exterior': 0, 'HVAC': 1, 'Safety Equipment': 1})
+        response, _ = self.request('GET', '/missing')
+        self.assertEqual(response.status, 404)
+
+    def test_batch_writes_on_one_connection(self):
+        """Test batch add & complete, & user assignment, reuse single keep-alive connection."""
+        records = [{'description': f"Task {number}", 'due_date': "2025-04-01", 'category': "Interior",
+                    'frequency': "monthly", 'priority': 2} for number in range(3)]
+        records[0]['user'] = 'Sam'
+        response, body = self.request('POST', '/tasks', {'tasks': records})
+        self.assertEqual(response.status, 201)
+        self.assertEqual(len(body['tasks']), 3)
+        socket = self.connection.sock
+        _, body = self.request('POST', '/tasks/complete', {'tasks': ["Task 1", "Task 2", "Nope"]})
+        self.assertEqual([task['description'] for task in body['completed']], ["Task 1", "Task 2"])
+        self.assertEqual(body['missing'], ["Nope"])
+        _, body = self.request('GET', '/users/Sam/tasks')
+        self.assertEqual([task['description'] for task in body['tasks']], ["Task 0"])
+        self.assertIs(self.connection.sock, socket)
+        self.assertEqual(len(self.scheduler.tasks), 6)
+
+    def test_task_ids(self):
+        """Test tasks fetched & completed by ID, & duplicate IDs rejected."""
+        task = self.scheduler.get_next_task()
+        _, body = self.request('GET', f'/tasks/{task.task_id}')
+        self.assertEqual(body['task']['id'], task.task_id)
+        _, body = self.request('POST', '/tasks/complete', [task.task_id])
+        self.assertEqual([record['id'] for record in body['completed']], [task.task_id])
+        self.assertTrue(task.is_completed)
+        record = {'id': task.task_id, 'description': "Copy", 'due_date': "2025-04-01", 'category': "Interior",
+                  'frequency': "monthly", 'priority': 2}
+        response, _ = self.request('POST', '/tasks', record)
+        self.assertEqual(response.status, 409)
+        self.assertEqual(len(self.scheduler.tasks), 3)
+        response, _ = self.request('GET', '/tasks/unknown')
+        self.assertEqual(response.status, 404)
+
+    def test_conditional_requests(self):
+        """Test matching If-None-Match answered 304 until scheduler version changes."""
+        response, _ = self.request('GET', '/health')
+        etag = response.getheader('ETag')
+        response, body = self.request('GET', '/health', headers={'If-None-Match': etag})
+        self.assertEqual(response.status, 304)
+        self.assertIsNone(body)
+        self.request('POST', '/tasks/complete', ["Change Filter"])
+        response, body = self.request('GET', '/health', headers={'If-None-Match': etag})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body['health']['HVAC'], 100)
+        self.assertNotEqual(response.getheader('ETag'), etag)
+
+    def test_invalid_requests(self):
+        """Test malformed bodies & unknown users rejected w/ error status."""
+        response, body = self.request('POST', '/tasks', [{'description': "No fields"}])
+        self.assertEqual(response.status, 400)
+        self.assertIn('error', body)
+        response, _ = self.request('GET', '/users/Alex/tasks')
+        self.assertEqual(response.status, 404)
+
+
+    def test_malformed_content_length(self):
+        """Test POST w/ malformed Content-Length answered 400 instead of dropping connection."""
+        for length in ('abc', '-5'):
+            connection = http.client.HTTPConnection(*self.server.address, timeout=5)
+            connection.putrequest('POST', '/tasks')
+            connection.putheader('Content-Length', length)
+            connection.endheaders()
+            response = connection.getresponse()
+            self.assertEqual(response.status, 400, length)
+            self.assertIn('Content-Length', json.loads(response.read())['error'])
+            connection.close()
+        self.assertEqual(len(self.scheduler.tasks), 3)
+
+if __name__ == '__main__':
+    unittest.main()
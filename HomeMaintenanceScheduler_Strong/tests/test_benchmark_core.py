@@ -0,0 +1,63 @@
+"""
+* Name:         test_benchmark_core.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Smoke tests core benchmark suite on tiny task sets & checks baseline comparison flags regressions.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) for tiny n.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from benchmark_core import BENCHMARKS, run, compare, main
+
+
+class TestBenchmarkCore(unittest.TestCase):
+    """
+    Unit tests for benchmark_core.
+    """
+
+    def test_run_reports_every_benchmark(self):
+        """Test each benchmark reports throughput & peak memory."""
+        results = run(sizes=[50], ops=5)
+        self.assertEqual(set(results['50']), set(BENCHMARKS))
+        for result in results['50'].values():
+            self.assertGreater(result['ops'], 0)
+            self.assertGreater(result['peak_kib'], 0)
+
+    def test_compare_flags_regressions(self):
+        """Test slower throughput & higher memory beyond tolerance reported, small changes not."""
+        baseline = {'1000': {'task.save_tasks': {'ops_per_sec': 1000, 'peak_kib': 100}}}
+        within = {'1000': {'task.save_tasks': {'ops_per_sec': 900, 'peak_kib': 110}}}
+        slower = {'1000': {'task.save_tasks': {'ops_per_sec': 500, 'peak_kib': 200}}}
+        self.assertEqual(compare(within, baseline, 0.25), [])
+        self.assertEqual(len(compare(slower, baseline, 0.25)), 2)
+
+    def test_missing_baseline_fails(self):
+        """Test run w/o baseline exits non-zero until baseline recorded."""
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, 'baseline.json')
+            options = ['--sizes', '20', '--ops', '2', '--no-memory', '--benchmarks', 'task.save_tasks',
+                       '--baseline', baseline]
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(main(options), 2)
+                self.assertEqual(main(options + ['--update-baseline']), 0)
+                self.assertEqual(main(options + ['--tolerance', '100']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,7 +20,8 @@
 
 
 import unittest
-from category_health import CategoryHealth
+from category_health import CategoryHealth, compute_health_statuses
+from task import Task
 
 
 class TestCategoryHealth(unittest.TestCase):
@@ -59,6 +60,14 @@ class TestCategoryHealth(unittest.TestCase):
         """Ensure that querying a non-existent category returns None."""
         self.assertIsNone(self.category_health.get_health_status('NonExistent'))
 
+    def test_compute_health_statuses(self):
+        """Ensure statuses computed as percentage completed per category, w/ 0 for requested empty categories."""
+        tasks = [Task("Filters", "2025-01-01", "HVAC", "monthly", is_completed=True),
+                 Task("Thermostat", "2025-01-01", "HVAC", "annually"),
+                 Task("Leaks", "2025-01-01", "Plumbing", "monthly", is_completed=True)]
+        self.assertEqual(compute_health_statuses(tasks), {'HVAC': 50, 'Plumbing': 100})
+        self.assertEqual(compute_health_statuses(tasks, ['HVAC', 'Exterior']), {'HVAC': 50, 'Exterior': 0})
+
     def test_set_negative_health_status(self):
         """Check that setting a negative health status raises a ValueError."""
         with self.assertRaises(ValueError):
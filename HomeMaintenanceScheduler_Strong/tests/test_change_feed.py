@@ -0,0 +1,91 @@
+"""
+* Name:         test_change_feed.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests change feed sequences events across reopens, resumes reads through index, trims torn lines, &
+*               publishes only changed task fields.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) over events written by tests.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import os
+import tempfile
+import unittest
+from change_feed import ChangeFeedReader, ChangeFeedWriter, TaskChangeRecorder, read_index
+from task import Task
+
+
+class TestChangeFeed(unittest.TestCase):
+    """
+    Unit tests for change feed writer, reader, & task change recorder.
+    """
+
+    def setUp(self):
+        """Creates log file path in temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'changes.jsonl')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, count, index_every=4):
+        writer = ChangeFeedWriter(self.path, index_every=index_every)
+        writer.append(('update', f"Task {number}", {'priority': 1}) for number in range(count))
+        writer.close()
+        return writer.last_seq
+
+    def test_resume_after_sequence(self):
+        """Test readers resume after any sequence # in batches, using sparse index."""
+        self.assertEqual(self.write(10), 10)
+        self.assertEqual(self.write(5), 15)  # Reopened writer continues sequence
+        self.assertEqual([seq for seq, _ in read_index(self.path)], [1, 5, 9, 13])
+        reader = ChangeFeedReader(self.path)
+        self.assertEqual([event['seq'] for event in reader.read(after_seq=6, limit=3)], [7, 8, 9])
+        self.assertEqual(reader.read(after_seq=15), [])
+        batches = list(reader.follow(after_seq=2, batch_size=5, idle=lambda: True))
+        self.assertEqual([len(batch) for batch in batches], [5, 5, 3])
+        self.assertEqual(batches[-1][-1]['seq'], 15)
+
+    def test_torn_line_trimmed(self):
+        """Test incomplete last line ignored by readers & trimmed when writer reopens."""
+        self.write(3)
+        with open(self.path, 'ab') as file:
+            file.write(b'{"seq":4,"op"')
+        self.assertEqual(len(ChangeFeedReader(self.path).read()), 3)
+        self.assertEqual(self.write(1), 4)
+        self.assertEqual([event['seq'] for event in ChangeFeedReader(self.path).read()], [1, 2, 3, 4])
+
+    def test_recorder_publishes_changed_fields(self):
+        """Test recorder publishes adds in full, updates as changed fields only, & removals."""
+        writer = ChangeFeedWriter(self.path)
+        recorder = TaskChangeRecorder(writer)
+        loaded = Task("Change Filter", "2025-01-01", "HVAC", "monthly")
+        recorder.track([loaded])
+        added = Task("Test Alarm", "2025-01-01", "Safety Equipment", "monthly")
+        recorder.added([added])
+        loaded.complete_task()
+        recorder.changed([loaded, added])
+        recorder.removed([added])
+        writer.close()
+        events = ChangeFeedReader(self.path).read()
+        self.assertEqual([(event['op'], event['key']) for event in events],
+                         [('add', added.task_id), ('update', loaded.task_id), ('remove', added.task_id)])
+        self.assertEqual(events[0]['fields']['category'], "Safety Equipment")
+        self.assertEqual(events[0]['fields']['description'], "Test Alarm")
+        self.assertEqual(events[1]['fields'], {'due_date': "2025-02-01", 'is_completed': True})
+        self.assertNotIn('fields', events[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+* Name:         test_cli.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests command line batch jobs against temporary task files & checks CLI never imports Qt.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) per command.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from cli import main
+from task_store import iter_records, write_records
+
+
+class TestCli(unittest.TestCase):
+    """
+    Unit tests for cli subcommands.
+    """
+
+    def setUp(self):
+        """Creates temporary task file w/ overdue, upcoming, & completed tasks."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.directory.name, 'tasks.json')
+        write_records([
+            {'description': "Replace air filters", 'due_date': "2025-01-01", 'category': "HVAC",
+             'frequency': "monthly", 'priority': 1, 'is_completed': False},
+            {'description': "Clean gutters", 'due_date': "2025-01-20", 'category': "Exterior",
+             'frequency': "semiannually", 'priority': 2, 'is_completed': False},
+            {'description': "Test detectors", 'due_date': "2025-01-05", 'category': "Electrical",
+             'frequency': "monthly", 'priority': 1, 'is_completed': True},
+        ], self.file)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_cli(self, *args):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            status = main(list(args) + ['-f', self.file, '--today', '2025-01-15'])
+        return status, out.getvalue().splitlines()
+
+    def test_due_and_overdue(self):
+        """Test due lists open tasks in window & overdue lists open tasks past due."""
+        self.assertEqual(self.run_cli('due', '--days', '7')[1], ["2025-01-20\t2\tExterior\tClean gutters"])
+        self.assertEqual(self.run_cli('overdue')[1], ["2025-01-01\t1\tHVAC\tReplace air filters"])
+
+    def test_complete_then_rollover(self):
+        """Test complete marks task done & rollover reopens completed tasks at next due date after today."""
+        status, _ = self.run_cli('complete', "Replace air filters")
+        self.assertEqual(status, 0)
+        self.assertEqual(self.run_cli('complete', "No such task")[0], 1)
+        _, lines = self.run_cli('rollover')
+        self.assertEqual(lines, ["2025-02-01\t1\tHVAC\tReplace air filters",
+                                 "2025-02-05\t1\tElectrical\tTest detectors"])
+        self.assertFalse(any(record['is_completed'] for record in iter_records(self.file)))
+
+    def test_health(self):
+        """Test health reports completion percentage per category."""
+        _, lines = self.run_cli('health')
+        self.assertIn("Electrical\t100.0%\t1/1", lines)
+        self.assertIn("HVAC\t0.0%\t0/1", lines)
+
+    def test_export_and_import(self):
+        """Test export converts format & import appends records."""
+        exported = os.path.join(self.directory.name, 'tasks.csv')
+        self.run_cli('export', exported)
+        self.assertEqual(len(list(iter_records(exported))), 3)
+        self.run_cli('import', exported)
+        self.assertEqual(len(list(iter_records(self.file))), 6)
+
+    def test_import_twice_skips_known_ids(self):
+        """Test importing same tasks twice adds them once, so task file still loads w/ unique IDs."""
+        source = os.path.join(self.directory.name, 'source.jsonl')
+        write_records([{'id': "a1", 'description': "Seal deck", 'due_date': "2025-03-01", 'category': "Exterior",
+                        'frequency': "annually", 'priority': 2, 'is_completed': False, 'prerequisites': []}], source)
+        self.assertEqual(self.run_cli('import', source)[1], [f"Imported 1 tasks into {self.file}"])
+        self.assertEqual(self.run_cli('import', source)[1],
+                         [f"Imported 0 tasks into {self.file}, skipped 1 already there"])
+        ids = [record['id'] for record in iter_records(self.file) if 'id' in record]
+        self.assertEqual(ids, ["a1"])
+
+    def test_does_not_import_qt(self):
+        """Test CLI runs w/o loading Qt, so it starts fast on headless machines."""
+        code = "import sys, cli; cli.main(['health', '-f', sys.argv[1]]); print('PySide6' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code, self.file], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.stdout.splitlines()[-1], 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
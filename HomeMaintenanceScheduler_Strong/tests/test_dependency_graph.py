@@ -0,0 +1,107 @@
+"""
+* Name:         test_dependency_graph.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests incremental topological ordering, cycle detection, & dependency-aware scheduling.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(k log k) per edge insertion for k affected tasks.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from dependency_graph import DependencyGraph
+from scheduler import Scheduler
+from task import Task, link_prerequisites
+
+
+class TestDependencyGraph(unittest.TestCase):
+    """
+    Unit tests for DependencyGraph & Scheduler dependency-aware retrieval.
+    """
+
+    def setUp(self):
+        """Creates plumbing tasks that must happen in order."""
+        self.flush = Task("Drain and flush the water heater", "2025-03-01", "Plumbing", "annually", priority=3)
+        self.inspect = Task("Inspect pipes", "2025-02-01", "Plumbing", "annually", priority=1)
+        self.winterize = Task("Winterize outdoor faucets", "2025-01-01", "Plumbing", "annually", priority=2)
+
+    def test_order_repaired_incrementally(self):
+        """Test edge against current order moves prerequisite ahead of dependent."""
+        graph = DependencyGraph()
+        for task in (self.inspect, self.winterize, self.flush):
+            graph.add_task(task)
+        graph.add_dependency(self.flush, self.inspect)
+        order = graph.topological_order()
+        self.assertLess(order.index(self.flush), order.index(self.inspect))
+
+    def test_cycle_rejected(self):
+        """Test edge closing cycle raises ValueError & leaves graph acyclic."""
+        graph = DependencyGraph()
+        graph.add_dependency(self.flush, self.inspect)
+        graph.add_dependency(self.inspect, self.winterize)
+        with self.assertRaises(ValueError):
+            graph.add_dependency(self.winterize, self.flush)
+        self.assertNotIn(self.flush, graph.get_dependents(self.winterize))
+
+    def test_next_ready_task_respects_prerequisites(self):
+        """Test scheduler only returns tasks whose prerequisites are completed."""
+        scheduler = Scheduler()
+        scheduler.schedule_tasks([self.flush, self.inspect, self.winterize])
+        scheduler.add_dependency(self.flush, self.inspect)
+        self.assertIs(scheduler.get_next_ready_task(), self.winterize)
+        scheduler.task_completed(self.flush)
+        self.assertIs(scheduler.get_next_ready_task(), self.inspect)
+        scheduler.task_reset(self.flush)
+        self.assertIs(scheduler.get_next_ready_task(), self.winterize)
+
+    def test_prerequisites_linked_when_scheduled(self):
+        """Test prerequisites recorded on tasks become graph edges, regardless of scheduling order."""
+        self.inspect.add_prerequisite(self.flush)
+        scheduler = Scheduler()
+        scheduler.schedule_task(self.inspect)
+        scheduler.schedule_task(self.flush)
+        self.assertEqual(scheduler.dependencies.get_prerequisites(self.inspect), {self.flush})
+        self.assertIs(scheduler.get_next_ready_task(), self.flush)
+
+    def test_prerequisites_round_trip(self):
+        """Test prerequisites saved by ID & relinked on load."""
+        self.inspect.add_prerequisite(self.flush)
+        records = [self.flush.to_dict(), self.inspect.to_dict()]
+        tasks = [Task.from_dict(record) for record in records]
+        link_prerequisites(tasks, records)
+        self.assertEqual(tasks[1].prerequisites, [tasks[0]])
+
+    def test_cyclic_prerequisites_dropped(self):
+        """Test cyclic prerequisites (e.g. from task file) dropped when scheduled instead of raising."""
+        self.inspect.add_prerequisite(self.flush)
+        self.winterize.add_prerequisite(self.inspect)
+        self.flush.add_prerequisite(self.winterize)
+        scheduler = Scheduler()
+        with self.assertLogs('scheduler', 'WARNING'):
+            scheduler.schedule_tasks([self.flush, self.inspect, self.winterize])
+        self.assertEqual(len(scheduler.get_tasks_in_dependency_order()), 3)
+        edges = sum(len(task.prerequisites) for task in (self.flush, self.inspect, self.winterize))
+        self.assertEqual(edges, 2)
+
+    def test_removal_unlinks_dependents(self):
+        """Test removed task dropped from its dependents' prerequisites & returned for undo."""
+        self.inspect.add_prerequisite(self.flush)
+        scheduler = Scheduler()
+        scheduler.schedule_tasks([self.flush, self.inspect])
+        self.assertEqual(scheduler.remove_task(self.flush), [self.inspect])
+        self.assertEqual(self.inspect.prerequisites, [])
+        self.assertIs(scheduler.get_next_ready_task(), self.inspect)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+* Name:         test_forecast.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests lazy recurrence expansion & merged occurrence forecasts.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(k log n) for k occurrences over n tasks.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from datetime import date
+from forecast import iter_occurrences, forecast, occurrences_in_month
+from task import Task
+
+
+class TestForecast(unittest.TestCase):
+    """
+    Unit tests for occurrence generators & merged forecasts.
+    """
+
+    def setUp(self):
+        """Creates tasks w/ different frequencies."""
+        self.weekly = Task("Remove standing water", "2024-03-04", "Pest Control", "weekly")
+        self.quarterly = Task("Replace air filters", "2024-01-31", "HVAC", "3 months")
+        self.annual = Task("Inspect the roof", "2024-03-15", "Exterior", "annually")
+
+    def test_occurrences_follow_frequency(self):
+        """Test single task expands at its frequency w/o month-end drift."""
+        occurrences = [day for day, _ in iter_occurrences(self.quarterly, end='2024-12-31')]
+        self.assertEqual(occurrences, [date(2024, 1, 31), date(2024, 4, 30), date(2024, 7, 31), date(2024, 10, 31)])
+
+    def test_start_skips_earlier_occurrences(self):
+        """Test start date skips directly to first occurrence on or after it."""
+        first_day, _ = next(iter_occurrences(self.weekly, start='2025-01-01'))
+        self.assertEqual(first_day, date(2025, 1, 6))
+
+    def test_forecast_merged_in_date_order(self):
+        """Test merged forecast ordered by date & limited lazily."""
+        occurrences = list(forecast([self.annual, self.quarterly, self.weekly], start='2024-03-01', limit=6))
+        days = [day for day, _ in occurrences]
+        self.assertEqual(len(occurrences), 6)
+        self.assertEqual(days, sorted(days))
+        self.assertIs(occurrences[2][1], self.annual)
+
+    def test_occurrences_in_month(self):
+        """Test month query returns only occurrences in that month."""
+        occurrences = occurrences_in_month([self.weekly, self.quarterly, self.annual], 2025, 3)
+        self.assertEqual(len(occurrences), 6)  # 5 Mondays plus roof inspection
+        self.assertTrue(all(day.month == 3 and day.year == 2025 for day, _ in occurrences))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+* Name:         test_frequency.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests frequency parsing, interning, & due date arithmetic used for task rollover.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(1) per frequency parse & date calculation.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from datetime import date
+from frequency import Frequency, parse_frequency, get_rollover_frequency
+from pre_defined_tasks import PreDefinedTasks
+
+
+class TestFrequency(unittest.TestCase):
+    """
+    Unit tests for frequency parsing & Frequency date arithmetic.
+    """
+
+    def test_parse_keywords(self):
+        """Test named frequencies compile to expected count & unit."""
+        self.assertEqual((parse_frequency('weekly').count, parse_frequency('weekly').unit), (1, 'weeks'))
+        self.assertEqual(parse_frequency('annually').unit, 'years')
+
+    def test_parse_counted_frequencies(self):
+        """Test counted & 'every' forms compile to expected count & unit."""
+        frequency = parse_frequency('every 3 months')
+        self.assertEqual((frequency.count, frequency.unit), (3, 'months'))
+        self.assertEqual(parse_frequency('2 Years').count, 2)
+
+    def test_interning(self):
+        """Test equivalent frequency strings share one Frequency object."""
+        self.assertIs(parse_frequency('3 months'), parse_frequency('every 3 months'))
+        self.assertIs(parse_frequency('monthly'), parse_frequency('every month'))
+
+    def test_all_predefined_frequencies_parse(self):
+        """Test every frequency used by predefined tasks is recognized."""
+        for tasks in PreDefinedTasks.TASKS_WITH_FREQUENCIES.values():
+            for _, frequency in tasks:
+                self.assertIsInstance(parse_frequency(frequency), Frequency)
+
+    def test_unrecognized_frequency(self):
+        """Test unrecognized frequencies raise ValueError & roll over annually."""
+        with self.assertRaises(ValueError):
+            parse_frequency('now and then')
+        self.assertIs(get_rollover_frequency('now and then'), parse_frequency('annually'))
+
+    def test_month_end_clamping(self):
+        """Test month steps clamp to end of shorter months w/o drifting."""
+        monthly = parse_frequency('monthly')
+        self.assertEqual(monthly.advance(date(2024, 1, 31)), date(2024, 2, 29))
+        self.assertEqual(monthly.advance(date(2024, 1, 31), steps=2), date(2024, 3, 31))
+
+    def test_next_due_date(self):
+        """Test next due date calculated from 'YYYY-MM-DD' strings."""
+        self.assertEqual(parse_frequency('6 months').next_due_date('2024-09-15'), '2025-03-15')
+        self.assertEqual(parse_frequency('2 years').next_due_date('2024-02-29'), '2026-02-28')
+        self.assertEqual(parse_frequency('weekly').next_due_date('2024-12-30'), '2025-01-06')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,12 +15,20 @@
 *                   modified or unmodified. I have not given other fellow student(s) access to my program.
 """
 
+import os
+import shutil
 import sys
+import tempfile
 import unittest
 import logging
 from PySide6.QtWidgets import QApplication
-from main_gui import MainWindow
-from task import Task
+from PySide6.QtCore import Qt, QDate
+from change_feed import ChangeFeedReader
+from main_gui import MainWindow, CATEGORIES
+from task import Task, save_tasks
+from task_table_model import TaskTableModel
+
+TASKS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tasks.json')
 
 
 class TestMainWindow(unittest.TestCase):
@@ -30,20 +38,27 @@ class TestMainWindow(unittest.TestCase):
         cls.app = QApplication(sys.argv)
 
     def setUp(self):
-        """Initialize MainWindow for each test & ensures clean scheduler."""
-        self.window = MainWindow()
-        self.window.scheduler.tasks.clear()  # Clears tasks for clean slate.
+        """Initialize MainWindow for each test on copy of tasks file & ensures clean scheduler."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.tasks_file = os.path.join(self.directory.name, 'tasks.json')
+        shutil.copy(TASKS_FILE, self.tasks_file)
+        self.window = self.open_window()
+        self.window.scheduler.clear()  # Clears tasks for clean slate.
 
         self.window.load_tasks()  # Reloads predefined tasks.
         self.initial_task_count = len(self.window.scheduler.tasks)  # Stores initial count for use in tests.
 
+    def open_window(self, **options):
+        """Opens MainWindow on test's copy of tasks file that never saves, so tests leave repo's tasks unchanged."""
+        return MainWindow(tasks_file=self.tasks_file, save_on_close=False, **options)
+
     def test_initial_task_loading(self):
         """Test that tasks are loaded into scheduler upon initialization."""
         self.assertGreater(len(self.window.scheduler.tasks), 0, "Scheduler should have tasks loaded on startup.")
 
     def test_task_display(self):
         """Test that tasks are displayed in task table."""
-        self.assertGreater(self.window.dashboard_view.task_table.rowCount(), 0, "Task table should display tasks.")
+        self.assertGreater(self.window.dashboard_view.task_model.rowCount(), 0, "Task table should display tasks.")
 
     def test_add_new_task(self):
         """Test adding new task & verifying in scheduler."""
@@ -54,12 +69,250 @@ class TestMainWindow(unittest.TestCase):
         expected_task_count = self.initial_task_count + 1
         actual_task_count = len(self.window.scheduler.tasks)
         # Check if the new task is displayed correctly
-        displayed_description = self.window.dashboard_view.task_table.item(
-            self.window.dashboard_view.task_table.rowCount() - 1, 1).text()
+        task_model = self.window.dashboard_view.task_model
+        displayed_description = task_model.index(task_model.rowCount() - 1, 1).data()
+
+    def test_checkbox_toggle_updates_single_row(self):
+        """Test checking Completed cell completes task & reports change for that row only."""
+        task_model = self.window.dashboard_view.task_model
+        task = task_model.task_at(0)
+        changed_rows = []
+        task_model.dataChanged.connect(lambda top_left, bottom_right: changed_rows.append(top_left.row()))
+        task_model.setData(task_model.index(0, TaskTableModel.COMPLETED_COLUMN), Qt.Checked, Qt.CheckStateRole)
+        self.window.refresh_coalescer.flush()
+        self.assertTrue(task.is_completed)
+        self.assertEqual(task_model.index(0, TaskTableModel.COMPLETED_COLUMN).data(Qt.CheckStateRole), Qt.Checked)
+        self.assertIn(0, changed_rows)
+
+    def test_add_task_inserts_single_row(self):
+        """Test adding task inserts one row where full refresh would put it, w/o resetting table."""
+        task_model = self.window.dashboard_view.task_model
+        resets, inserts = [], []
+        task_model.modelReset.connect(lambda: resets.append(True))
+        task_model.rowsInserted.connect(lambda parent, first, last: inserts.append((first, last)))
+        connections = self.window.subscriptions.connection_count(consumer='dashboard')
+        task = Task("Inserted Task", "2030-05-15", "HVAC", "annually", priority=2)
+        self.window.handle_new_task(task)
+        self.assertEqual(resets, [])
+        self.assertEqual(inserts, [(task_model.row_of(task), task_model.row_of(task))])
+        self.assertEqual(self.window.subscriptions.connection_count(consumer='dashboard'), connections + 1)
+        priorities = [shown.priority for shown in task_model.tasks]
+        self.assertEqual(priorities, sorted(priorities))
+        self.assertEqual(task_model.row_of(task), priorities.count(1) + priorities.count(2) - 1, "Last of priority")
+
+    def test_refresh_keeps_one_connection_per_task(self):
+        """Test repeated table refreshes don't multiply task_updated connections."""
+        for _ in range(3):
+            self.window.dashboard_view.refresh_task_table(self.window.tasks)
+        self.assertEqual(self.window.subscriptions.connection_count(consumer='dashboard'), len(self.window.tasks))
+
+    def test_bulk_changes_coalesced(self):
+        """Test many task updates in one tick produce one batched health refresh."""
+        refreshes = []
+        self.window.dashboard_view.refresh_health_status = lambda statuses: refreshes.append(dict(statuses))
+        for task in self.window.dashboard_view.task_model.tasks:
+            self.window.mark_task_as_complete(task, True)
+        self.assertEqual(refreshes, [])
+        QApplication.processEvents()
+        self.assertEqual(len(refreshes), 1)
+        self.assertFalse(self.window.refresh_coalescer.pending)
+
+    def test_health_panel_updates_changed_categories_only(self):
+        """Test health widgets persist between refreshes & only changed categories updated."""
+        dashboard = self.window.dashboard_view
+        dashboard.refresh_health_status({'HVAC': 50, 'Plumbing': 0})
+        hvac_label, hvac_bar = dashboard.health_rows['HVAC']
+        plumbing_label, _ = dashboard.health_rows['Plumbing']
+        plumbing_label.setText("untouched")
+        dashboard.refresh_health_status({'HVAC': 75, 'Plumbing': 0})
+        self.assertIs(dashboard.health_rows['HVAC'][0], hvac_label)
+        self.assertEqual(hvac_label.text(), "HVAC: 75%")
+        self.assertEqual(hvac_bar.value(), 75)
+        self.assertEqual(plumbing_label.text(), "untouched")
+
+    def test_async_loading(self):
+        """Test background loading fills table & health values after window created."""
+        window = self.open_window(async_load=True)
+        self.assertFalse(window.loading_complete)
+        while window.load_worker is not None:
+            QApplication.processEvents()
+        QApplication.processEvents()
+        self.assertTrue(window.loading_complete)
+        self.assertGreater(len(window.tasks), 0)
+        self.assertEqual(window.dashboard_view.task_model.rowCount(), len(window.tasks))
+        self.assertEqual(len(window.dashboard_view.health_rows), len(CATEGORIES))
+        window.close()
+
+    def test_partial_load_not_saved(self):
+        """Test saving while background load still running logs warning & leaves tasks file alone."""
+        with open(self.tasks_file) as file:
+            stored = file.read()
+        window = self.open_window(async_load=True)
+        with self.assertLogs('main_gui', 'WARNING'):
+            window.save_state()
+        while window.load_worker is not None:
+            QApplication.processEvents()
+        window.close()
+        with open(self.tasks_file) as file:
+            self.assertEqual(file.read(), stored)
+
+    def test_cyclic_task_file_loads(self):
+        """Test task file w/ cyclic prerequisites loads, dropping same edge, on normal & background paths."""
+        first = Task("Cycle A", "2030-05-15", "HVAC", "annually")
+        second = Task("Cycle B", "2030-05-16", "HVAC", "annually")
+        first.add_prerequisite(second)
+        second.add_prerequisite(first)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tasks.json')
+            save_tasks([first, second], path)
+            links = []
+            for async_load in (False, True):
+                with self.assertLogs('scheduler', 'WARNING'):
+                    window = MainWindow(async_load=async_load, tasks_file=path, save_on_close=False)
+                    while window.load_worker is not None:
+                        QApplication.processEvents()
+                links.append([[prerequisite.description for prerequisite in task.prerequisites]
+                              for task in window.tasks])
+                window.close()
+        self.assertEqual(links[0], links[1])
+        self.assertEqual(sum(len(prerequisites) for prerequisites in links[0]), 1)
+
+    def test_duplicate_id_task_file_loads(self):
+        """Test task file repeating task ID loads every task, on normal & background paths."""
+        first = Task("Original", "2030-05-15", "HVAC", "annually")
+        second = Task("Repeat", "2030-05-16", "HVAC", "annually", task_id=first.task_id)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tasks.json')
+            save_tasks([first, second], path)
+            for async_load in (False, True):
+                window = MainWindow(async_load=async_load, tasks_file=path, save_on_close=False)
+                while window.load_worker is not None:
+                    QApplication.processEvents()
+                self.assertEqual(sorted(task.description for task in window.tasks), ["Original", "Repeat"])
+                self.assertEqual(window.scheduler.get_task(first.task_id).description, "Original")
+                window.close()
+
+    def test_calendar_lists_day_occurrences(self):
+        """Test calendar view lists tasks occurring on selected day."""
+        task = Task("Calendar Task", "2030-05-15", "HVAC", "annually")
+        self.window.handle_new_task(task)
+        calendar_view = self.window.calendar_view
+        calendar_view.calendar.setSelectedDate(QDate(2030, 5, 15))
+        items = [calendar_view.occurrence_list.item(i).text() for i in range(calendar_view.occurrence_list.count())]
+        self.assertTrue(any("Calendar Task" in item for item in items))
+
+    def test_task_view_filters(self):
+        """Test task view search & category filter show matching tasks in scheduler order."""
+        task = Task("Filter Task", "2030-05-15", "Plumbing", "annually", priority=1)
+        self.window.handle_new_task(task)
+        task_view = self.window.task_view
+        task_view.category_selector.setCurrentText("Plumbing")
+        task_view.search_edit.setText("filter task")
+        self.assertIn(task, task_view.task_model.tasks)
+        self.assertTrue(all(shown.category == "Plumbing" and "filter task" in shown.description.lower()
+                            for shown in task_view.task_model.tasks))
+        task_view.category_selector.setCurrentText(task_view.ALL)
+        task_view.search_edit.clear()
+        self.assertEqual(task_view.task_model.tasks, self.window.scheduler.get_all_tasks())
+
+    def test_secondary_views_built_lazily(self):
+        """Test secondary views built on first navigation or when pre-warmed, not at startup."""
+        self.assertEqual(list(self.window._views), ["Dashboard"])
+        self.window.show_view("Calendar")
+        self.assertIs(self.window.stacked_widget.currentWidget(), self.window.calendar_view)
+        window = self.open_window(prewarm_views=True)
+        self.assertEqual(list(window._views), ["Dashboard"])
+        for _ in MainWindow.VIEWS:
+            QApplication.processEvents()
+        self.assertEqual(set(window._views), set(MainWindow.VIEWS))
+        window.close()
+
+    def test_undo_redo_task_edits(self):
+        """Test add, checkbox click, priority change, & remove undone & redone through edit history."""
+        window = self.window
+        task = Task("Undo Task", "2030-05-15", "HVAC", "annually", priority=3)
+        window.handle_new_task(task)
+        window.mark_task_as_complete(task, True)
+        window.change_task_priority(task, 1)
+        self.assertEqual(window.undo_action.text(), "&Undo Change Priority")
+        window.undo()
+        window.undo()
+        self.assertEqual((task.due_date, task.is_completed, task.priority), ("2030-05-15", False, 3))
+        window.redo()
+        self.assertTrue(task.is_completed)
+        self.assertEqual(window.redo_action.text(), "&Redo Change Priority")
+
+        window.remove_tasks([task])
+        self.assertNotIn(task, window.scheduler.tasks)
+        self.assertIsNone(window.dashboard_view.task_model.row_of(task))
+        self.assertFalse(window.redo_action.isEnabled())
+        window.undo()
+        self.assertIn(task, window.scheduler.tasks)
+        self.assertIsNotNone(window.dashboard_view.task_model.row_of(task))
+
+        while window.history.can_undo():
+            window.undo()
+        self.assertNotIn(task, window.tasks)
+        self.assertNotIn(task, window.scheduler.tasks)
+        self.assertFalse(window.undo_action.isEnabled())
+
+    def test_undo_removal_restores_dependents(self):
+        """Test undoing removal of prerequisite blocks its dependent again."""
+        window = self.window
+        before = Task("Undo Prerequisite", "2030-05-15", "HVAC", "annually")
+        after = Task("Undo Dependent", "2030-05-16", "HVAC", "annually")
+        window.handle_new_task(before)
+        window.handle_new_task(after)
+        window.scheduler.add_dependency(before, after)
+        window.remove_tasks([before])
+        self.assertEqual(after.prerequisites, [])
+        self.assertTrue(window.scheduler.dependencies.is_ready(after))
+        window.undo()
+        self.assertEqual(after.prerequisites, [before])
+        self.assertFalse(window.scheduler.dependencies.is_ready(after))
+        window.redo()
+        self.assertTrue(window.scheduler.dependencies.is_ready(after))
+
+    def test_undo_removal_of_chain_middle(self):
+        """Test removing task w/ prerequisite & dependent records undo step that relinks both."""
+        window = self.window
+        first = Task("Chain First", "2030-05-15", "HVAC", "annually")
+        middle = Task("Chain Middle", "2030-05-16", "HVAC", "annually")
+        last = Task("Chain Last", "2030-05-17", "HVAC", "annually")
+        for task in (first, middle, last):
+            window.handle_new_task(task)
+        window.scheduler.add_dependency(first, middle)
+        window.scheduler.add_dependency(middle, last)
+        window.remove_tasks([middle])
+        self.assertNotIn(middle, window.registry)
+        self.assertEqual(last.prerequisites, [])
+        self.assertTrue(window.scheduler.dependencies.is_ready(last))
+        window.undo()
+        self.assertIn(middle, window.registry)
+        self.assertEqual(last.prerequisites, [middle])
+        self.assertEqual(middle.prerequisites, [first])
+        self.assertEqual(list(window.scheduler.dependencies.get_dependents(middle)), [last])
+        self.assertFalse(window.scheduler.dependencies.is_ready(last))
+
+    def test_change_feed_publishes_batches(self):
+        """Test task changes reach change feed once per coalesced batch."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'changes.jsonl')
+            window = self.open_window(change_feed_file=path)
+            task = Task("Feed Task", "2030-05-15", "HVAC", "annually")
+            window.handle_new_task(task)
+            window.mark_task_as_complete(task, True)
+            window.change_task_priority(task, 1)
+            window.refresh_coalescer.flush()
+            window.close()
+            events = ChangeFeedReader(path).read()
+        self.assertEqual([event['op'] for event in events], ['add', 'update'])
+        self.assertEqual(events[1]['fields'], {'priority': 1, 'is_completed': True})
 
     def tearDown(self):
-        """Close main window after test."""
+        """Close main window & remove tasks file copy after test."""
         self.window.close()
+        self.directory.cleanup()
 
     @classmethod
     def tearDownClass(cls):
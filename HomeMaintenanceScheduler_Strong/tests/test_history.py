@@ -0,0 +1,99 @@
+"""
+* Name:         test_history.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests edit history undoes & redoes steps in order, stays bounded, & stores only changed tasks.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) over steps recorded by tests.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from history import EditHistory, TaskEdit, snapshot
+from task import Task
+
+
+class TaskList:
+    """
+    Minimal history target keeping tasks in list.
+    """
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+
+    def restore_task(self, task, state, dependents):
+        if state is None:
+            self.tasks.remove(task)
+            return
+        task.due_date, task.is_completed, task.priority = state
+        if task not in self.tasks:
+            self.tasks.append(task)
+        for dependent in dependents:
+            dependent.add_prerequisite(task)
+
+
+class TestEditHistory(unittest.TestCase):
+    """
+    Unit tests for EditHistory.
+    """
+
+    def setUp(self):
+        """Creates history & target w/ one task."""
+        self.history = EditHistory(limit=3)
+        self.task = Task("Change Filter", "2025-01-01", "HVAC", "monthly")
+        self.target = TaskList([self.task])
+
+    def complete(self):
+        before = snapshot(self.task)
+        self.task.complete_task()
+        self.history.record("Complete Task", [TaskEdit(self.task, before, snapshot(self.task))])
+
+    def test_undo_redo_completion(self):
+        """Test undo restores due date & completion, redo reapplies them."""
+        self.complete()
+        self.assertEqual(self.history.undo(self.target), "Complete Task")
+        self.assertEqual((self.task.due_date, self.task.is_completed), ("2025-01-01", False))
+        self.assertEqual(self.history.redo(self.target), "Complete Task")
+        self.assertEqual((self.task.due_date, self.task.is_completed), ("2025-02-01", True))
+        self.assertIsNone(self.history.redo(self.target))
+
+    def test_undo_add_and_remove(self):
+        """Test undoing add removes task & undoing remove restores it w/ its state."""
+        added = Task("Test Alarm", "2025-01-01", "Safety Equipment", "monthly")
+        self.target.tasks.append(added)
+        self.history.record("Add Task", [TaskEdit(added, None, snapshot(added))])
+        self.target.tasks.remove(self.task)
+        self.history.record("Remove Task", [TaskEdit(self.task, snapshot(self.task), None, [added])])
+        self.history.undo(self.target)
+        self.assertEqual(added.prerequisites, [self.task])
+        self.history.undo(self.target)
+        self.assertEqual(self.target.tasks, [self.task])
+
+    def test_new_step_clears_redo(self):
+        """Test recording step after undo discards redo steps."""
+        self.complete()
+        self.history.undo(self.target)
+        self.complete()
+        self.assertFalse(self.history.can_redo())
+
+    def test_bounded_and_unchanged_edits_skipped(self):
+        """Test history keeps only limit steps & ignores steps that changed nothing."""
+        for _ in range(5):
+            self.complete()
+        self.assertEqual(len(self.history), 3)
+        state = snapshot(self.task)
+        self.assertFalse(self.history.record("Change Priority", [TaskEdit(self.task, state, state)]))
+        self.assertEqual(len(self.history), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+* Name:         test_instrumentation.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests timing spans, counters, percentile summaries, JSON export, & disabled no-op behaviour.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(1) per span & counter.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from instrumentation import Instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Unit tests for Instrumentation.
+    """
+
+    def setUp(self):
+        """Creates enabled instrumentation w/ fixed span durations."""
+        self.instrumentation = Instrumentation(enabled=True)
+        for milliseconds in range(1, 101):
+            self.instrumentation.record('refresh', milliseconds / 1000)
+
+    def test_summary_percentiles(self):
+        """Test summary reports calls & nearest-rank p50/p95/max."""
+        stats = self.instrumentation.summary()['spans']['refresh']
+        self.assertEqual(stats['calls'], 100)
+        self.assertEqual(stats['p50_ms'], 50)
+        self.assertEqual(stats['p95_ms'], 95)
+        self.assertEqual(stats['max_ms'], 100)
+
+    def test_span_timed_and_count(self):
+        """Test span, decorator, & counter record when enabled."""
+        with self.instrumentation.span('block'):
+            pass
+
+        @self.instrumentation.timed('call')
+        def add(a, b):
+            return a + b
+
+        self.assertEqual(add(2, 3), 5)
+        self.instrumentation.count('changes', 3)
+        summary = self.instrumentation.summary()
+        self.assertEqual(summary['spans']['block']['calls'], 1)
+        self.assertEqual(summary['spans']['call']['calls'], 1)
+        self.assertEqual(summary['counters'], {'changes': 3})
+
+    def test_disabled_records_nothing(self):
+        """Test disabled instrumentation returns shared no-op span & ignores counters."""
+        disabled = Instrumentation()
+        self.assertIs(disabled.span('a'), disabled.span('b'))
+        with disabled.span('a'):
+            pass
+        disabled.count('changes')
+        self.assertEqual(disabled.summary(), {'spans': {}, 'counters': {}})
+
+    def test_sample_limit_keeps_call_count(self):
+        """Test bounded samples still count every call."""
+        limited = Instrumentation(enabled=True, sample_limit=10)
+        for _ in range(50):
+            limited.record('save', 0.001)
+        self.assertEqual(limited.summary()['spans']['save']['calls'], 50)
+        self.assertEqual(len(limited._samples['save']), 10)
+
+    def test_export_json(self):
+        """Test summary exported to JSON file."""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = self.instrumentation.export_json(os.path.join(directory, 'timings.json'))
+            with open(filename) as file:
+                self.assertEqual(json.load(file)['spans']['refresh']['calls'], 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
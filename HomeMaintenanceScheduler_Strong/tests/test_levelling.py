@@ -0,0 +1,112 @@
+"""
+* Name:         test_levelling.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests capacity-aware workload levelling & scheduler levelling mode.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n log n) for levelling n tasks.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from datetime import date
+from levelling import WorkloadLeveller
+from scheduler import Scheduler
+from task import Task
+
+
+class TestWorkloadLeveller(unittest.TestCase):
+    """
+    Unit tests for WorkloadLeveller placement, capacity, & incremental updates.
+    """
+
+    def setUp(self):
+        """Creates 10 annual tasks due same day, five weeks after start."""
+        self.tasks = [Task(f"Task {i}", "2025-02-05", "Exterior", "annually", priority=3) for i in range(10)]
+        self.leveller = WorkloadLeveller(capacity=3, period_days=7, start='2025-01-01')
+
+    def test_capacity_respected(self):
+        """Test tasks spread backward from due period w/o exceeding capacity."""
+        plan = self.leveller.level(self.tasks)
+        self.assertEqual(len(plan), 10)
+        self.assertTrue(all(load <= 3 for load in self.leveller.loads.values()))
+        self.assertTrue(all(day <= date(2025, 2, 5) for day in plan.values()))
+        self.assertEqual(self.leveller.loads, {5: 3, 4: 3, 3: 3, 2: 1})
+
+    def test_priority_gets_preferred_period(self):
+        """Test higher priority tasks placed closest to their due date first."""
+        urgent = Task("Urgent", "2025-02-05", "Exterior", "annually", priority=1)
+        self.leveller.level(self.tasks + [urgent])
+        self.assertEqual(self.leveller.planned_date(urgent), self.leveller.period_start(5))
+
+    def test_overflow_when_no_room(self):
+        """Test tasks that can't fit before latest date flagged as overflow."""
+        tasks = [Task(f"Task {i}", "2025-01-03", "HVAC", "monthly") for i in range(5)]
+        self.leveller.level(tasks)
+        self.assertEqual(len(self.leveller.overflow), 2)
+
+    def test_hours_capacity(self):
+        """Test weighted capacity skips periods w/o enough remaining hours."""
+        hours = {task: 2 for task in self.tasks[:3]}
+        leveller = WorkloadLeveller(capacity=3, start='2025-01-01', weight=lambda t: hours.get(t, 1))
+        leveller.level(self.tasks[:4])
+        self.assertTrue(all(load <= 3 for load in leveller.loads.values()))
+
+    def test_incremental_update_reopens_period(self):
+        """Test completing task frees its capacity for later updates."""
+        self.leveller.level(self.tasks)
+        freed = self.tasks[0]
+        period = self.leveller.assignments[freed][0]
+        freed.is_completed = True
+        self.leveller.update_task(freed)
+        self.assertNotIn(freed, self.leveller.assignments)
+        late = Task("Late", "2025-02-05", "Exterior", "annually")
+        self.leveller.update_task(late)
+        self.assertEqual(self.leveller.assignments[late][0], period)
+
+    def test_freed_capacity_goes_to_overflow(self):
+        """Test overflowed task moved into period freed by completion."""
+        leveller = WorkloadLeveller(capacity=1, period_days=7, start='2025-01-01')
+        first, second = (Task(name, "2025-01-03", "HVAC", "monthly") for name in ("A", "B"))
+        leveller.level([first, second])
+        self.assertEqual(leveller.overflow, {second})
+        first.is_completed = True
+        leveller.update_task(first)
+        self.assertEqual(leveller.overflow, set())
+        self.assertEqual(leveller.loads, {0: 1})
+        self.assertEqual(leveller.assignments[second][0], 0)
+
+    def test_reopened_period_found_after_path_compression(self):
+        """Test period freed behind compressed union-find path chosen for next task."""
+        self.leveller.level(self.tasks)
+        freed = next(task for task, (period, _) in self.leveller.assignments.items() if period == 4)
+        self.leveller.remove_task(freed)
+        late = Task("Late", "2025-02-05", "Exterior", "annually")
+        self.leveller.update_task(late)
+        self.assertEqual(self.leveller.assignments[late][0], 4)
+
+    def test_scheduler_levelling_mode(self):
+        """Test scheduler keeps levelled plan in sync as tasks added & completed."""
+        scheduler = Scheduler()
+        scheduler.schedule_tasks(self.tasks)
+        scheduler.enable_levelling(capacity=3, start='2025-01-01')
+        next_task = scheduler.get_next_task()
+        self.assertEqual(scheduler.leveller.assignments[next_task][0], 2)
+        scheduler.task_completed(next_task)
+        self.assertEqual(len(scheduler.get_levelled_tasks()), 9)
+        scheduler.disable_levelling()
+        self.assertEqual(scheduler.get_levelled_tasks(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
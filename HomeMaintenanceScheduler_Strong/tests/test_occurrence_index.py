@@ -0,0 +1,75 @@
+"""
+* Name:         test_occurrence_index.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests date-bucketed occurrence index, month grid caching, & targeted invalidation.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(1) per cached month lookup.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from datetime import date
+from occurrence_index import OccurrenceIndex
+from task import Task
+
+
+class TestOccurrenceIndex(unittest.TestCase):
+    """
+    Unit tests for OccurrenceIndex.
+    """
+
+    def setUp(self):
+        """Creates index starting Jan 2025 w/ monthly & annual tasks."""
+        self.monthly = Task("Test detectors", "2025-01-10", "Electrical", "monthly")
+        self.annual = Task("Inspect roof", "2025-03-20", "Exterior", "annually")
+        self.index = OccurrenceIndex(start='2025-01-01', horizon_days=365)
+        self.index.add_tasks([self.monthly, self.annual])
+
+    def test_tasks_on_day(self):
+        """Test day buckets hold tasks occurring that day."""
+        self.assertEqual(self.index.tasks_on('2025-03-10'), [self.monthly])
+        self.assertEqual(self.index.tasks_on('2025-03-20'), [self.annual])
+        self.assertEqual(self.index.tasks_on('2025-03-11'), [])
+
+    def test_month_grid_cached(self):
+        """Test month grid spans 6 Monday-first weeks & is reused on revisit."""
+        grid = self.index.month_grid(2025, 3)
+        self.assertEqual(len(grid), 6)
+        self.assertEqual(grid[0][0][0], date(2025, 2, 24))
+        self.assertIs(self.index.month_grid(2025, 3), grid)
+
+    def test_update_invalidates_touched_months_only(self):
+        """Test task change drops only month grids it appeared in."""
+        march = self.index.month_grid(2025, 3)
+        july = self.index.month_grid(2025, 7)
+        self.annual.due_date = "2025-04-15"
+        self.index.update_task(self.annual)
+        self.assertIsNot(self.index.month_grid(2025, 3), march)
+        self.assertIs(self.index.month_grid(2025, 7), july)
+        self.assertEqual(self.index.tasks_on('2025-04-15'), [self.annual])
+
+    def test_index_extends_past_horizon(self):
+        """Test days beyond initial horizon indexed on demand."""
+        self.assertEqual(self.index.tasks_on('2027-03-20'), [self.annual])
+        self.assertIn(self.monthly, self.index.tasks_on('2027-06-10'))
+
+    def test_week(self):
+        """Test week lists 7 days starting Monday."""
+        week = self.index.week('2025-03-20')
+        self.assertEqual(week[0][0], date(2025, 3, 17))
+        self.assertEqual(week[3][1], [self.annual])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+* Name:         test_portfolio_report.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests portfolio rollup merges per-file aggregates from worker processes & reports unreadable files.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) over records of test files.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from portfolio_report import run_report, summarize_file
+from task_store import write_records
+
+
+def record(category, due_date, is_completed):
+    return {'description': "Task", 'due_date': due_date, 'category': category, 'frequency': "monthly",
+            'priority': 3, 'is_completed': is_completed}
+
+
+class TestPortfolioReport(unittest.TestCase):
+    """
+    Unit tests for portfolio_report.
+    """
+
+    def setUp(self):
+        """Creates five property files, in JSON & CSV, w/ one completed & one overdue HVAC task each."""
+        self.directory = tempfile.TemporaryDirectory()
+        for index in range(5):
+            extension = '.csv' if index % 2 else '.json'
+            write_records([record("HVAC", "2025-01-01", True), record("HVAC", "2025-01-01", False),
+                           record("Plumbing", "2025-12-01", False)],
+                          os.path.join(self.directory.name, f"property_{index}{extension}"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_summarize_file(self):
+        """Test single file summarized into completed, total, & overdue counts per category."""
+        summary = summarize_file(os.path.join(self.directory.name, 'property_0.json'), date(2025, 6, 1))
+        self.assertEqual(summary['categories'], {'HVAC': [1, 2, 1], 'Plumbing': [0, 1, 0]})
+        self.assertIsNone(summary['error'])
+
+    def test_run_report_merges_chunks(self):
+        """Test chunks from several workers merged into portfolio totals w/ bounded in-flight chunks."""
+        seen = []
+        report = run_report([self.directory.name], workers=2, chunk_size=2, max_in_flight=1, today='2025-06-01',
+                            on_file=seen.append)
+        self.assertEqual(report['files'], 5)
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(report['tasks'], 15)
+        self.assertEqual(report['overdue'], 5)
+        self.assertEqual(report['categories']['HVAC'], {'health': 50.0, 'completed': 5, 'total': 10, 'overdue': 5})
+
+    def test_unreadable_file_reported(self):
+        """Test file that can't be parsed listed in errors instead of failing report."""
+        broken = os.path.join(self.directory.name, 'broken.json')
+        with open(broken, 'w') as file:
+            file.write('[{"description": ')
+        report = run_report([broken], workers=1, today='2025-06-01')
+        self.assertIn(broken, report['errors'])
+
+
+if __name__ == '__main__':
+    unittest.main()
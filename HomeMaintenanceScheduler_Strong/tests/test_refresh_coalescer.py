@@ -0,0 +1,68 @@
+"""
+* Name:         test_refresh_coalescer.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests RefreshCoalescer batching of dirty tasks & categories.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(k) per flush for k dirty items.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import sys
+import unittest
+from PySide6.QtCore import QCoreApplication
+from refresh_coalescer import RefreshCoalescer
+from task import Task
+
+
+class TestRefreshCoalescer(unittest.TestCase):
+    """
+    Unit tests for RefreshCoalescer.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """Ensures Qt application exists for timers."""
+        cls.app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+    def setUp(self):
+        """Creates coalescer recording flushed change sets."""
+        self.coalescer = RefreshCoalescer()
+        self.batches = []
+        self.coalescer.flushed.connect(self.batches.append)
+
+    def test_changes_batched_until_event_loop_tick(self):
+        """Test many dirty marks flushed once, w/ each task reported once."""
+        task1 = Task("Task 1", "2025-01-01", "HVAC", "monthly")
+        task2 = Task("Task 2", "2025-01-01", "Plumbing", "monthly")
+        for task in (task1, task2, task1):
+            self.coalescer.mark_task_dirty(task)
+        self.assertEqual(self.batches, [])
+        QCoreApplication.processEvents()
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(self.batches[0].tasks, [task1, task2])
+        self.assertEqual(self.batches[0].categories, {'HVAC', 'Plumbing'})
+
+    def test_flush_without_changes(self):
+        """Test flushing w/ nothing pending emits nothing."""
+        self.coalescer.flush()
+        self.assertEqual(self.batches, [])
+
+    def test_category_only_change(self):
+        """Test category marked dirty w/o task flushed w/ empty task list."""
+        self.coalescer.mark_category_dirty('HVAC')
+        self.coalescer.flush()
+        self.assertEqual((self.batches[0].tasks, self.batches[0].categories), ([], {'HVAC'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+* Name:         test_reminders.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests reminder service sends reminders on time, moves them when tasks complete, & runs async
+*               callbacks from its event loop, using fake clock.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) over reminders scheduled by tests.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from reminders import ReminderService
+from task import Task
+from task_store import write_records
+
+
+class FakeClock:
+    """
+    Clock returning settable timestamp.
+    """
+    def __init__(self, moment):
+        self.now = moment.timestamp()
+
+    def __call__(self):
+        return self.now
+
+    def set(self, moment):
+        self.now = moment.timestamp()
+
+
+class TestReminderService(unittest.TestCase):
+    """
+    Unit tests for ReminderService.
+    """
+
+    def setUp(self):
+        """Creates service at 2025-01-01 08:00 recording reminders sent."""
+        self.clock = FakeClock(datetime(2025, 1, 1, 8, 0))
+        self.sent = []
+        self.service = ReminderService([self.sent.append], clock=self.clock)
+
+    def test_sends_at_reminder_time(self):
+        """Test reminder sent at 9:00 on due date, not before, & only once."""
+        task = Task("Change Filter", "2025-01-03", "HVAC", "monthly")
+        self.service.add_task(task)
+        self.clock.set(datetime(2025, 1, 3, 8, 59))
+        self.assertEqual(self.service.dispatch_due(), [])
+        self.clock.set(datetime(2025, 1, 3, 9, 0))
+        self.assertEqual([reminder.task for reminder in self.service.dispatch_due()], [task])
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(self.service.dispatch_due(), [])
+
+    def test_lead_time(self):
+        """Test lead time sends reminder that much before due date."""
+        service = ReminderService([self.sent.append], lead_time=timedelta(days=1), clock=self.clock)
+        service.add_task(Task("Test Alarm", "2025-01-03", "Safety Equipment", "monthly"))
+        self.clock.set(datetime(2025, 1, 2, 9, 0))
+        self.assertEqual(len(service.dispatch_due()), 1)
+
+    def test_complete_task_moves_reminder(self):
+        """Test completing task moves its reminder to advanced due date."""
+        task = Task("Change Filter", "2025-01-03", "HVAC", "monthly")
+        self.service.add_task(task)
+        task.complete_task()
+        self.assertEqual(len(self.service), 1)
+        self.clock.set(datetime(2025, 1, 3, 9, 0))
+        self.assertEqual(self.service.dispatch_due(), [])
+        self.clock.set(datetime(2025, 2, 3, 9, 0))
+        self.service.dispatch_due()
+        self.assertEqual(self.sent[0].due_date.isoformat(), "2025-02-03")
+
+    def test_remove_task(self):
+        """Test removed task's reminder cancelled & its changes no longer followed."""
+        task = Task("Change Filter", "2025-01-03", "HVAC", "monthly")
+        self.service.add_task(task)
+        self.service.remove_task(task)
+        task.complete_task()
+        self.assertEqual(len(self.service), 0)
+
+    def test_run_awaits_async_callbacks(self):
+        """Test run loop sends due reminders through async callbacks & stops."""
+        received = []
+
+        async def notify(reminder):
+            received.append(reminder.task.description)
+            service.stop()
+
+        service = ReminderService([notify], clock=self.clock)
+        service.add_tasks([Task("Clean Gutters", "2024-12-31", "Exterior", "annually")])
+        asyncio.run(asyncio.wait_for(service.run(), 5))
+        self.assertEqual(received, ["Clean Gutters"])
+
+
+    def test_daemon_does_not_import_qt(self):
+        """Test standalone daemon reads task file & schedules reminders w/o loading Qt."""
+        code = ("import sys, reminders; service = reminders.ReminderService(); "
+                "service.add_tasks(reminders.load_records(sys.argv[1])); print(len(service), 'PySide6' in sys.modules)")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tasks.json')
+            write_records([{'description': "Change Filter", 'due_date': "2030-01-03", 'category': "HVAC",
+                            'frequency': "monthly", 'priority': 2, 'is_completed': False}], path)
+            result = subprocess.run([sys.executable, '-c', code, path], capture_output=True, text=True,
+                                    cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.stdout.splitlines()[-1], '1 False')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+* Name:         test_reports.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests memoized reports recompute only after relevant versions change, per category, & that cache
+*               stays bounded.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) over tasks created by tests.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from unittest import mock
+import reports
+from reports import ScheduleReports, VersionedCache
+from scheduler import Scheduler
+from task import Task
+
+
+class TestScheduleReports(unittest.TestCase):
+    """
+    Unit tests for ScheduleReports & VersionedCache.
+    """
+
+    def setUp(self):
+        """Creates scheduler w/ tasks in two categories."""
+        self.scheduler = Scheduler()
+        self.hvac = Task("Change Filter", "2025-01-10", "HVAC", "monthly", priority=2)
+        self.plumbing = Task("Flush Heater", "2025-01-20", "Plumbing", "annually", priority=1)
+        self.scheduler.schedule_tasks([self.hvac, self.plumbing])
+        self.reports = ScheduleReports(self.scheduler, ["HVAC", "Plumbing"])
+
+    def test_health_recomputed_for_changed_category_only(self):
+        """Test cached health reused until category changes, then only that category recomputed."""
+        self.assertEqual(self.reports.health_statuses(), {"HVAC": 0, "Plumbing": 0})
+        with mock.patch.object(reports, 'compute_health_statuses', wraps=reports.compute_health_statuses) as compute:
+            self.reports.health_statuses()
+            self.assertEqual(compute.call_count, 0)
+            self.scheduler.task_completed(self.hvac)
+            self.assertEqual(self.reports.health_statuses(), {"HVAC": 100, "Plumbing": 0})
+            self.assertEqual(compute.call_args[0][1], ["HVAC"])
+
+    def test_per_category_reports_skip_sort(self):
+        """Test health & overdue counts read tasks w/o sorting scheduler's list."""
+        with mock.patch.object(Scheduler, 'get_all_tasks') as get_all_tasks:
+            self.reports.health_statuses()
+            self.reports.overdue_counts("2025-02-01")
+        get_all_tasks.assert_not_called()
+        self.assertIsNone(self.scheduler._sorted_stamp)
+
+    def test_changes_outside_scheduler_need_touch(self):
+        """Test change made directly on task picked up once scheduler touched."""
+        self.assertEqual(self.reports.overdue_counts("2025-02-01"), {"HVAC": 1, "Plumbing": 1})
+        self.plumbing.complete_task()
+        self.assertEqual(self.reports.overdue_counts("2025-02-01")["Plumbing"], 1)
+        self.scheduler.touch(self.plumbing)
+        self.assertEqual(self.reports.overdue_counts("2025-02-01"), {"HVAC": 1, "Plumbing": 0})
+
+    def test_sorted_tasks_reused_until_version_changes(self):
+        """Test sorted list object reused until scheduler changes."""
+        first = self.reports.sorted_tasks()
+        self.assertIs(self.reports.sorted_tasks(), first)
+        self.assertEqual(first, [self.plumbing, self.hvac])
+        self.scheduler.remove_task(self.plumbing)
+        self.assertEqual(self.reports.sorted_tasks(), [self.hvac])
+
+    def test_cache_bounded_lru(self):
+        """Test least recently used entry evicted once cache full."""
+        cache = VersionedCache(maxsize=2)
+        cache.get('a', 1, lambda: 'A')
+        cache.get('b', 1, lambda: 'B')
+        cache.get('a', 1, lambda: 'stale')
+        cache.get('c', 1, lambda: 'C')
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('a', 1, lambda: 'recomputed'), 'A')
+        self.assertEqual(cache.get('b', 1, lambda: 'recomputed'), 'recomputed')
+        self.assertEqual(cache.get('a', 2, lambda: 'new version'), 'new version')
+
+
+if __name__ == '__main__':
+    unittest.main()
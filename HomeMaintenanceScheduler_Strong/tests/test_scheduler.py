@@ -88,6 +88,43 @@ class TestScheduler(unittest.TestCase):
         self.scheduler.task_completed(self.task1)
         self.assertTrue(self.task1.is_completed, "Task should be marked as completed")
 
+    def test_duplicate_id_rejects_whole_batch(self):
+        """
+        Test batch w/ ID already scheduled, or repeated within batch, rejected before any task added.
+        """
+        self.scheduler.schedule_task(self.task1)
+        copy = Task("Copy", self.task1.due_date, "Category A", "monthly", task_id=self.task1.task_id)
+        twin = Task("Twin", self.task2.due_date, "Category B", "monthly", task_id=self.task2.task_id)
+        for batch in ([self.task2, copy], [self.task2, self.task3, twin]):
+            with self.assertRaises(ValueError):
+                self.scheduler.schedule_tasks(batch)
+            self.assertEqual(self.scheduler.get_all_tasks(), [self.task1], "Rejected batch leaves scheduler alone")
+        self.scheduler.schedule_tasks([self.task1, self.task2, self.task2])
+        self.assertEqual(self.scheduler.get_all_tasks(), [self.task2, self.task1])
+
+    def test_remove_middle_of_chain(self):
+        """
+        Test removing task w/ both prerequisite & dependent returns dependent & unlinks it.
+        """
+        self.task2.add_prerequisite(self.task1)
+        self.task3.add_prerequisite(self.task2)
+        self.scheduler.schedule_tasks([self.task1, self.task2, self.task3])
+        self.assertEqual(self.scheduler.remove_task(self.task2), [self.task3])
+        self.assertEqual(self.task3.prerequisites, [])
+        self.assertEqual(self.task2.prerequisites, [self.task1], "Removed task keeps own links for undo")
+
+    def test_version_counts_changes(self):
+        """
+        Test version increases on every change & stays put on reads.
+        """
+        self.scheduler.schedule_task(self.task1)
+        version = self.scheduler.version
+        self.scheduler.get_next_task()
+        self.assertEqual(self.scheduler.version, version)
+        self.scheduler.task_completed(self.task1)
+        self.scheduler.remove_task(self.task1)
+        self.assertEqual(self.scheduler.version, version + 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,77 @@
+"""
+* Name:         test_subscriptions.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests SubscriptionManager de-duplication, removal, & connection counts.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(1) per subscription operation.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from subscriptions import SubscriptionManager
+from task import Task
+
+
+class TestSubscriptionManager(unittest.TestCase):
+    """
+    Unit tests for SubscriptionManager.
+    """
+
+    def setUp(self):
+        """Creates manager, tasks, & slot counting task updates."""
+        self.manager = SubscriptionManager()
+        self.task1 = Task("Task 1", "2025-01-01", "HVAC", "monthly")
+        self.task2 = Task("Task 2", "2025-01-01", "HVAC", "monthly")
+        self.calls = []
+        self.slot = lambda: self.calls.append(1)
+
+    def test_duplicate_subscription_ignored(self):
+        """Test repeated subscriptions keep one connection & one slot call per emission."""
+        self.assertTrue(self.manager.subscribe(self.task1, 'dashboard', self.slot))
+        for _ in range(5):
+            self.assertFalse(self.manager.subscribe(self.task1, 'dashboard', self.slot))
+        self.task1.task_updated.emit()
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.manager.connection_count(self.task1), 1)
+
+    def test_unsubscribe_task(self):
+        """Test removing task disconnects every consumer."""
+        self.manager.subscribe(self.task1, 'dashboard', self.slot)
+        self.manager.subscribe(self.task1, 'scheduler', self.slot)
+        self.manager.unsubscribe_task(self.task1)
+        self.task1.task_updated.emit()
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.manager.connection_count(), 0)
+
+    def test_sync(self):
+        """Test sync connects new tasks & disconnects tasks no longer present."""
+        self.manager.sync('dashboard', [self.task1], self.slot)
+        self.manager.sync('dashboard', [self.task2], self.slot)
+        self.task1.task_updated.emit()
+        self.task2.task_updated.emit()
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.manager.connection_count(consumer='dashboard'), 1)
+
+    def test_priority_signal(self):
+        """Test subscriptions to other signals counted separately."""
+        self.manager.subscribe(self.task1, 'dashboard', self.slot)
+        self.manager.subscribe(self.task1, 'dashboard', lambda priority: self.calls.append(priority),
+                               signal_name='priority_changed')
+        self.task1.set_priority(1)
+        self.assertEqual(sorted(self.calls), [1, 1])
+        self.assertEqual(self.manager.connection_count(self.task1, 'dashboard'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+* Name:         test_synthetic_data.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests synthetic dataset generator is reproducible, shardable, roughly follows configured rates, &
+*               streams to every task file format.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) over generated records.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from synthetic_data import SyntheticDataGenerator
+from task_store import iter_records
+
+
+class TestSyntheticDataGenerator(unittest.TestCase):
+    """
+    Unit tests for SyntheticDataGenerator.
+    """
+
+    def test_reproducible_and_shardable(self):
+        """Test same seed gives same records & users generated separately match full run."""
+        full = list(SyntheticDataGenerator(seed=7).iter_records(users=6))
+        self.assertEqual(list(SyntheticDataGenerator(seed=7).iter_records(users=6)), full)
+        shards = list(SyntheticDataGenerator(seed=7).iter_records(users=3)) \
+            + list(SyntheticDataGenerator(seed=7).iter_records(users=3, first_user=3))
+        self.assertEqual(shards, full)
+        self.assertNotEqual(list(SyntheticDataGenerator(seed=8).iter_records(users=6)), full)
+
+    def test_distributions(self):
+        """Test overdue share & priority weighting roughly follow parameters."""
+        generator = SyntheticDataGenerator(overdue_ratio=0.2, max_history=0)
+        records = list(generator.iter_records(users=300))
+        overdue = sum(1 for record in records
+                      if not record['is_completed'] and date.fromisoformat(record['due_date']) < generator.today)
+        self.assertAlmostEqual(overdue / len(records), 0.2, delta=0.05)
+        safety = [record['priority'] for record in records if record['category'] == 'Safety Equipment']
+        self.assertGreater(safety.count(1), safety.count(3))
+
+    def test_history_occurrences_precede_current(self):
+        """Test each template's history occurrences come before its current occurrence."""
+        records = list(SyntheticDataGenerator(max_history=2).iter_records(users=1))
+        by_template = {}
+        for record in records:
+            by_template.setdefault(record['description'], []).append(record['due_date'])
+        self.assertTrue(all(due_dates == sorted(due_dates) for due_dates in by_template.values()))
+        self.assertGreater(len(records), len(by_template))
+
+    def test_write_each_format(self):
+        """Test limit respected & records readable back from each format."""
+        generator = SyntheticDataGenerator(seed=3)
+        expected = [record['description'] for record in generator.iter_records(limit=50)]
+        with tempfile.TemporaryDirectory() as directory:
+            for extension in ('json', 'jsonl', 'csv'):
+                filename = os.path.join(directory, f"tasks.{extension}")
+                self.assertEqual(generator.write(filename, limit=50), 50)
+                self.assertEqual([record['description'] for record in iter_records(filename)], expected)
+        with self.assertRaises(ValueError):
+            generator.write(os.path.join(directory, "tasks.json"))
+
+
+if __name__ == '__main__':
+    unittest.main()
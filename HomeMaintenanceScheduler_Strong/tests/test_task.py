@@ -19,11 +19,13 @@
 *                   modified or unmodified. I have not given other fellow student(s) access to my program.
 """
 
+import os
 import sys
+import tempfile
 import unittest
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QDate
-from task import Task, AddTaskDialog
+from task import Task, AddTaskDialog, load_tasks, save_tasks
 
 app = None
 
@@ -51,6 +53,38 @@ class TestTask(unittest.TestCase):
         """
         self.task.complete_task()
         self.assertTrue(self.task.is_completed)
+        self.assertEqual(self.task.due_date, "2025-12-31")
+
+    def test_complete_task_multi_month_frequency(self):
+        """
+        Tests completing task w/ counted frequency rolls over by that frequency instead of annually.
+        """
+        task = Task("Replace air filters", "2024-07-28", "HVAC", "3 months")
+        task.complete_task()
+        self.assertEqual(task.due_date, "2024-10-28")
+
+    def test_task_id_persisted(self):
+        """
+        Tests task ID & prerequisite links survive saving & loading, even w/ duplicate descriptions.
+        """
+        twin = Task("Test Description", "2025-06-30", "HVAC", "annually")
+        twin.add_prerequisite(self.task)
+        self.assertNotEqual(twin.task_id, self.task.task_id)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'tasks.json')
+            save_tasks([twin, self.task], filename)
+            loaded_twin, loaded_task = load_tasks(filename)
+        self.assertEqual([loaded_twin.task_id, loaded_task.task_id], [twin.task_id, self.task.task_id])
+        self.assertEqual(loaded_twin.prerequisites, [loaded_task])
+
+    def test_from_dict_without_id(self):
+        """
+        Tests records from older files get new ID.
+        """
+        data = self.task.to_dict()
+        del data['id']
+        self.assertTrue(Task.from_dict(data).task_id)
+        self.assertNotEqual(Task.from_dict(data).task_id, self.task.task_id)
 
 
 class TestAddTaskDialog(unittest.TestCase):
@@ -0,0 +1,82 @@
+"""
+* Name:         test_task_filter.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests task filter criteria, narrowing checks, & incremental refinement of previous results.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) per full scan.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from scheduler import Scheduler
+from task import Task
+from task_filter import TaskFilter, IncrementalTaskFilter
+
+
+class TestTaskFilter(unittest.TestCase):
+    """
+    Unit tests for TaskFilter & IncrementalTaskFilter.
+    """
+
+    def setUp(self):
+        """Creates scheduler w/ tasks across categories & priorities."""
+        self.scheduler = Scheduler()
+        self.filters = Task("Replace air filters", "2025-02-01", "HVAC", "monthly", priority=1)
+        self.thermostat = Task("Check thermostat", "2025-01-15", "HVAC", "annually", priority=2)
+        self.leaks = Task("Check for leaks", "2025-01-10", "Plumbing", "monthly", priority=1)
+        self.gutters = Task("Clean gutters", "2025-03-01", "Exterior", "semiannually", priority=3)
+        self.scheduler.schedule_tasks([self.gutters, self.thermostat, self.leaks, self.filters])
+        self.incremental = IncrementalTaskFilter(self.scheduler.get_all_tasks)
+
+    def test_matches_criteria(self):
+        """Test each criterion restricts matches."""
+        self.assertTrue(TaskFilter(categories=['HVAC'], text='AIR').matches(self.filters))
+        self.assertFalse(TaskFilter(categories=['Plumbing']).matches(self.filters))
+        self.assertFalse(TaskFilter(priorities=[2]).matches(self.filters))
+        self.assertFalse(TaskFilter(completed=True).matches(self.filters))
+
+    def test_narrows(self):
+        """Test longer text & smaller category sets narrow filter, while changed category doesn't."""
+        self.assertTrue(TaskFilter(text='check t').narrows(TaskFilter(text='check')))
+        self.assertTrue(TaskFilter(categories=['HVAC']).narrows(TaskFilter()))
+        self.assertFalse(TaskFilter(categories=['Plumbing']).narrows(TaskFilter(categories=['HVAC'])))
+        self.assertFalse(TaskFilter(text='check').narrows(TaskFilter(text='check t')))
+
+    def test_results_keep_scheduler_order(self):
+        """Test results follow scheduler's priority & due date order."""
+        result = self.incremental.apply(TaskFilter(text='check'))
+        self.assertEqual(result, [self.leaks, self.thermostat])
+        self.assertEqual(self.incremental.apply(TaskFilter()), self.scheduler.get_all_tasks())
+
+    def test_narrowed_filter_refines_previous_result(self):
+        """Test typing more search text refines previous result w/o rescanning scheduler."""
+        self.incremental.apply(TaskFilter(text='c'))
+        self.incremental.apply(TaskFilter(text='ch'))
+        result = self.incremental.apply(TaskFilter(text='check t'))
+        self.assertEqual(result, [self.thermostat])
+        self.assertEqual(self.incremental.full_scans, 1)
+
+    def test_widened_filter_rescans(self):
+        """Test widening filter or invalidating after change rescans scheduler."""
+        self.incremental.apply(TaskFilter(categories=['HVAC']))
+        self.incremental.apply(TaskFilter())
+        self.assertEqual(self.incremental.full_scans, 2)
+        self.scheduler.task_completed(self.gutters)
+        self.incremental.invalidate()
+        self.assertEqual(self.incremental.apply(TaskFilter(completed=True)), [self.gutters])
+        self.assertEqual(self.incremental.full_scans, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
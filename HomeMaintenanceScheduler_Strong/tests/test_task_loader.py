@@ -0,0 +1,84 @@
+"""
+* Name:         test_task_loader.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests TaskLoadWorker chunked background loading & cancellation.
+* Input:        Temporary task files.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n log n) per load of n records.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from PySide6.QtCore import QCoreApplication, QThreadPool
+from task_loader import TaskLoadWorker
+
+
+class TestTaskLoadWorker(unittest.TestCase):
+    """
+    Unit tests for TaskLoadWorker.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """Ensures Qt application exists for queued signal delivery."""
+        cls.app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+    def setUp(self):
+        """Writes task file w/ 25 records in reverse priority order."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'tasks.json')
+        records = [{'description': f"Task {i}", 'due_date': '2025-01-01', 'category': 'HVAC',
+                    'frequency': 'monthly', 'priority': 3 - i % 3, 'is_completed': False} for i in range(25)]
+        with open(self.filename, 'w') as file:
+            json.dump(records, file)
+        self.chunks = []
+        self.finished = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_worker(self, worker):
+        """Runs worker on thread pool & processes events until it reports finished."""
+        worker.signals.chunk_loaded.connect(self.chunks.append)
+        worker.signals.finished.connect(self.finished.append)
+        worker.signals.failed.connect(self.finished.append)
+        QThreadPool.globalInstance().start(worker)
+        QThreadPool.globalInstance().waitForDone()
+        QCoreApplication.processEvents()
+
+    def test_chunks_delivered_in_order(self):
+        """Test records delivered in chunks ordered by priority."""
+        self.run_worker(TaskLoadWorker(self.filename, chunk_size=10))
+        self.assertEqual([len(chunk) for chunk in self.chunks], [10, 10, 5])
+        priorities = [record['priority'] for chunk in self.chunks for record in chunk]
+        self.assertEqual(priorities, sorted(priorities))
+        self.assertEqual(self.finished, [True])
+
+    def test_cancel(self):
+        """Test cancelled worker stops before delivering chunks."""
+        worker = TaskLoadWorker(self.filename, chunk_size=10)
+        worker.cancel()
+        self.run_worker(worker)
+        self.assertEqual((self.chunks, self.finished), ([], [False]))
+
+    def test_missing_file(self):
+        """Test missing file finishes w/o chunks."""
+        self.run_worker(TaskLoadWorker(os.path.join(self.directory.name, 'missing.json')))
+        self.assertEqual((self.chunks, self.finished), ([], [True]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+* Name:         test_task_registry.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests TaskRegistry lookup, membership, & removal by task ID, & registry shared by Scheduler & User.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) for n tasks registered.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import unittest
+from scheduler import Scheduler
+from task import Task
+from task_registry import TaskRegistry
+from user import User
+
+
+class TestTaskRegistry(unittest.TestCase):
+    """
+    Unit tests for TaskRegistry.
+    """
+    def setUp(self):
+        self.task1 = Task("Change Filter", "2025-01-10", "HVAC", "monthly", priority=2)
+        self.task2 = Task("Test Alarm", "2025-02-10", "Safety Equipment", "monthly", priority=1)
+        self.registry = TaskRegistry([self.task1, self.task2])
+
+    def test_lookup_by_id(self):
+        """Test tasks found by ID & kept in order registered."""
+        self.assertIs(self.registry.get(self.task2.task_id), self.task2)
+        self.assertIsNone(self.registry.get("missing"))
+        self.assertIn(self.task1, self.registry)
+        self.assertIn(self.task1.task_id, self.registry)
+        self.assertEqual(self.registry.tasks(), [self.task1, self.task2])
+
+    def test_add_is_idempotent(self):
+        """Test registering same task twice keeps one entry, but other task w/ same ID rejected."""
+        self.assertFalse(self.registry.add(self.task1))
+        self.assertEqual(len(self.registry), 2)
+        copy = Task("Copy", "2025-01-10", "HVAC", "monthly", task_id=self.task1.task_id)
+        self.assertNotIn(copy, self.registry)
+        with self.assertRaises(ValueError):
+            self.registry.add(copy)
+
+    def test_remove(self):
+        """Test removal by task, version bump, & error for unregistered task."""
+        version = self.registry.version
+        self.registry.remove(self.task1)
+        self.assertNotIn(self.task1, self.registry)
+        self.assertGreater(self.registry.version, version)
+        with self.assertRaises(KeyError):
+            self.registry.remove(self.task1)
+        self.assertFalse(self.registry.discard(self.task1))
+
+    def test_shared_by_scheduler_and_user(self):
+        """Test user's tasks resolved through scheduler's registry, so removal from scheduler reaches user."""
+        scheduler = Scheduler()
+        user = User("Sam", scheduler.registry)
+        scheduler.schedule_tasks([self.task1, self.task2])
+        user.add_task(self.task1)
+        self.assertEqual(len(scheduler.registry), 2)
+        self.assertIs(user.get_task(self.task1.task_id), self.task1)
+        self.assertEqual(scheduler.get_all_tasks(), [self.task2, self.task1])
+        scheduler.remove_task(self.task1)
+        self.assertEqual(user.get_task_list(), [])
+        self.assertNotIn(self.task1, scheduler)
+        scheduler.schedule_task(self.task1)  # e.g. undo of removal
+        self.assertEqual(user.get_task_list(), [self.task1])
+
+
+if __name__ == '__main__':
+    unittest.main()
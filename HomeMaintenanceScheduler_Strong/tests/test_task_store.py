@@ -0,0 +1,92 @@
+"""
+* Name:         test_task_store.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests task file format detection & streaming round trips through JSON, JSON Lines, & CSV.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) per round trip.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from task_store import detect_format, iter_json_array, iter_records, unique_ids, write_records
+
+
+class TestTaskStore(unittest.TestCase):
+    """
+    Unit tests for task_store formats.
+    """
+
+    def setUp(self):
+        """Creates temporary directory & sample records."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.records = [
+            {'description': "Replace air filters", 'due_date': "2025-01-01", 'category': "HVAC",
+             'frequency': "monthly", 'priority': 1, 'is_completed': False, 'prerequisites': []},
+            {'description': "Check furnace", 'due_date': "2025-02-01", 'category': "HVAC",
+             'frequency': "annually", 'priority': 2, 'is_completed': True, 'prerequisites': ["Replace air filters"]},
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_round_trip_each_format(self):
+        """Test records read back unchanged from each format."""
+        for name in ('tasks.json', 'tasks.jsonl', 'tasks.csv'):
+            self.assertEqual(write_records(self.records, self.path(name)), 2)
+            self.assertEqual(list(iter_records(self.path(name))), self.records, name)
+
+    def test_json_array_matches_save_tasks_layout(self):
+        """Test JSON array output is plain JSON & streams back in small chunks."""
+        write_records(self.records, self.path('tasks.json'))
+        with open(self.path('tasks.json')) as file:
+            self.assertEqual(json.load(file), self.records)
+        self.assertEqual(list(iter_json_array(self.path('tasks.json'), chunk_size=5)), self.records)
+
+    def test_json_array_numbers_split_across_chunks(self):
+        """Test multi-digit numbers cut by chunk boundary read whole."""
+        with open(self.path('numbers.json'), 'w') as file:
+            file.write('[1234567, 89, -1.5e3]')
+        for chunk_size in (1, 2, 3, 4, 7):
+            self.assertEqual(list(iter_json_array(self.path('numbers.json'), chunk_size)), [1234567, 89, -1500.0],
+                             chunk_size)
+
+    def test_detect_format_by_content(self):
+        """Test format detected from first character when extension unknown."""
+        write_records(self.records, self.path('tasks.data'), 'jsonl')
+        self.assertEqual(detect_format(self.path('tasks.data')), 'jsonl')
+        with self.assertRaises(ValueError):
+            detect_format(self.path('tasks.data'), 'xml')
+
+    def test_unique_ids(self):
+        """Test repeated ID replaced in later record only, & records w/o ID left alone."""
+        records = [{'id': "a"}, {'id': "b"}, {'id': "a"}, {'description': "No ID"}]
+        unique = list(unique_ids(records))
+        self.assertEqual(unique[:2], records[:2])
+        self.assertNotIn(unique[2]['id'], ("a", "b"))
+        self.assertEqual(unique[3], records[3])
+        self.assertEqual(records[2], {'id': "a"}, "Original record unchanged")
+
+    def test_missing_file_yields_nothing(self):
+        """Test reading missing task file yields no records."""
+        self.assertEqual(list(iter_records(self.path('missing.json'))), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+* Name:         test_template_instantiation.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests bulk instantiation of predefined task templates for many properties.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(N * t) for N properties & t templates.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from pre_defined_tasks import PreDefinedTasks
+from scheduler import Scheduler
+from task import load_tasks, save_tasks
+from task_store import iter_json_lines
+from template_instantiation import TemplateInstantiator
+
+
+class TestTemplateInstantiator(unittest.TestCase):
+    """
+    Unit tests for TemplateInstantiator record streaming, batching, & loading.
+    """
+
+    def setUp(self):
+        """Creates instantiator for all predefined categories."""
+        self.instantiator = TemplateInstantiator()
+        self.template_count = sum(len(tasks) for tasks in PreDefinedTasks.TASKS_WITH_FREQUENCIES.values())
+
+    def test_record_count(self):
+        """Test one record produced per template per property."""
+        records = list(self.instantiator.iter_records(['A', 'B', 'C'], default_start='2024-01-15'))
+        self.assertEqual(len(records), 3 * self.template_count)
+        self.assertEqual({record['property'] for record in records}, {'A', 'B', 'C'})
+
+    def test_per_property_start_dates(self):
+        """Test per-property start dates override default start."""
+        records = self.instantiator.iter_records(['A', 'B'], start_dates={'B': date(2025, 3, 1)},
+                                                 default_start='2024-01-15')
+        due_dates = {(r['property'], r['description']): r['due_date'] for r in records}
+        self.assertEqual(due_dates[('A', 'Replace air filters')], '2024-04-15')
+        self.assertEqual(due_dates[('B', 'Replace air filters')], '2025-06-01')
+        self.assertEqual(due_dates[('B', 'Caulk around showers and tubs')], '2028-03-01')
+
+    def test_due_dates_cached_per_start(self):
+        """Test due dates reused for repeated start dates."""
+        first = self.instantiator.due_dates_for('2024-01-15')
+        self.assertIs(first, self.instantiator.due_dates_for(date(2024, 1, 15)))
+
+    def test_batches(self):
+        """Test batches never exceed batch size & cover every record."""
+        batches = list(self.instantiator.iter_batches(['A', 'B'], batch_size=7))
+        self.assertTrue(all(len(batch) <= 7 for batch in batches))
+        self.assertEqual(sum(len(batch) for batch in batches), 2 * self.template_count)
+
+    def test_load_into_scheduler(self):
+        """Test instantiated tasks are added to scheduler in sorted order."""
+        scheduler = Scheduler()
+        tasks = self.instantiator.load_into_scheduler(scheduler, ['A', 'B'], batch_size=10)
+        self.assertEqual(len(scheduler.get_all_tasks()), len(tasks))
+        due_dates = [task.due_date for task in scheduler.get_all_tasks()]
+        self.assertEqual(due_dates, sorted(due_dates))
+
+    def test_property_survives_round_trip(self):
+        """Test each task keeps its property through saving & loading."""
+        tasks = self.instantiator.load_into_scheduler(Scheduler(), ['A', 'B'])
+        self.assertEqual({task.property_name for task in tasks}, {'A', 'B'})
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'tasks.json')
+            save_tasks(tasks, filename)
+            loaded = load_tasks(filename)
+        self.assertEqual([task.property_name for task in loaded], [task.property_name for task in tasks])
+
+    def test_write_json_lines(self):
+        """Test records streamed to JSON Lines file can be read back."""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'tasks.jsonl')
+            written = self.instantiator.write_json_lines(filename, ['A'])
+            self.assertEqual(written, self.template_count)
+            self.assertEqual(len(list(iter_json_lines(filename))), self.template_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
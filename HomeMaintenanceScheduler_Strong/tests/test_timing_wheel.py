@@ -0,0 +1,68 @@
+"""
+* Name:         test_timing_wheel.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Tests timing wheel fires timers at their ticks across levels & overflow, & honours cancellation.
+* Input:        None directly.
+* Output:       Success or failure messages based on test results.
+* BigO:         O(n) over timers scheduled by tests.
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+import random
+import unittest
+from timing_wheel import TimingWheel
+
+
+class TestTimingWheel(unittest.TestCase):
+    """
+    Unit tests for TimingWheel.
+    """
+
+    def test_fires_each_timer_at_its_tick(self):
+        """Test timers across every level & overflow fire exactly at their deadline ticks."""
+        generator = random.Random(0)
+        wheel = TimingWheel(current_tick=12345, levels=2)
+        deadlines = [12345 + generator.choice((1, 63, 64, 65, 4095, 4096, 5000, 300000, 2 ** 20))
+                     + generator.randrange(50) for _ in range(300)]
+        for deadline in deadlines:
+            wheel.schedule(deadline, deadline)
+        fired = []
+        while len(wheel):
+            tick = wheel.next_event_tick()
+            for timer in wheel.advance(tick):
+                self.assertEqual(timer.item, tick)
+                fired.append(timer.item)
+        self.assertEqual(fired, sorted(deadlines))
+
+    def test_cancel(self):
+        """Test cancelled timer never fires & second cancel reports nothing to do."""
+        wheel = TimingWheel()
+        kept = wheel.schedule(100, 'kept')
+        cancelled = wheel.schedule(100, 'cancelled')
+        self.assertTrue(wheel.cancel(cancelled))
+        self.assertFalse(wheel.cancel(cancelled))
+        self.assertEqual([timer.item for timer in wheel.advance(1000)], ['kept'])
+        self.assertFalse(kept.active)
+        self.assertEqual(len(wheel), 0)
+
+    def test_past_deadline_fires_on_next_advance(self):
+        """Test timer scheduled at or before current tick fires on next advance."""
+        wheel = TimingWheel(current_tick=50)
+        wheel.schedule(10, 'late')
+        self.assertEqual(wheel.next_event_tick(), 50)
+        self.assertEqual([timer.item for timer in wheel.advance(50)], ['late'])
+        self.assertIsNone(wheel.next_event_tick())
+
+
+if __name__ == '__main__':
+    unittest.main()
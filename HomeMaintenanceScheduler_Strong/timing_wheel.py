@@ -0,0 +1,197 @@
+"""
+* Name:         timing_wheel.py
+* Author:       David Strong
+* Created:      19 Oct 2026
+* Course:       CIS 152 - Data Structure
+* Version:      1.0
+*
+* OS:           macOS Monterey Version 12.7.2
+* IDE:          PyCharm CE
+* Language:     Python
+*
+* Description:  Defines TimingWheel, hierarchical timing wheel of timers keyed by integer tick. Each level has 64
+*               slots, level L slot spanning 64^L ticks; timer placed in level of highest 6-bit group in which its
+*               deadline differs from current tick, & cascaded to lower levels as clock reaches its group. Timers
+*               beyond top level kept in overflow & re-placed when top level wraps.
+* Input:        Timers w/ deadline ticks, cancellations, & clock advances.
+* Output:       Expired timers in deadline order of their ticks.
+* BigO:         O(1) schedule & cancel, O(1) amortized per tick advanced & per timer cascaded (at most once per level).
+*
+* Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
+*                   modified or unmodified. I have not given other fellow student(s) access to my program.
+"""
+
+BITS = 6
+SLOTS = 1 << BITS
+MASK = SLOTS - 1
+
+
+class Timer:
+    """
+    Handle for scheduled item; slot refers to dict currently holding timer, or None once fired or cancelled, &
+    level to wheel level holding it (-1 expired, levels for overflow).
+    """
+    __slots__ = ('deadline', 'item', 'slot', 'level')
+
+    def __init__(self, deadline, item):
+        self.deadline = deadline
+        self.item = item
+        self.slot = None
+        self.level = None
+
+    @property
+    def active(self):
+        """
+        :return: bool - True while timer waiting to fire.
+        """
+        return self.slot is not None
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel; slots are dicts used as ordered sets of timers, so cancel is single pop.
+    """
+    def __init__(self, current_tick=0, levels=4):
+        """
+        :param current_tick: int - Tick wheel starts at.
+        :param levels: int - # of levels; timers within 64^levels ticks avoid overflow list.
+        """
+        self.current_tick = current_tick
+        self.levels = levels
+        self._wheels = [[{} for _ in range(SLOTS)] for _ in range(levels)]
+        self._overflow = {}
+        self._expired = {}  # Timers scheduled at or before current tick, fired on next advance
+        self._count = 0
+        self._level_counts = [0] * (levels + 1)  # Timers per level, overflow last; lets advance skip empty ticks
+
+    def __len__(self):
+        return self._count
+
+    def schedule(self, deadline, item):
+        """
+        Schedules item to expire at deadline tick.
+
+        :param deadline: int - Tick item expires at.
+        :param item: object - Value returned when timer expires.
+        :return: Timer - Handle for cancel.
+        """
+        timer = Timer(deadline, item)
+        self._place(timer)
+        self._count += 1
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancels timer; does nothing if already fired or cancelled.
+
+        :param timer: Timer - Handle from schedule.
+        :return: bool - True if timer was waiting.
+        """
+        if timer.slot is None:
+            return False
+        del timer.slot[timer]
+        timer.slot = None
+        self._count -= 1
+        if timer.level >= 0:
+            self._level_counts[timer.level] -= 1
+        return True
+
+    def advance(self, tick):
+        """
+        Moves clock forward to tick, cascading & expiring timers along way.
+
+        :param tick: int - New current tick; earlier ticks ignored.
+        :return: list of Timer - Expired timers, earlier ticks first.
+        """
+        expired = self._take(self._expired)
+        while self.current_tick < tick:
+            if not self._count:
+                self.current_tick = tick  # Nothing waiting, so no need to walk empty ticks
+                break
+            lowest = next(level for level, count in enumerate(self._level_counts) if count)
+            if lowest:
+                # Levels below lowest empty, so nothing can happen before its next cascade boundary
+                boundary = ((self.current_tick >> (BITS * lowest)) + 1) << (BITS * lowest)
+                if boundary > tick:
+                    self.current_tick = tick
+                    break
+                self.current_tick = boundary - 1
+            self.current_tick += 1
+            self._cascade()
+            expired.extend(self._take(self._wheels[0][self.current_tick & MASK], 0))
+            expired.extend(self._take(self._expired))  # Cascaded timers due this very tick
+        return expired
+
+    def next_event_tick(self):
+        """
+        Returns tick by which clock should next be advanced: next occupied level 0 slot in current 64-tick
+        block, else next boundary at which lowest occupied level cascades.
+
+        :return: int or None - Tick, current tick if timers already expired, or None if wheel empty.
+        """
+        if self._expired:
+            return self.current_tick
+        if not self._count:
+            return None
+        lowest = next(level for level, count in enumerate(self._level_counts) if count)
+        if lowest:
+            return ((self.current_tick >> (BITS * lowest)) + 1) << (BITS * lowest)
+        slots = self._wheels[0]
+        for tick in range(self.current_tick + 1, (self.current_tick | MASK) + 1):
+            if slots[tick & MASK]:
+                return tick
+        return (self.current_tick | MASK) + 1
+
+    def _place(self, timer):
+        """
+        Puts timer in expired set, level slot, or overflow according to deadline relative to current tick.
+        """
+        deadline = timer.deadline
+        if deadline <= self.current_tick:
+            level = -1
+            slot = self._expired
+        else:
+            level = min(((deadline ^ self.current_tick).bit_length() - 1) // BITS, self.levels)
+            slot = self._wheels[level][(deadline >> (BITS * level)) & MASK] if level < self.levels else self._overflow
+            self._level_counts[level] += 1
+        slot[timer] = None
+        timer.slot = slot
+        timer.level = level
+
+    def _cascade(self):
+        """
+        Re-places timers of higher level slots whose group current tick just entered, highest level first so
+        timers can fall through several levels in one tick.
+        """
+        tick = self.current_tick
+        if tick & MASK:
+            return
+        if not tick & ((1 << (BITS * self.levels)) - 1):
+            self._replace(self._overflow, self.levels)
+        for level in range(self.levels - 1, 0, -1):
+            if not tick & ((1 << (BITS * level)) - 1):
+                self._replace(self._wheels[level][(tick >> (BITS * level)) & MASK], level)
+
+    def _replace(self, slot, level):
+        if not slot:
+            return
+        timers = list(slot)
+        slot.clear()
+        self._level_counts[level] -= len(timers)
+        for timer in timers:
+            self._place(timer)
+
+    def _take(self, slot, level=-1):
+        """
+        Removes & returns every timer in slot as fired.
+        """
+        if not slot:
+            return []
+        timers = list(slot)
+        slot.clear()
+        for timer in timers:
+            timer.slot = None
+        self._count -= len(timers)
+        if level >= 0:
+            self._level_counts[level] -= len(timers)
+        return timers
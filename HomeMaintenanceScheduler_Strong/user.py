@@ -6,53 +6,88 @@
 * Version:      1.0
 *
 * Description:  Represents user of Home Maintenance Scheduler application. Handles task management including
-*               adding, removing, & querying tasks associated w/ user.
+*               adding, removing, & querying tasks associated w/ user. User keeps only task IDs & resolves them
+*               through TaskRegistry, normally one shared w/ scheduler, so task removed there leaves user's list too.
 * Input:        User info including name & tasks to manage.
 * Output:       User object capable of managing collection of tasks.
-* BigO:         O(n) for operations that involve searching through list of tasks.
+* BigO:         O(1) to add, find by ID, or remove task; O(n) for listing tasks & searching by description.
 *
 * Academic Honesty: I attest that this is my original work. I have not used unauthorized source code, either
 *                   modified or unmodified. I have not given other fellow student(s) access to my program.
 """
 
+from task_registry import TaskRegistry
+
 
 class User:
     """
     Represents user w/ name & a collection of tasks, providing methods to manage tasks.
     """
-    def __init__(self, name):
+    def __init__(self, name, registry=None):
         """
-        Initializes new User object w/ name & an empty list of tasks.
+        Initializes new User object w/ name & no tasks.
 
         :param name: str - Name of user.
+        :param registry: TaskRegistry - Registry user's tasks looked up in, normally scheduler's; defaults private
+                                        registry owned by user.
         """
         self.name = name
-        self.tasks = []
+        self._owns_registry = registry is None
+        self.registry = TaskRegistry() if registry is None else registry
+        self._task_ids = {}  # Task ID -> None, in order added
+
+    @property
+    def tasks(self):
+        return self.get_task_list()
+
+    def __contains__(self, task):
+        """
+        :param task: Task or str - Task or task ID.
+        """
+        task_id = task if isinstance(task, str) else task.task_id
+        return task_id in self._task_ids and task in self.registry
 
     def add_task(self, task):
         """
-        Adds task to user's list of tasks.
+        Adds task to user's tasks, registering it if registry doesn't have it yet.
 
-        :param task: Task - Task object to be added to user's tasks.
+        :param task: Task - Task object to be added to user's tasks; adding it again does nothing.
+        :raises ValueError: If different task already registered w/ same ID.
         """
-        self.tasks.append(task)
+        self.registry.add(task)
+        self._task_ids[task.task_id] = None
 
     def remove_task(self, task):
         """
-        Removes specified task from user's task list.
+        Removes specified task from user's tasks; shared registry keeps it.
 
         :param task: Task - Task object to be removed from user's tasks.
         """
-        if task in self.tasks:
-            self.tasks.remove(task)
+        if task in self:
+            del self._task_ids[task.task_id]
+            if self._owns_registry:
+                self.registry.remove(task)
+
+    def get_task(self, task_id):
+        """
+        :param task_id: str - Task ID.
+        :return: Task or None - User's task w/ ID, or None if user has none.
+        """
+        return self.registry.get(task_id) if task_id in self._task_ids else None
 
     def get_task_list(self):
         """
-        Returns list of all tasks associated w/ user.
+        Returns list of all tasks associated w/ user, in order added. Tasks no longer in registry (e.g. removed
+        from scheduler) skipped.
 
         :return: list of Task - List of tasks associated w/ user.
         """
-        return self.tasks
+        tasks = []
+        for task_id in self._task_ids:
+            task = self.registry.get(task_id)
+            if task is not None:
+                tasks.append(task)
+        return tasks
 
     def find_task_by_description(self, description):
         """
@@ -61,7 +96,7 @@ class User:
         :param description: str - Description of task to find.
         :return: Task or None - Task w/ matching description, or None if no match found.
         """
-        for task in self.tasks:
+        for task in self.get_task_list():
             if task.description == description:
                 return task
         return None